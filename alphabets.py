@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Per-language alphabets and word lists for QWords
+
+Each language defines its alphabet as an ordered list of uppercase
+letters. Input is normalized once: Unicode NFC (so a decomposed "N" plus
+combining tilde becomes "Ñ"), then matched letter by letter against the
+alphabet, with lowercase forms mapped explicitly rather than through
+str.upper() (which would turn "ß" into "SS"). Words become tuples of
+small letter values packed into ints, and scoring and feedback tables
+work on those codes exactly as they do for English.
+"""
+
+import functools
+import unicodedata
+
+from app import GuessResult
+from encoding import WORD_LENGTH, WordArray, code_pattern, pack_values
+from scoring import pattern_to_feedback
+
+
+class Alphabet:
+    """An ordered set of letters with a compact integer encoding"""
+
+    def __init__(self, letters):
+        self.letters = tuple(unicodedata.normalize("NFC", letter) for letter in letters)
+        # Value 0 is reserved so that an all-zero code is never a word
+        self.bits = max(1, len(self.letters).bit_length())
+        self._values = {}
+        for value, letter in enumerate(self.letters, 1):
+            self._values[letter] = value
+            self._values[unicodedata.normalize("NFC", letter.lower())] = value
+        self._sizes = sorted({len(piece) for piece in self._values}, reverse=True)
+
+    def tokenize(self, text):
+        """Return the letter values of text, or raise ValueError"""
+        text = unicodedata.normalize("NFC", text)
+        values = []
+        i = 0
+        while i < len(text):
+            for size in self._sizes:
+                value = self._values.get(text[i:i + size])
+                if value is not None:
+                    values.append(value)
+                    i += size
+                    break
+            else:
+                raise ValueError("{!r} is not in the alphabet".format(text[i]))
+        return tuple(values)
+
+    def join(self, values):
+        """Spell letter values as the canonical uppercase string"""
+        return "".join(self.letters[value - 1] for value in values)
+
+
+class Language:
+    """A language's alphabet plus its normalized, encoded word list"""
+
+    def __init__(self, code, name, letters, words):
+        self.code = code
+        self.name = name
+        self.alphabet = Alphabet(letters)
+
+        normalized = []
+        codes = []
+        for word in words:
+            values = self.alphabet.tokenize(word)
+            if len(values) != WORD_LENGTH:
+                raise ValueError("{!r} does not have {} letters".format(word, WORD_LENGTH))
+            normalized.append(self.alphabet.join(values))
+            codes.append(pack_values(values, self.alphabet.bits))
+
+        self.words = tuple(normalized)
+        self.encoded = WordArray(codes, bits=self.alphabet.bits)
+        self._codes = dict(zip(self.words, codes))
+        self._snapshot = None
+        # Raw input spellings seen so far, mapped to canonical spellings
+        self.normalize = functools.lru_cache(maxsize=4096)(self._normalize)
+
+    def _normalize(self, word):
+        """Return the canonical spelling of word, or raise ValueError"""
+        if word in self._codes:
+            return word
+        return self.alphabet.join(self._tokenize_word(word))
+
+    def _tokenize_word(self, word):
+        values = self.alphabet.tokenize(word)
+        if len(values) != WORD_LENGTH:
+            raise ValueError("{!r} does not have {} letters".format(word, WORD_LENGTH))
+        return values
+
+    def encode(self, word):
+        """Return the packed code of word (list words are a dict lookup)"""
+        code = self._codes.get(word)
+        if code is None:
+            code = pack_values(self._tokenize_word(word), self.alphabet.bits)
+        return code
+
+    def is_valid_word(self, word):
+        """Check that word is exactly five letters of this alphabet"""
+        try:
+            self.normalize(word)
+        except ValueError:
+            return False
+        return True
+
+    def score(self, guess, target):
+        """Base-3 feedback pattern of guess against target"""
+        return code_pattern(self.encode(guess), self.encode(target), self.alphabet.bits)
+
+    def score_guess(self, guess, target_code):
+        """Score a guess against an encoded target, with the canonical spelling"""
+        guess = self.normalize(guess)
+        pattern = code_pattern(self.encode(guess), target_code, self.alphabet.bits)
+        return GuessResult(guess, pattern_to_feedback(pattern))
+
+    def validate_guess(self, guess, target):
+        """Score a guess and return a GuessResult with the canonical spelling"""
+        return self.score_guess(guess, self.encode(target))
+
+    @property
+    def snapshot(self):
+        """The word list as a WordListSnapshot for game creation"""
+        if self._snapshot is None:
+            from wordlists import WordListSnapshot
+            self._snapshot = WordListSnapshot(self.words)
+        return self._snapshot
+
+    def table(self):
+        """The cached feedback table, built from the language's encoding"""
+        from feedback_store import load_table
+        return load_table(self.words, encoded=self.encoded)
+
+
+_LATIN = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+# code -> (name, alphabet, word list); English uses the built-in WORD_LIST
+LANGUAGE_DEFINITIONS = {
+    "en": ("English", _LATIN, None),
+    "es": ("Spanish", "ABCDEFGHIJKLMNÑOPQRSTUVWXYZ", (
+        "ÑANDU", "AÑEJO", "BAÑOS", "CAÑON", "NIÑOS", "SUEÑO", "PERRO", "GATOS",
+        "LIBRO", "MUNDO", "PLAYA", "CIELO", "FUEGO", "NOCHE", "LECHE", "ARBOL",
+        "HUEVO", "MADRE", "PADRE", "TIGRE",
+    )),
+    "de": ("German", _LATIN + "ÄÖÜẞ", (
+        "GRÜẞE", "MÖBEL", "ÄPFEL", "KÜCHE", "BÖDEN", "HÜTTE", "LÖWEN", "ZÜGEL",
+        "STUHL", "TISCH", "BLUME", "VOGEL", "WOLKE", "NACHT", "LICHT", "SPIEL",
+    )),
+    "ru": ("Russian", "АБВГДЕЁЖЗИЙКЛМНОПРСТУФХЦЧШЩЪЫЬЭЮЯ", (
+        "СЛОВО", "КНИГА", "ГОРОД", "МЕСТО", "ПЕСНЯ", "ВРЕМЯ", "ПОЛЁТ", "ОКЕАН",
+        "РЕЧКА", "ЛОЖКА", "ВЕТЕР", "СЪЕЗД", "ОБЪЕМ", "ЁЖИКИ", "ЗАМОК", "ДОЖДЬ",
+    )),
+}
+
+# Languages already loaded in this process
+_languages = {}
+
+
+def get_language(code):
+    """Return the Language for code, normalizing its word list on first use"""
+    language = _languages.get(code)
+    if language is None:
+        if code not in LANGUAGE_DEFINITIONS:
+            raise ValueError("Unknown language {!r}; expected one of {}".format(
+                code, ", ".join(sorted(LANGUAGE_DEFINITIONS))))
+        name, letters, words = LANGUAGE_DEFINITIONS[code]
+        if words is None:
+            from app import WORD_LIST
+            words = WORD_LIST
+        language = Language(code, name, letters, words)
+        _languages[code] = language
+    return language
@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""
+Streaming aggregate analytics for finished QWords games
+
+Finished games are folded into fixed-memory summaries instead of being
+kept around: a guess-count histogram, a t-digest for solve-time
+percentiles and a space-saving sketch for the most common opening
+guesses. Every summary can be serialized to a dict and merged, so
+separate processes can aggregate independently and combine at the end.
+"""
+
+import math
+import time
+
+
+class TDigest:
+    """Merging t-digest quantile sketch with memory bounded by compression"""
+
+    def __init__(self, compression=100):
+        self.compression = compression
+        self.centroids = []  # Sorted [mean, weight] pairs
+        self.count = 0
+        self.min = None
+        self.max = None
+        self._buffer = []
+        self._buffer_limit = compression * 5
+
+    def add(self, value, weight=1):
+        """Add a value to the sketch"""
+        self._buffer.append((value, weight))
+        self.count += weight
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+        if len(self._buffer) >= self._buffer_limit:
+            self._compress()
+
+    def _scale(self, q):
+        """Arcsine scale function: centroids are small near the tails"""
+        return self.compression / (2.0 * math.pi) * math.asin(2.0 * min(q, 1.0) - 1.0)
+
+    def _compress(self):
+        """Merge buffered values into centroids respecting the size bound"""
+        if not self._buffer:
+            return
+        items = sorted([(m, w) for m, w in self.centroids] + self._buffer)
+        self._buffer = []
+
+        total = float(self.count)
+        merged = []
+        cumulative = 0.0
+        mean, weight = items[0]
+        k_left = self._scale(0.0)
+        for next_mean, next_weight in items[1:]:
+            q_right = (cumulative + weight + next_weight) / total
+            if self._scale(q_right) - k_left <= 1.0:
+                weight += next_weight
+                mean += (next_mean - mean) * next_weight / weight
+            else:
+                merged.append([mean, weight])
+                cumulative += weight
+                k_left = self._scale(cumulative / total)
+                mean, weight = next_mean, next_weight
+        merged.append([mean, weight])
+        self.centroids = merged
+
+    def quantile(self, q):
+        """Estimate the value at quantile q (0-1), or None if empty"""
+        self._compress()
+        if not self.centroids:
+            return None
+        if len(self.centroids) == 1:
+            return self.centroids[0][0]
+
+        target = q * self.count
+        cumulative = 0.0
+        previous_mean = self.min
+        previous_position = 0.0
+        for mean, weight in self.centroids:
+            position = cumulative + weight / 2.0
+            if target <= position:
+                if position == previous_position:
+                    return mean
+                fraction = (target - previous_position) / (position - previous_position)
+                return previous_mean + fraction * (mean - previous_mean)
+            cumulative += weight
+            previous_mean = mean
+            previous_position = position
+
+        if self.count == previous_position:
+            return self.max
+        fraction = (target - previous_position) / (self.count - previous_position)
+        return previous_mean + fraction * (self.max - previous_mean)
+
+    def merge(self, other):
+        """Fold another digest into this one"""
+        other._compress()
+        for mean, weight in other.centroids:
+            self._buffer.append((mean, weight))
+        self.count += other.count
+        for bound in (other.min, other.max):
+            if bound is None:
+                continue
+            if self.min is None or bound < self.min:
+                self.min = bound
+            if self.max is None or bound > self.max:
+                self.max = bound
+        self._compress()
+
+    def to_dict(self):
+        self._compress()
+        return {
+            "compression": self.compression,
+            "centroids": self.centroids,
+            "count": self.count,
+            "min": self.min,
+            "max": self.max,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        digest = cls(data["compression"])
+        digest.centroids = [list(c) for c in data["centroids"]]
+        digest.count = data["count"]
+        digest.min = data["min"]
+        digest.max = data["max"]
+        return digest
+
+
+class SpaceSaving:
+    """Space-saving heavy hitters sketch tracking at most capacity items"""
+
+    def __init__(self, capacity=100):
+        self.capacity = capacity
+        self.counts = {}
+        self.errors = {}
+
+    def add(self, item, count=1):
+        """Count an occurrence of item"""
+        if item in self.counts:
+            self.counts[item] += count
+            return
+        if len(self.counts) < self.capacity:
+            self.counts[item] = count
+            self.errors[item] = 0
+            return
+
+        # Replace the least frequent item, inheriting its count as error
+        evicted = min(self.counts, key=self.counts.get)
+        floor = self.counts.pop(evicted)
+        del self.errors[evicted]
+        self.counts[item] = floor + count
+        self.errors[item] = floor
+
+    def top(self, n=10):
+        """Return the n most frequent items as (item, estimated count) pairs"""
+        ranked = sorted(self.counts.items(), key=lambda kv: (-kv[1], kv[0]))
+        return ranked[:n]
+
+    def _floor(self):
+        """Upper bound on the count of any item not tracked (0 until full)"""
+        if len(self.counts) < self.capacity:
+            return 0
+        return min(self.counts.values())
+
+    def merge(self, other):
+        """Fold another sketch into this one, keeping the heaviest items"""
+        # An item missing from one sketch may still have occurred there up
+        # to that sketch's floor times; adding the floor to both count and
+        # error keeps counts as overestimates and errors as their bound
+        own_floor = self._floor()
+        other_floor = other._floor()
+        counts = {}
+        errors = {}
+        for item in set(self.counts) | set(other.counts):
+            if item in self.counts:
+                count, error = self.counts[item], self.errors[item]
+            else:
+                count, error = own_floor, own_floor
+            if item in other.counts:
+                count += other.counts[item]
+                error += other.errors[item]
+            else:
+                count += other_floor
+                error += other_floor
+            counts[item] = count
+            errors[item] = error
+        kept = sorted(counts, key=lambda item: (-counts[item], item))[:self.capacity]
+        self.counts = {item: counts[item] for item in kept}
+        self.errors = {item: errors[item] for item in kept}
+
+    def to_dict(self):
+        return {"capacity": self.capacity, "counts": self.counts, "errors": self.errors}
+
+    @classmethod
+    def from_dict(cls, data):
+        sketch = cls(data["capacity"])
+        sketch.counts = dict(data["counts"])
+        sketch.errors = dict(data["errors"])
+        return sketch
+
+
+class GameAnalytics:
+    """Bounded-memory aggregates over a stream of finished games"""
+
+    def __init__(self, max_guesses=6, compression=100, top_capacity=100):
+        self.max_guesses = max_guesses
+        self.games = 0
+        self.wins = 0
+        # Index n-1 counts games won in n guesses; the last slot counts losses
+        self.guess_counts = [0] * (max_guesses + 1)
+        self.solve_times = TDigest(compression)
+        self.openers = SpaceSaving(top_capacity)
+
+    def record_game(self, game, end_time=None):
+        """Fold one finished GameState into the aggregates"""
+        self.games += 1
+        if game.won:
+            self.wins += 1
+            self.guess_counts[len(game.guesses) - 1] += 1
+            if game.start_time is not None:
+                if end_time is None:
+                    end_time = time.time()
+                self.solve_times.add(end_time - game.start_time)
+        else:
+            self.guess_counts[-1] += 1
+        if game.guesses:
+            self.openers.add(game.guesses[0].word)
+
+    def merge(self, other):
+        """Fold aggregates from another process into this one"""
+        if other.max_guesses != self.max_guesses:
+            raise ValueError("Cannot merge analytics with different max_guesses")
+        self.games += other.games
+        self.wins += other.wins
+        self.guess_counts = [a + b for a, b in zip(self.guess_counts, other.guess_counts)]
+        self.solve_times.merge(other.solve_times)
+        self.openers.merge(other.openers)
+
+    def summary(self, percentiles=(0.5, 0.9, 0.99), top=10):
+        """Return a plain dict report of the aggregates"""
+        distribution = {str(i + 1): n for i, n in enumerate(self.guess_counts[:-1])}
+        distribution["failed"] = self.guess_counts[-1]
+        return {
+            "games": self.games,
+            "win_rate": self.wins / self.games if self.games else 0.0,
+            "guess_distribution": distribution,
+            "solve_time_percentiles": {
+                "p{:g}".format(p * 100): self.solve_times.quantile(p) for p in percentiles
+            },
+            "top_openers": self.openers.top(top),
+        }
+
+    def to_dict(self):
+        return {
+            "max_guesses": self.max_guesses,
+            "games": self.games,
+            "wins": self.wins,
+            "guess_counts": self.guess_counts,
+            "solve_times": self.solve_times.to_dict(),
+            "openers": self.openers.to_dict(),
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        analytics = cls(data["max_guesses"])
+        analytics.games = data["games"]
+        analytics.wins = data["wins"]
+        analytics.guess_counts = list(data["guess_counts"])
+        analytics.solve_times = TDigest.from_dict(data["solve_times"])
+        analytics.openers = SpaceSaving.from_dict(data["openers"])
+        return analytics
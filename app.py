@@ -4,10 +4,16 @@ QWords - A Wordle-like word guessing game
 Python 3.8 compatible implementation for SEG transformation demo
 """
 
+import os
 import random
 import time
 import sys
 
+import events
+import scoring
+import wordlists
+from encoding import encode_word
+
 
 class GameState:
     """Manages the state of a single game session"""
@@ -20,6 +26,21 @@ class GameState:
         self.won = False
         self.start_time = None
         self.max_guesses = 6
+        self.game_id = None
+        self.word_list = None  # WordListSnapshot the game was created from
+        self.language = None  # Language code, or None for the built-in English rules
+        self.candidate_stats = None  # letter_stats.CandidateStats, when tracked
+        self.emit_events = True  # False for replays and simulations, which are not real play
+
+    @property
+    def target_word(self):
+        return self._target_word
+
+    @target_word.setter
+    def target_word(self, word):
+        self._target_word = word
+        # Packed target word, encoded once per target (see make_guess)
+        self.target_code = None
 
 
 class GuessResult:
@@ -88,50 +109,59 @@ WORD_LIST = [
 ]
 
 
-def get_random_word():
-    """Select a random word from the word list"""
-    return random.choice(WORD_LIST)
+# Feedback names for every pattern, indexed by pattern
+_FEEDBACK_LISTS = [tuple(scoring.pattern_to_feedback(p)) for p in range(scoring.ALL_CORRECT + 1)]
+_ALL_CORRECT_FEEDBACK = list(_FEEDBACK_LISTS[scoring.ALL_CORRECT])
+
+
+# Versioned word lists; new games use the current snapshot
+WORD_LISTS = wordlists.WordListRegistry(WORD_LIST)
+
+
+def current_word_list():
+    """Return the word list snapshot new games are created from"""
+    return WORD_LISTS.current()
+
+
+def get_random_word(difficulty=None, snapshot=None):
+    """
+    Select a random word from the current (or given) word list snapshot
+    If difficulty is given ('easy', 'medium' or 'hard'), pick within that band
+    """
+    if snapshot is None:
+        snapshot = current_word_list()
+    if difficulty is None:
+        return random.choice(snapshot.words)
+
+    from difficulty import get_difficulty_buckets
+    return get_difficulty_buckets(snapshot.words).pick(difficulty)
 
 
 def is_valid_word(word):
-    """Check if a word is valid (5 letters and contains only letters)"""
+    """Check if a word is valid (5 letters and contains only letters A-Z)"""
     if len(word) != 5:
         return False
-    return word.isalpha()
+    # isalpha() alone admits letters like 'É' or 'ß' that the English
+    # rules cannot score; other alphabets go through a language game
+    return word.isascii() and word.isalpha()
+
+
+def score_guess(guess, target_code):
+    """
+    Score an uppercase guess against an encoded target word
+    Returns a GuessResult with feedback for each letter
+    """
+    # The feedback itself comes from the active scoring backend
+    pattern = scoring.score_code(encode_word(guess), target_code)
+    return GuessResult(guess, list(_FEEDBACK_LISTS[pattern]))
 
 
 def validate_guess(guess, target):
     """
-    Validate a guess against the target word
+    Validate a guess against the target word (A-Z words in any case)
     Returns a GuessResult with feedback for each letter
     """
-    guess = guess.upper()
-    target = target.upper()
-    feedback = []
-    
-    # Count letters in target for handling duplicates
-    target_counts = {}
-    for letter in target:
-        target_counts[letter] = target_counts.get(letter, 0) + 1
-    
-    # First pass: mark correct positions
-    for i in range(5):
-        if guess[i] == target[i]:
-            feedback.append('correct')
-            target_counts[guess[i]] -= 1
-        else:
-            feedback.append('unknown')
-    
-    # Second pass: mark present/absent for non-correct positions
-    for i in range(5):
-        if feedback[i] == 'unknown':
-            if guess[i] in target_counts and target_counts[guess[i]] > 0:
-                feedback[i] = 'present'
-                target_counts[guess[i]] -= 1
-            else:
-                feedback[i] = 'absent'
-    
-    return GuessResult(guess, feedback)
+    return score_guess(guess.upper(), encode_word(target))
 
 
 def format_guess_display(guess_result):
@@ -152,28 +182,78 @@ def format_guess_display(guess_result):
     return display.strip()
 
 
-def create_new_game():
-    """Create a new game session"""
+def create_new_game(target_word=None, language=None, emit_events=True):
+    """
+    Create a new game session, optionally with a fixed target word
+    language selects a per-language word list and alphabet (e.g. 'es')
+    emit_events=False keeps this game's events away from the event sink
+    Raises ValueError for a target that is not a valid word
+    """
     game = GameState()
-    game.target_word = get_random_word()
+    game.emit_events = emit_events
+    if language is None:
+        game.word_list = current_word_list()
+        if target_word:
+            if not is_valid_word(target_word):
+                raise ValueError("Target word must be 5 letters A-Z: {!r}".format(target_word))
+            game.target_word = target_word.upper()
+        else:
+            game.target_word = get_random_word(snapshot=game.word_list)
+        game.target_code = encode_word(game.target_word)
+    else:
+        from alphabets import get_language
+        rules = get_language(language)
+        game.language = rules.code
+        game.word_list = rules.snapshot
+        if target_word:
+            game.target_word = rules.normalize(target_word)
+        else:
+            game.target_word = get_random_word(snapshot=game.word_list)
+        game.target_code = rules.encode(game.target_word)
     game.start_time = time.time()
+    game.game_id = os.urandom(8).hex()
+    if emit_events:
+        events.emit("game_created", game_id=game.game_id, target=game.target_word,
+                    language=game.language)
     return game
 
 
-def make_guess(game, guess_word):
-    """Process a guess and update game state"""
+def make_guess(game, guess_word, validate=None):
+    """
+    Process a guess and update game state
+    validate replaces score_guess for English games (race sessions pass
+    a memoized version); it is called with the uppercase guess and the
+    encoded target
+    """
     if game.game_over:
         return None
     
-    if not is_valid_word(guess_word):
-        return None
-    
-    result = validate_guess(guess_word, game.target_word)
+    if game.language is None:
+        if not is_valid_word(guess_word):
+            return None
+        if game.target_code is None:
+            # Targets set directly rather than through create_new_game
+            game.target_code = encode_word(game.target_word)
+        result = (validate or score_guess)(guess_word.upper(), game.target_code)
+    else:
+        # Non-English games validate and score on the language's encoding
+        from alphabets import get_language
+        rules = get_language(game.language)
+        if not rules.is_valid_word(guess_word):
+            return None
+        if game.target_code is None:
+            game.target_code = rules.encode(game.target_word)
+        result = rules.score_guess(guess_word, game.target_code)
     game.guesses.append(result)
     game.current_guess += 1
+    if game.candidate_stats is not None:
+        game.candidate_stats.update(result)
+    if game.emit_events:
+        events.emit("guess_made", game_id=game.game_id, guess=result.word,
+                    feedback=result.feedback, turn=game.current_guess)
     
-    # Check if won
-    if result.word.upper() == game.target_word.upper():
+    # Check if won (every letter correct, without re-uppercasing the words)
+    if result.feedback == _ALL_CORRECT_FEEDBACK:
         game.won = True
         game.game_over = True
     
@@ -181,34 +261,50 @@ def make_guess(game, guess_word):
     if game.current_guess >= game.max_guesses:
         game.game_over = True
     
+    if game.game_over and game.emit_events:
+        events.emit("game_won" if game.won else "game_lost", game_id=game.game_id,
+                    target=game.target_word, guesses=game.current_guess)
+    
     return result
 
 
-def display_attempt_history(game):
-    """Display history of all previous attempts"""
+def render_attempt_history(game):
+    """Render the history of all previous attempts as a list of lines"""
     if not game.guesses:
-        return
+        return []
     
-    print("\nPrevious Guesses:")
+    lines = ["\nPrevious Guesses:"]
     for i, guess in enumerate(game.guesses):
-        print("Guess {}: {}".format(i + 1, format_guess_display(guess)))
+        lines.append("Guess {}: {}".format(i + 1, format_guess_display(guess)))
+    return lines
 
 
-def display_game_board(game):
-    """Display the current game board"""
-    print("\nCurrent Game Board:")
-    print("-" * 25)
+def render_game_board(game):
+    """Render the current game board (with attempt history) as text"""
+    lines = ["\nCurrent Game Board:", "-" * 25]
     
     for i, guess in enumerate(game.guesses):
-        print("Guess {}: {}".format(i + 1, format_guess_display(guess)))
+        lines.append("Guess {}: {}".format(i + 1, format_guess_display(guess)))
     
     # Show remaining empty slots
     for i in range(len(game.guesses), game.max_guesses):
-        print("Guess {}: _ _ _ _ _".format(i + 1))
-    
-    print("-" * 25)
+        lines.append("Guess {}: _ _ _ _ _".format(i + 1))
     
-    display_attempt_history(game)
+    lines.append("-" * 25)
+    lines.extend(render_attempt_history(game))
+    return "\n".join(lines)
+
+
+def display_attempt_history(game):
+    """Display history of all previous attempts"""
+    lines = render_attempt_history(game)
+    if lines:
+        print("\n".join(lines))
+
+
+def display_game_board(game):
+    """Display the current game board"""
+    print(render_game_board(game))
 
 
 def display_game_stats():
@@ -241,12 +337,18 @@ def get_user_input(prompt):
         return "quit"
 
 
-def play_game():
-    """Main game loop"""
-    game = create_new_game()
-    
-    print("\nStarting new game!")
-    print("Target word has been selected. Good luck!")
+def play_game(game=None):
+    """
+    Main game loop
+    Pass an unfinished GameState to resume it; quitting returns the
+    unfinished game so it can be resumed or snapshotted later
+    """
+    if game is None:
+        game = create_new_game()
+        print("\nStarting new game!")
+        print("Target word has been selected. Good luck!")
+    else:
+        print("\nResuming your saved game!")
     
     while not game.game_over:
         display_game_board(game)
@@ -255,8 +357,9 @@ def play_game():
         guess = get_user_input("Enter your guess (or 'quit' to exit): ").upper()
         
         if guess == "QUIT":
+            events.emit("quit", game_id=game.game_id, guesses=game.current_guess)
             print("Thanks for playing!")
-            return
+            return game
         
         if len(guess) != 5:
             print("Please enter exactly 5 letters.")
@@ -283,8 +386,8 @@ def play_game():
         print("Better luck next time!")
 
 
-def show_main_menu():
-    """Display the main menu options"""
+def show_main_menu(can_resume=False):
+    """Display the main menu options (with resume when a game was quit)"""
     print("\n" + "=" * 30)
     print("QWords - Word Guessing Game")
     print("=" * 30)
@@ -292,20 +395,40 @@ def show_main_menu():
     print("2. View Game Rules")
     print("3. View Statistics")
     print("4. Quit")
+    if can_resume:
+        print("5. Resume Saved Game")
     print("=" * 30)
 
 
 def main():
     """Main application entry point"""
+    sink = events.sink_from_environment()
+    scoring.backend_from_environment(WORD_LIST)
+    try:
+        run_menu()
+    finally:
+        if sink is not None:
+            events.set_event_sink(None)
+            sink.close()
+
+
+def run_menu():
+    """Run the main menu loop until the player quits"""
     print("Welcome to QWords!")
     print("A Wordle-like word guessing game")
     
+    # Game the player quit part-way through, resumed with option 5
+    saved_game = None
+    
     while True:
-        show_main_menu()
-        choice = get_user_input("Select an option (1-4): ")
+        show_main_menu(saved_game is not None)
+        last_option = 5 if saved_game is not None else 4
+        choice = get_user_input("Select an option (1-{}): ".format(last_option))
         
         if choice == "1":
-            play_game()
+            saved_game = play_game()
+        elif choice == "5" and saved_game is not None:
+            saved_game = play_game(saved_game)
         elif choice == "2":
             show_game_rules()
         elif choice == "3":
@@ -314,7 +437,7 @@ def main():
             print("Thanks for playing QWords!")
             break
         else:
-            print("Invalid choice. Please select 1-4.")
+            print("Invalid choice. Please select 1-{}.".format(last_option))
 
 
 if __name__ == "__main__":
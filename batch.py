@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Scripted JSON-lines batch driver for QWords
+
+Reads one JSON command per line from a file or stdin and writes one JSON
+result per line, so games can be driven from scripts without patching
+input(). Commands are processed as they stream in: only the open games
+are kept (at most max_games, least recently used first out) and results
+go through a buffered writer that is flushed at the end of the run.
+
+Commands:
+    {"op": "new", "game": name?, "target": word?, "language": code?}
+    {"op": "guess", "game": name, "word": word}
+    {"op": "state", "game": name}
+    {"op": "close", "game": name}
+    {"op": "memory", "deep": bool?}     (memory_report, an admin request)
+
+Every result carries "ok"; failed commands add "error" and never stop the
+run. An "id" field on a command is echoed back for correlation.
+"""
+
+import argparse
+import collections
+import io
+import json
+import sys
+
+from app import create_new_game, make_guess
+
+DEFAULT_MAX_GAMES = 10000
+OUTPUT_BUFFER_SIZE = 1 << 16
+
+
+class BatchError(Exception):
+    """A command that cannot be processed"""
+
+
+def _scalar(command, field):
+    """Return a command field, rejecting JSON arrays and objects"""
+    value = command.get(field)
+    if isinstance(value, (list, dict)):
+        raise BatchError("{!r} must not be a {}".format(field, type(value).__name__))
+    return value
+
+
+def _text(command, field):
+    """Return an optional string command field"""
+    value = command.get(field)
+    if value is not None and not isinstance(value, str):
+        raise BatchError("{!r} must be a string".format(field))
+    return value
+
+
+class BatchDriver:
+    """Applies batch commands to a bounded set of open games"""
+
+    def __init__(self, max_games=DEFAULT_MAX_GAMES):
+        self.max_games = max_games
+        self.games = collections.OrderedDict()
+        self.evicted = 0
+        self._handlers = {
+            "new": self._new,
+            "guess": self._guess,
+            "state": self._state,
+            "close": self._close,
+            "memory": self._memory,
+        }
+
+    def handle(self, command):
+        """Apply one decoded command and return its result dict"""
+        if not isinstance(command, dict):
+            raise BatchError("Command must be a JSON object")
+        op = _scalar(command, "op")
+        handler = self._handlers.get(op)
+        if handler is None:
+            raise BatchError("Unknown op: {!r}".format(op))
+        return handler(command)
+
+    def _game(self, command):
+        name = _scalar(command, "game")
+        game = self.games.get(name)
+        if game is None:
+            raise BatchError("Unknown game: {!r}".format(name))
+        self.games.move_to_end(name)
+        return name, game
+
+    def _new(self, command):
+        target = _text(command, "target")
+        language = _text(command, "language")
+        name = _scalar(command, "game")
+        try:
+            game = create_new_game(target, language=language)
+        except ValueError as e:
+            raise BatchError(str(e))
+        name = name or game.game_id
+        self.games.pop(name, None)
+        self.games[name] = game
+        if len(self.games) > self.max_games:
+            self.games.popitem(last=False)
+            self.evicted += 1
+        return {"game": name}
+
+    def _guess(self, command):
+        name, game = self._game(command)
+        if game.game_over:
+            raise BatchError("Game is over")
+        word = command.get("word")
+        result = make_guess(game, word) if isinstance(word, str) else None
+        if result is None:
+            raise BatchError("Invalid guess: {!r}".format(command.get("word")))
+        response = {
+            "game": name,
+            "word": result.word,
+            "feedback": result.feedback,
+            "turn": game.current_guess,
+            "game_over": game.game_over,
+            "won": game.won,
+        }
+        if game.game_over:
+            response["target"] = game.target_word
+        return response
+
+    def _state(self, command):
+        name, game = self._game(command)
+        response = {
+            "game": name,
+            "guesses": [guess.word for guess in game.guesses],
+            "turn": game.current_guess,
+            "remaining": game.max_guesses - game.current_guess,
+            "game_over": game.game_over,
+            "won": game.won,
+        }
+        if game.game_over:
+            response["target"] = game.target_word
+        return response
+
+    def _close(self, command):
+        name, _ = self._game(command)
+        del self.games[name]
+        return {"game": name}
+
+    def _memory(self, command):
+        from memory_report import memory_report
+        return {"open_games": len(self.games), "memory": memory_report(bool(command.get("deep")))}
+
+
+def run_batch(lines, output, max_games=DEFAULT_MAX_GAMES):
+    """
+    Process an iterable of JSON command lines, writing one result line per
+    command to the text stream output. Blank lines are skipped.
+    Returns (commands processed, commands failed)
+    """
+    driver = BatchDriver(max_games)
+    dumps = json.dumps
+    write = output.write
+    processed = failed = 0
+
+    for line in lines:
+        if not line.strip():
+            continue
+        processed += 1
+        command = None
+        try:
+            command = json.loads(line)
+            response = driver.handle(command)
+            response["ok"] = True
+        except (ValueError, BatchError) as e:
+            # json.JSONDecodeError is a ValueError
+            failed += 1
+            response = {"ok": False, "error": str(e), "line": processed}
+        if isinstance(command, dict) and "id" in command:
+            response["id"] = command["id"]
+        write(dumps(response))
+        write("\n")
+
+    output.flush()
+    return processed, failed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Drive QWords games from JSON-lines commands")
+    parser.add_argument("input", nargs="?", default="-",
+                        help="Command file, or - for stdin (default)")
+    parser.add_argument("-o", "--output", default="-",
+                        help="Result file, or - for stdout (default)")
+    parser.add_argument("--max-games", type=int, default=DEFAULT_MAX_GAMES,
+                        help="Open games kept before the least recently used is dropped")
+    parser.add_argument("--line-buffered", action="store_true",
+                        help="Flush after every result, for interactive pipelines")
+    parser.add_argument("--trace-memory", action="store_true",
+                        help="Trace allocations so memory commands can use deep mode")
+    args = parser.parse_args(argv)
+
+    if args.trace_memory:
+        from memory_report import start_tracing
+        start_tracing()
+
+    if args.input == "-":
+        source = sys.stdin
+    else:
+        source = open(args.input, encoding="utf-8")
+
+    line_buffering = args.line_buffered
+    if args.output == "-":
+        output = io.TextIOWrapper(io.BufferedWriter(io.FileIO(sys.stdout.fileno(), "w", closefd=False),
+                                                    OUTPUT_BUFFER_SIZE),
+                                  encoding="utf-8", line_buffering=line_buffering)
+    else:
+        output = open(args.output, "w", encoding="utf-8",
+                      buffering=1 if line_buffering else OUTPUT_BUFFER_SIZE)
+
+    try:
+        processed, failed = run_batch(source, output, args.max_games)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        output.close()
+    print("Processed {} commands ({} failed)".format(processed, failed), file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Spectator broadcast for QWords tournaments
+
+A BroadcastChannel renders each board update once into a bytes frame and
+hands the same frame object to every subscriber. Each subscriber keeps
+only the latest undelivered frame: a slow spectator skips intermediate
+boards instead of building a backlog, and publishing never waits on any
+spectator, so one slow watcher cannot stall the game.
+"""
+
+import threading
+
+import app
+
+
+class Frame:
+    """One rendered board update shared by all subscribers"""
+
+    def __init__(self, sequence, data):
+        self.sequence = sequence
+        self.data = data  # Rendered board as UTF-8 bytes
+
+
+class Subscriber:
+    """A spectator's single-slot mailbox holding the latest frame"""
+
+    def __init__(self, channel):
+        self.channel = channel
+        self.delivered = 0
+        self.skipped = 0
+        self.closed = False
+        self._latest = None
+        self._condition = threading.Condition()
+
+    def offer(self, frame):
+        """Replace any undelivered frame with a newer one (never blocks)"""
+        with self._condition:
+            if self._latest is not None:
+                self.skipped += 1
+            self._latest = frame
+            self._condition.notify()
+
+    def get(self, timeout=None):
+        """Wait for the next frame; returns None on timeout or close"""
+        with self._condition:
+            if self._latest is None and not self.closed:
+                self._condition.wait(timeout)
+            frame = self._latest
+            self._latest = None
+            if frame is not None:
+                self.delivered += 1
+            return frame
+
+    def close(self):
+        """Wake any waiting reader and stop accepting frames"""
+        with self._condition:
+            self.closed = True
+            self._condition.notify_all()
+
+
+class BroadcastChannel:
+    """Fans rendered board updates for one game out to many spectators"""
+
+    def __init__(self):
+        self.frames_rendered = 0
+        self._subscribers = ()
+        self._lock = threading.Lock()
+        self._latest = None
+
+    def subscribe(self):
+        """Add a spectator; it immediately receives the latest board if any"""
+        subscriber = Subscriber(self)
+        with self._lock:
+            self._subscribers = self._subscribers + (subscriber,)
+            latest = self._latest
+        if latest is not None:
+            subscriber.offer(latest)
+        return subscriber
+
+    def unsubscribe(self, subscriber):
+        """Remove a spectator and wake its reader"""
+        with self._lock:
+            self._subscribers = tuple(s for s in self._subscribers if s is not subscriber)
+        subscriber.close()
+
+    @property
+    def subscriber_count(self):
+        return len(self._subscribers)
+
+    def publish(self, game):
+        """Render the board once and offer the frame to every spectator"""
+        data = app.render_game_board(game).encode("utf-8")
+        with self._lock:
+            self.frames_rendered += 1
+            frame = Frame(self.frames_rendered, data)
+            self._latest = frame
+            subscribers = self._subscribers
+        for subscriber in subscribers:
+            subscriber.offer(frame)
+        return frame
+
+    def close(self):
+        """Disconnect every spectator"""
+        with self._lock:
+            subscribers = self._subscribers
+            self._subscribers = ()
+        for subscriber in subscribers:
+            subscriber.close()
+
+
+def stream_to(subscriber, stream):
+    """
+    Start a thread copying frames from subscriber to a binary stream
+    A slow stream only delays this spectator, which then skips to the
+    latest board
+    """
+    def pump():
+        while True:
+            frame = subscriber.get()
+            if frame is None:
+                if subscriber.closed:
+                    return
+                continue
+            stream.write(frame.data + b"\n")
+            stream.flush()
+
+    thread = threading.Thread(target=pump, name="qwords-spectator", daemon=True)
+    thread.start()
+    return thread
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+On-disk cache helpers for QWords precomputed data
+
+Anything derived from a word list (opening books, difficulty scores,
+statistics tables) is stored under a file name that includes the list's
+content hash, so editing the list automatically invalidates old entries.
+Once loaded, each is kept in a LoadedCache for the rest of its use.
+"""
+
+import collections
+import hashlib
+import json
+import os
+import threading
+import weakref
+
+# Word lists whose loaded data stays cached with nothing else using it
+DEFAULT_KEEP_LOADED = 4
+
+
+def word_list_hash(words):
+    """Return a stable content hash for a word list"""
+    digest = hashlib.sha256()
+    for word in words:
+        digest.update(word.upper().encode("utf-8"))
+        digest.update(b"\n")
+    return digest.hexdigest()
+
+
+def cache_dir():
+    """Return the cache directory (QWORDS_CACHE_DIR or ~/.cache/qwords)"""
+    path = os.environ.get("QWORDS_CACHE_DIR")
+    if not path:
+        path = os.path.join(os.path.expanduser("~"), ".cache", "qwords")
+    return path
+
+
+def cache_path(kind, words, extension="json", directory=None):
+    """Return the cache file path for a kind of data derived from words"""
+    name = "{}-{}.{}".format(kind, word_list_hash(words)[:16], extension)
+    return os.path.join(directory or cache_dir(), name)
+
+
+def read_json(path):
+    """Load a cached JSON document, returning None if missing or corrupt"""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def write_json_atomic(path, data):
+    """Write a JSON document so readers never see a partial file"""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = "{}.{}.tmp".format(path, os.getpid())
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+    os.replace(tmp_path, path)
+
+
+class LoadedCache:
+    """
+    Per-process cache of data loaded for word lists, keyed by list hash
+    Entries are held weakly, so data for a list nothing uses any more
+    (say, a word list version whose games have all finished) can be
+    freed; the keep most recently used entries are also held strongly so
+    that repeated lookups between games do not reload them from disk.
+    """
+
+    def __init__(self, keep=DEFAULT_KEEP_LOADED):
+        self._entries = weakref.WeakValueDictionary()
+        self._recent = collections.deque(maxlen=keep)
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, list_hash, default=None):
+        with self._lock:
+            value = self._entries.get(list_hash)
+            if value is None:
+                return default
+            self._touch(value)
+            return value
+
+    def __setitem__(self, list_hash, value):
+        with self._lock:
+            self._entries[list_hash] = value
+            self._touch(value)
+
+    def __delitem__(self, list_hash):
+        with self._lock:
+            value = self._entries.pop(list_hash)
+            self._forget(value)
+
+    def _forget(self, value):
+        for i, recent in enumerate(self._recent):
+            if recent is value:
+                del self._recent[i]
+                return
+
+    def _touch(self, value):
+        """Mark value as the most recently used entry"""
+        if self._recent and self._recent[-1] is value:
+            return
+        self._forget(value)
+        self._recent.append(value)
+
+    def values(self):
+        with self._lock:
+            return list(self._entries.values())
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._recent.clear()
@@ -0,0 +1,12 @@
+#!/usr/bin/env python3
+"""
+Shared pytest fixtures for the QWords test suite
+"""
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path, monkeypatch):
+    """Keep tables, opening books and other cached data out of the user's cache directory"""
+    monkeypatch.setenv("QWORDS_CACHE_DIR", str(tmp_path))
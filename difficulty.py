@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Per-word difficulty scoring for a QWords answer list
+
+Every word is played as the target several times under the reference
+strategy (book opening, then random consistent guesses), recording the
+mean number of guesses, the failure rate and the size of the candidate
+bucket left after the opening guess. Scores are computed in parallel,
+cached on disk per word list, and grouped into difficulty bands so that
+picking a target of a given difficulty is a single random choice.
+"""
+
+import multiprocessing
+import random
+
+from cache import LoadedCache, cache_path, read_json, word_list_hash, write_json_atomic
+from feedback_store import attach_worker_table, load_table, share_table, worker_table
+from headless import play_headless
+from opening_book import get_opening_book
+from strategies import BookOpeningStrategy
+
+SCORES_VERSION = 1
+DEFAULT_SAMPLES = 20
+DIFFICULTY_BANDS = ("easy", "medium", "hard")
+
+# Buckets already built in this process, keyed by word list hash
+_loaded_buckets = LoadedCache()
+
+
+class WordDifficulty:
+    """Difficulty measurements for a single target word"""
+
+    def __init__(self, word, expected_guesses, failure_rate, opening_bucket):
+        self.word = word
+        self.expected_guesses = expected_guesses
+        self.failure_rate = failure_rate
+        self.opening_bucket = opening_bucket
+
+    def to_dict(self):
+        return {
+            "word": self.word,
+            "expected_guesses": self.expected_guesses,
+            "failure_rate": self.failure_rate,
+            "opening_bucket": self.opening_bucket,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data["word"], data["expected_guesses"],
+                   data["failure_rate"], data["opening_bucket"])
+
+
+def score_word(table, word, samples=DEFAULT_SAMPLES, seed=0):
+    """Measure one target word by playing it samples times"""
+    strategy = BookOpeningStrategy()
+    rng = random.Random("{}:{}".format(seed, word))
+
+    turns = 0
+    failures = 0
+    for _ in range(samples):
+        result = play_headless(word, strategy, table, rng, emit_events=False)
+        turns += result.turns
+        if not result.won:
+            failures += 1
+
+    opener = table.index[get_opening_book(table.words).first_guess]
+    row = table.row(opener)
+    opening_bucket = row.tolist().count(row[table.index[word]])
+
+    return WordDifficulty(word, turns / samples, failures / samples, opening_bucket)
+
+
+def _score_chunk(args):
+    """Pool task: score a chunk of words against the attached table"""
+    words, samples, seed = args
+    table = worker_table()
+    return [score_word(table, word, samples, seed).to_dict() for word in words]
+
+
+def analyze_word_list(words, samples=DEFAULT_SAMPLES, processes=None, seed=0):
+    """Score every word, fanning chunks out over processes (1 = inline)"""
+    words = [word.upper() for word in words]
+    # Warm the opening book so workers load it from disk instead of racing
+    get_opening_book(words)
+
+    if processes == 1:
+        table = load_table(words)
+        return [score_word(table, word, samples, seed) for word in words]
+
+    processes = processes or multiprocessing.cpu_count()
+    chunk_size = max(1, len(words) // (processes * 4))
+    chunks = [(words[i:i + chunk_size], samples, seed)
+              for i in range(0, len(words), chunk_size)]
+
+    shared = share_table(words)
+    try:
+        with multiprocessing.Pool(processes, attach_worker_table,
+                                  (shared.name if shared else None, words)) as pool:
+            scored = [item for chunk in pool.map(_score_chunk, chunks) for item in chunk]
+    finally:
+        if shared is not None:
+            shared.close()
+
+    return [WordDifficulty.from_dict(item) for item in scored]
+
+
+def get_difficulty_scores(words, directory=None, samples=DEFAULT_SAMPLES, processes=None):
+    """Return cached difficulty scores for words, computing them on a miss"""
+    list_hash = word_list_hash(words)
+    path = cache_path("difficulty", words, directory=directory)
+    data = read_json(path)
+    if (data and data.get("version") == SCORES_VERSION
+            and data.get("list_hash") == list_hash and data.get("samples") == samples):
+        return [WordDifficulty.from_dict(item) for item in data["scores"]]
+
+    scores = analyze_word_list(words, samples, processes)
+    write_json_atomic(path, {
+        "version": SCORES_VERSION,
+        "list_hash": list_hash,
+        "samples": samples,
+        "scores": [score.to_dict() for score in scores],
+    })
+    return scores
+
+
+class DifficultyBuckets:
+    """Words grouped into equal-sized difficulty bands"""
+
+    def __init__(self, scores):
+        ranked = sorted(scores, key=lambda s: (s.expected_guesses, s.failure_rate, s.word))
+        band_size = -(-len(ranked) // len(DIFFICULTY_BANDS))
+        self.bands = {
+            band: [s.word for s in ranked[i * band_size:(i + 1) * band_size]]
+            for i, band in enumerate(DIFFICULTY_BANDS)
+        }
+
+    def pick(self, band, rng=random):
+        """Pick a random word within a difficulty band"""
+        if band not in self.bands:
+            raise ValueError("Unknown difficulty {!r}; expected one of {}".format(
+                band, ", ".join(DIFFICULTY_BANDS)))
+        return rng.choice(self.bands[band])
+
+
+def get_difficulty_buckets(words, directory=None):
+    """Return difficulty buckets for words, built once per process"""
+    list_hash = word_list_hash(words)
+    buckets = _loaded_buckets.get(list_hash)
+    if buckets is None:
+        buckets = DifficultyBuckets(get_difficulty_scores(words, directory))
+        _loaded_buckets[list_hash] = buckets
+    return buckets
+
+
+def main():
+    """Print the hardest and easiest words of the built-in list"""
+    from app import WORD_LIST
+
+    scores = sorted(get_difficulty_scores(WORD_LIST), key=lambda s: s.expected_guesses)
+    for label, selection in (("Easiest", scores[:10]), ("Hardest", scores[-10:])):
+        print("{}:".format(label))
+        for s in selection:
+            print("  {}  {:.2f} guesses  {:.0%} failed  bucket {}".format(
+                s.word, s.expected_guesses, s.failure_rate, s.opening_bucket))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+Distributed strategy evaluation for QWords
+
+A coordinator splits the target words into chunks and serves them over a
+newline-delimited JSON protocol on TCP. Workers (other processes or
+hosts) connect, pull one chunk at a time, play every target headlessly
+through create_new_game/make_guess and stream each game result back,
+followed by a chunk_done message. A chunk leased to a worker that
+disconnects, or that exceeds the lease timeout, is put back in the queue
+and its partial results are discarded, so each target is reported once.
+
+Protocol (one JSON object per line):
+    worker -> {"op": "hello"}
+    coord  -> {"op": "welcome", "words": [...], "strategy": name, "seed": n}
+    worker -> {"op": "request"}
+    coord  -> {"op": "chunk", "chunk_id": i, "targets": [...]}
+              | {"op": "wait", "delay": seconds} | {"op": "done"}
+    worker -> {"op": "result", "chunk_id": i, "result": {...}}   (per game)
+    worker -> {"op": "chunk_done", "chunk_id": i}
+"""
+
+import argparse
+import collections
+import json
+import random
+import socket
+import socketserver
+import threading
+import time
+
+from feedback_store import load_table
+from headless import play_headless
+from strategies import get_strategy
+
+DEFAULT_CHUNK_SIZE = 50
+WAIT_DELAY = 0.2
+
+
+def _send(stream, message):
+    stream.write((json.dumps(message) + "\n").encode("utf-8"))
+    stream.flush()
+
+
+def _receive(stream):
+    line = stream.readline()
+    if not line:
+        return None
+    return json.loads(line.decode("utf-8"))
+
+
+class Coordinator:
+    """Hands out target chunks to workers and collects their results"""
+
+    def __init__(self, words, targets=None, strategy="expected-size", seed=0,
+                 chunk_size=DEFAULT_CHUNK_SIZE, host="127.0.0.1", port=0,
+                 lease_timeout=60.0):
+        self.words = [word.upper() for word in words]
+        targets = self.words if targets is None else [t.upper() for t in targets]
+        self.strategy = strategy
+        self.seed = seed
+        self.lease_timeout = lease_timeout
+
+        self.chunks = [targets[i:i + chunk_size] for i in range(0, len(targets), chunk_size)]
+        self.retries = 0
+        self._pending = collections.deque(range(len(self.chunks)))
+        self._leases = {}  # chunk_id -> (connection id, lease start)
+        self._partial = {}  # chunk_id -> results received so far
+        self._results = {}  # chunk_id -> committed results
+        self._lock = threading.Lock()
+        self._finished = threading.Event()
+        if not self.chunks:
+            self._finished.set()
+
+        coordinator = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                coordinator._serve_connection(self)
+
+        self._server = socketserver.ThreadingTCPServer((host, port), Handler)
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def address(self):
+        return self._server.server_address
+
+    def start(self):
+        """Serve workers on a background thread"""
+        self._thread = threading.Thread(target=self._server.serve_forever,
+                                        name="qwords-coordinator", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def wait(self, timeout=None):
+        """Wait for every chunk and return results in target order"""
+        if not self._finished.wait(timeout):
+            raise TimeoutError("Evaluation did not finish in time")
+        with self._lock:
+            return [result for chunk_id in range(len(self.chunks))
+                    for result in self._results[chunk_id]]
+
+    def _lease(self, connection):
+        """Pick the next chunk for a connection, reclaiming expired leases"""
+        now = time.monotonic()
+        with self._lock:
+            for chunk_id, (_, started) in list(self._leases.items()):
+                if now - started > self.lease_timeout:
+                    self._requeue(chunk_id)
+            if self._pending:
+                chunk_id = self._pending.popleft()
+                self._leases[chunk_id] = (connection, now)
+                self._partial[chunk_id] = []
+                return {"op": "chunk", "chunk_id": chunk_id, "targets": self.chunks[chunk_id]}
+            if self._finished.is_set():
+                return {"op": "done"}
+            return {"op": "wait", "delay": WAIT_DELAY}
+
+    def _requeue(self, chunk_id):
+        """Return a leased chunk to the queue (caller holds the lock)"""
+        del self._leases[chunk_id]
+        self._partial.pop(chunk_id, None)
+        self._pending.append(chunk_id)
+        self.retries += 1
+
+    def _owns(self, connection, chunk_id):
+        lease = self._leases.get(chunk_id)
+        return lease is not None and lease[0] == connection
+
+    def _serve_connection(self, handler):
+        connection = id(handler)
+        try:
+            if (_receive(handler.rfile) or {}).get("op") != "hello":
+                return
+            _send(handler.wfile, {"op": "welcome", "words": self.words,
+                                  "strategy": self.strategy, "seed": self.seed})
+            while True:
+                message = _receive(handler.rfile)
+                if message is None:
+                    return
+                op = message.get("op")
+                if op == "request":
+                    _send(handler.wfile, self._lease(connection))
+                elif op == "result":
+                    with self._lock:
+                        if self._owns(connection, message["chunk_id"]):
+                            self._partial[message["chunk_id"]].append(message["result"])
+                elif op == "chunk_done":
+                    self._complete(connection, message["chunk_id"])
+        except (OSError, ValueError):
+            pass
+        finally:
+            # Anything this worker still held goes back in the queue
+            with self._lock:
+                for chunk_id, (owner, _) in list(self._leases.items()):
+                    if owner == connection:
+                        self._requeue(chunk_id)
+
+    def _complete(self, connection, chunk_id):
+        with self._lock:
+            if not self._owns(connection, chunk_id):
+                return
+            del self._leases[chunk_id]
+            self._results[chunk_id] = self._partial.pop(chunk_id)
+            if len(self._results) == len(self.chunks):
+                self._finished.set()
+
+
+def run_worker(address, max_chunks=None):
+    """Connect to a coordinator and evaluate chunks until it is done"""
+    chunks_done = 0
+    with socket.create_connection(address) as sock:
+        reader = sock.makefile("rb")
+        writer = sock.makefile("wb")
+        _send(writer, {"op": "hello"})
+        welcome = _receive(reader)
+        table = load_table(welcome["words"])
+        strategy = get_strategy(welcome["strategy"])
+        seed = welcome["seed"]
+
+        while max_chunks is None or chunks_done < max_chunks:
+            _send(writer, {"op": "request"})
+            reply = _receive(reader)
+            if reply is None or reply["op"] == "done":
+                break
+            if reply["op"] == "wait":
+                time.sleep(reply["delay"])
+                continue
+
+            chunk_id = reply["chunk_id"]
+            for target in reply["targets"]:
+                rng = random.Random("{}:{}".format(seed, target))
+                result = play_headless(target, strategy, table, rng, emit_events=False)
+                _send(writer, {"op": "result", "chunk_id": chunk_id, "result": result.to_dict()})
+            _send(writer, {"op": "chunk_done", "chunk_id": chunk_id})
+            chunks_done += 1
+    return chunks_done
+
+
+def _parse_address(text):
+    host, _, port = text.rpartition(":")
+    return (host or "127.0.0.1", int(port))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Distributed QWords strategy evaluation")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    coordinator_parser = commands.add_parser("coordinator", help="Serve target chunks")
+    coordinator_parser.add_argument("--host", default="127.0.0.1")
+    coordinator_parser.add_argument("--port", type=int, default=5757)
+    coordinator_parser.add_argument("--strategy", default="expected-size")
+    coordinator_parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    coordinator_parser.add_argument("--seed", type=int, default=0)
+
+    worker_parser = commands.add_parser("worker", help="Evaluate chunks from a coordinator")
+    worker_parser.add_argument("address", help="host:port of the coordinator")
+
+    args = parser.parse_args(argv)
+    if args.command == "worker":
+        run_worker(_parse_address(args.address))
+        return
+
+    from app import WORD_LIST
+
+    coordinator = Coordinator(WORD_LIST, strategy=args.strategy, seed=args.seed,
+                              chunk_size=args.chunk_size, host=args.host, port=args.port)
+    coordinator.start()
+    print("Coordinator listening on {}:{}".format(*coordinator.address))
+    start = time.perf_counter()
+    results = coordinator.wait()
+    elapsed = time.perf_counter() - start
+    coordinator.stop()
+
+    wins = [r for r in results if r["won"]]
+    print("Games: {}  Won: {}  Mean guesses (wins): {:.3f}  Retried chunks: {}  Time: {:.1f}s".format(
+        len(results), len(wins),
+        sum(len(r["guesses"]) for r in wins) / max(1, len(wins)),
+        coordinator.retries, elapsed))
+
+
+if __name__ == "__main__":
+    main()
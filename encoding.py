@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Integer word encoding for the QWords engine
+
+Words are packed into a single int using 5 bits per letter (A=1 .. Z=26,
+first letter in the lowest bits). Packed words compare and hash as plain
+ints and are stored in array-backed WordArrays, so hot loops never build
+or uppercase strings. Conversion to and from str happens only at the I/O
+boundary via encode_word/decode_word.
+"""
+
+from array import array
+from functools import lru_cache
+
+BITS_PER_LETTER = 5
+LETTER_MASK = (1 << BITS_PER_LETTER) - 1
+WORD_LENGTH = 5
+
+_ORD_A = ord("A")
+_WEIGHTS = tuple(3 ** i for i in range(WORD_LENGTH))
+ALL_CORRECT = 3 ** WORD_LENGTH - 1
+
+
+# Games encode the same few thousand guesses and targets over and over
+@lru_cache(maxsize=16384)
+def encode_word(word):
+    """Pack a 5-letter A-Z word (any case) into an int"""
+    # Check the uppercased length: 'ß' becomes 'SS'
+    upper = word.upper()
+    if len(upper) != WORD_LENGTH:
+        raise ValueError("Word must be exactly {} letters: {!r}".format(WORD_LENGTH, word))
+    if not (upper.isascii() and upper.isalpha()):
+        raise ValueError("Word must contain only letters A-Z: {!r}".format(word))
+
+    # Unrolled for WORD_LENGTH == 5; A is byte 65 and letter value 1
+    b = upper.encode("ascii")
+    return ((b[0] - 64) | (b[1] - 64) << 5 | (b[2] - 64) << 10
+            | (b[3] - 64) << 15 | (b[4] - 64) << 20)
+
+
+def decode_word(code):
+    """Unpack an encoded word back into an uppercase str"""
+    letters = []
+    for _ in range(WORD_LENGTH):
+        letters.append(chr((code & LETTER_MASK) + _ORD_A - 1))
+        code >>= BITS_PER_LETTER
+    return "".join(letters)
+
+
+def pack_values(values, bits=BITS_PER_LETTER):
+    """Pack per-position letter values into an int, first letter lowest"""
+    code = 0
+    shift = 0
+    for value in values:
+        code |= value << shift
+        shift += bits
+    return code
+
+
+def letter_values(code, bits=BITS_PER_LETTER):
+    """Return the per-position letter values of an encoded word"""
+    mask = (1 << bits) - 1
+    values = []
+    for _ in range(WORD_LENGTH):
+        values.append(code & mask)
+        code >>= bits
+    return tuple(values)
+
+
+def code_pattern(guess_code, target_code, bits=BITS_PER_LETTER):
+    """
+    Compute the base-3 feedback pattern (absent=0, present=1, correct=2,
+    position i weighted by 3**i) for two encoded words
+    """
+    if guess_code == target_code:
+        return ALL_CORRECT
+
+    # Unrolled for WORD_LENGTH == 5: this is the game's per-guess hot path
+    mask = (1 << bits) - 1
+    g = guess_code
+    t = target_code
+    g0 = g & mask
+    t0 = t & mask
+    g >>= bits
+    t >>= bits
+    g1 = g & mask
+    t1 = t & mask
+    g >>= bits
+    t >>= bits
+    g2 = g & mask
+    t2 = t & mask
+    g >>= bits
+    t >>= bits
+    g3 = g & mask
+    t3 = t & mask
+    g4 = g >> bits
+    t4 = t >> bits
+
+    # First pass: correct positions, collecting unmatched target letters
+    pattern = 0
+    unmatched = []
+    if g0 == t0:
+        pattern = 2
+    else:
+        unmatched.append(t0)
+    if g1 == t1:
+        pattern += 6
+    else:
+        unmatched.append(t1)
+    if g2 == t2:
+        pattern += 18
+    else:
+        unmatched.append(t2)
+    if g3 == t3:
+        pattern += 54
+    else:
+        unmatched.append(t3)
+    if g4 == t4:
+        pattern += 162
+    else:
+        unmatched.append(t4)
+
+    # Second pass: present letters consume the unmatched target letters
+    if g0 != t0 and g0 in unmatched:
+        unmatched.remove(g0)
+        pattern += 1
+    if g1 != t1 and g1 in unmatched:
+        unmatched.remove(g1)
+        pattern += 3
+    if g2 != t2 and g2 in unmatched:
+        unmatched.remove(g2)
+        pattern += 9
+    if g3 != t3 and g3 in unmatched:
+        unmatched.remove(g3)
+        pattern += 27
+    if g4 != t4 and g4 in unmatched:
+        pattern += 81
+    return pattern
+
+
+class WordArray:
+    """
+    A compact, indexable list of encoded words
+    bits is the width of one letter value (5 for A-Z; wider alphabets
+    such as Cyrillic use more)
+    """
+
+    def __init__(self, codes=(), bits=BITS_PER_LETTER):
+        self.bits = bits
+        self.codes = array("L" if bits * WORD_LENGTH <= 32 else "Q", codes)
+        self._index = None
+        self._letters = None
+
+    @classmethod
+    def from_words(cls, words):
+        """Encode an iterable of str words"""
+        return cls(encode_word(word) for word in words)
+
+    def __len__(self):
+        return len(self.codes)
+
+    def __getitem__(self, i):
+        return self.codes[i]
+
+    def __iter__(self):
+        return iter(self.codes)
+
+    def __contains__(self, code):
+        return code in self.index
+
+    @property
+    def index(self):
+        """Map of encoded word to its position, built on first use"""
+        if self._index is None:
+            self._index = {code: i for i, code in enumerate(self.codes)}
+        return self._index
+
+    def _prepare_scoring(self):
+        """Precompute per-word letter values, letter masks and repeat flags"""
+        letters = [letter_values(code, self.bits) for code in self.codes]
+        masks = array("L", (sum(1 << v for v in set(values)) for values in letters))
+        repeats = bytearray(len(set(values)) < WORD_LENGTH for values in letters)
+        self._letters = (letters, masks, repeats)
+        return self._letters
+
+    def pattern_at(self, guess_index, target_index):
+        """Feedback pattern of the word at guess_index against target_index"""
+        letters, masks, repeats = self._letters or self._prepare_scoring()
+        target_mask = masks[target_index]
+        if not masks[guess_index] & target_mask:
+            return 0
+        if repeats[guess_index]:
+            return code_pattern(self.codes[guess_index], self.codes[target_index], self.bits)
+
+        # When the guess has no repeated letters, a non-matching letter is
+        # present exactly when it appears anywhere in the target
+        guess = letters[guess_index]
+        target = letters[target_index]
+        pattern = 0
+        for i in range(WORD_LENGTH):
+            letter = guess[i]
+            if letter == target[i]:
+                pattern += 2 * _WEIGHTS[i]
+            elif target_mask >> letter & 1:
+                pattern += _WEIGHTS[i]
+        return pattern
+
+    def row_patterns(self, guess_index):
+        """Patterns of one guess against every word, as a bytearray"""
+        pattern_at = self.pattern_at
+        return bytearray(pattern_at(guess_index, t) for t in range(len(self.codes)))
+
+    def word(self, i):
+        """Decode the word at position i (A-Z arrays only)"""
+        return decode_word(self.codes[i])
+
+    def words(self):
+        """Decode every word, for output only (A-Z arrays only)"""
+        return [decode_word(code) for code in self.codes]
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Asynchronous buffered game-event sink for QWords
+
+emit() on a sink costs a dict build and a queue put; a background thread
+drains the queue in batches, appends JSON lines to the event log and
+fsyncs according to the configured policy. The queue is bounded: when it
+is full, events are either dropped (counted) or the caller blocks,
+depending on on_full. A batch that cannot be written (an OSError, say)
+is counted as dropped and the writer carries on; callers never wait on
+a writer thread that has died.
+"""
+
+import json
+import os
+import queue
+import threading
+import time
+
+FSYNC_POLICIES = ("always", "interval", "never")
+FULL_POLICIES = ("drop", "block")
+
+# Seconds between checks that the writer is alive while waiting on a full queue
+_PUT_POLL = 0.1
+
+_STOP = object()
+
+
+class EventSink:
+    """Background writer appending game events to a JSON-lines file"""
+
+    def __init__(self, path, max_queue=10000, on_full="drop", batch_size=256,
+                 fsync="interval", fsync_interval=1.0):
+        if on_full not in FULL_POLICIES:
+            raise ValueError("on_full must be one of {}".format(", ".join(FULL_POLICIES)))
+        if fsync not in FSYNC_POLICIES:
+            raise ValueError("fsync must be one of {}".format(", ".join(FSYNC_POLICIES)))
+
+        self.path = path
+        self.on_full = on_full
+        self.batch_size = batch_size
+        self.fsync = fsync
+        self.fsync_interval = fsync_interval
+
+        self.queued = 0
+        self.written = 0
+        self.dropped = 0
+        self.fsyncs = 0
+        self._counter_lock = threading.Lock()
+
+        self._queue = queue.Queue(max_queue)
+        self._file = open(path, "a", encoding="utf-8")
+        self._last_fsync = time.monotonic()
+        self._dirty = False  # Written since the last fsync
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="qwords-event-sink", daemon=True)
+        self._thread.start()
+
+    def emit(self, event_type, **fields):
+        """Queue an event; returns False if it was dropped"""
+        if self._closed:
+            return False
+        fields["type"] = event_type
+        fields["ts"] = time.time()
+        if self.on_full == "block":
+            queued = self._put(fields)
+        else:
+            try:
+                self._queue.put_nowait(fields)
+                queued = True
+            except queue.Full:
+                queued = False
+        with self._counter_lock:
+            if queued:
+                self.queued += 1
+            else:
+                self.dropped += 1
+        return queued
+
+    def _put(self, item):
+        """Block until item is queued; returns False if the writer has died"""
+        while self._thread.is_alive():
+            try:
+                self._queue.put(item, timeout=_PUT_POLL)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def counters(self):
+        """Return a snapshot of the queued/written/dropped counters"""
+        with self._counter_lock:
+            return {
+                "queued": self.queued,
+                "written": self.written,
+                "dropped": self.dropped,
+                "fsyncs": self.fsyncs,
+                "pending": self._queue.qsize(),
+            }
+
+    def _run(self):
+        """Writer thread: drain batches, write them and apply fsync policy"""
+        stopping = False
+        while not stopping:
+            try:
+                first = self._queue.get(timeout=self.fsync_interval)
+            except queue.Empty:
+                try:
+                    self._maybe_fsync(idle=True)
+                except OSError:
+                    pass
+                continue
+
+            batch = []
+            item = first
+            while True:
+                if item is _STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+                if len(batch) >= self.batch_size:
+                    break
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+
+            if batch:
+                self._write_batch(batch)
+
+        try:
+            self._do_fsync()
+        except OSError:
+            pass
+        self._file.close()
+
+    def _write_batch(self, batch):
+        """Write one batch; a batch that fails is counted as dropped"""
+        try:
+            # default=str keeps a field json cannot encode from failing the batch
+            self._file.write("".join(json.dumps(event, default=str) + "\n" for event in batch))
+            self._file.flush()
+        except Exception:
+            with self._counter_lock:
+                self.dropped += len(batch)
+            return
+        self._dirty = True
+        with self._counter_lock:
+            self.written += len(batch)
+        try:
+            self._maybe_fsync()
+        except OSError:
+            pass  # Retried at the next fsync; the lines are already written
+
+    def _maybe_fsync(self, idle=False):
+        if self.fsync == "always" and not idle:
+            self._do_fsync()
+        elif self.fsync == "interval":
+            if time.monotonic() - self._last_fsync >= self.fsync_interval:
+                self._do_fsync()
+
+    def _do_fsync(self):
+        # An idle sink has nothing new to make durable
+        if self.fsync == "never" or not self._dirty:
+            return
+        os.fsync(self._file.fileno())
+        self._dirty = False
+        self._last_fsync = time.monotonic()
+        with self._counter_lock:
+            self.fsyncs += 1
+
+    def close(self):
+        """Write out everything queued so far and stop the writer thread"""
+        if self._closed:
+            return
+        self._closed = True
+        if self._put(_STOP):
+            self._thread.join()
+        else:
+            self._file.close()
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Game-event dispatch for QWords
+
+Game code calls emit() for every significant event. When no sink is
+installed emit() is a no-op, and the sink implementation (event_sink)
+is only imported once a sink is actually created, keeping game startup
+free of the writer thread's dependencies.
+"""
+
+import os
+
+# Environment variable naming an event log for the interactive game
+EVENT_LOG_ENV = "QWORDS_EVENT_LOG"
+
+# Sink receiving events from emit(), if any
+_sink = None
+
+
+def set_event_sink(sink):
+    """Install the sink used by emit(); pass None to disable events"""
+    global _sink
+    _sink = sink
+
+
+def get_event_sink():
+    """Return the installed sink, or None"""
+    return _sink
+
+
+def emit(event_type, **fields):
+    """Send an event to the installed sink, if there is one"""
+    sink = _sink
+    if sink is not None:
+        sink.emit(event_type, **fields)
+
+
+def sink_from_environment():
+    """Create and install a sink if QWORDS_EVENT_LOG names a log file"""
+    path = os.environ.get(EVENT_LOG_ENV)
+    if not path:
+        return None
+    from event_sink import EventSink
+
+    sink = EventSink(path)
+    set_event_sink(sink)
+    return sink
@@ -0,0 +1,318 @@
+#!/usr/bin/env python3
+"""
+Out-of-core feedback store for very large QWords word lists
+
+A full guess x answer table needs n*n bytes, which is fine for a few
+thousand words but tens of GB for 100k. The tiled store splits the table
+into square tiles that are computed in parallel worker processes and
+written straight into a memory-mapped file, so neither building nor
+querying ever holds more than one tile per process in RAM. Rows and
+columns are gathered lazily from the mapped tiles, and the store offers
+the same interface as FeedbackTable (words, index, size, pattern_at,
+pattern, row) so solver code works with either.
+
+File layout: header, UTF-8 word block, then the tiles band by band. A
+band holds tile_size guesses; within a band each tile is stored
+row-major, left to right. The header magic is written only once every
+tile is in place, so an interrupted build is never mistaken for a table.
+"""
+
+import mmap
+import multiprocessing
+import multiprocessing.util
+import os
+import struct
+import sys
+import threading
+import time
+
+from cache import LoadedCache
+
+# Header: magic, word count, tile size, size of the UTF-8 word block
+_HEADER = struct.Struct("<4sIII")
+_MAGIC = b"QWT1"
+_UNFINISHED = b"\0\0\0\0"
+
+DEFAULT_TILE_SIZE = 1024
+
+# Word lists up to this size use a plain in-memory FeedbackTable
+IN_MEMORY_WORD_LIMIT = 8192
+
+# Word encoding and output file of each tile worker
+_tile_worker = None
+
+# Table attached by attach_worker_table in each pool worker
+_worker_table = None
+
+
+def _band_rows(size, tile_size, band):
+    """Number of guesses in a band (the last band may be short)"""
+    return min(tile_size, size - band * tile_size)
+
+
+def _tile_offset(data_start, size, tile_size, band, column):
+    """File offset of tile (band, column)"""
+    rows = _band_rows(size, tile_size, band)
+    return data_start + band * tile_size * size + column * tile_size * rows
+
+
+class TiledFeedbackTable:
+    """Read-only, lazily queried view over a tiled feedback table buffer"""
+
+    def __init__(self, buffer):
+        view = memoryview(buffer)
+        magic, count, tile_size, words_size = _HEADER.unpack_from(view, 0)
+        if magic != _MAGIC:
+            raise ValueError("Buffer does not contain a tiled feedback table")
+
+        words_start = _HEADER.size
+        self._data_start = words_start + words_size
+        raw_words = bytes(view[words_start:self._data_start]).decode("utf-8")
+        self.words = tuple(raw_words.split("\n")) if count else ()
+        self.index = {word: i for i, word in enumerate(self.words)}
+        self.size = count
+        self.tile_size = tile_size
+        self.tiles = -(-count // tile_size) if count else 0
+        self._view = view
+
+    def pattern_at(self, guess_index, answer_index):
+        """Return the pattern for a guess/answer index pair"""
+        tile_size = self.tile_size
+        band, r = divmod(guess_index, tile_size)
+        column, c = divmod(answer_index, tile_size)
+        cols = min(tile_size, self.size - column * tile_size)
+        offset = _tile_offset(self._data_start, self.size, tile_size, band, column)
+        return self._view[offset + r * cols + c]
+
+    def pattern(self, guess, answer):
+        """Return the pattern for a guess/answer word pair"""
+        return self.pattern_at(self.index[guess], self.index[answer])
+
+    def row(self, guess_index):
+        """Return the patterns of one guess against every answer"""
+        size = self.size
+        tile_size = self.tile_size
+        view = self._view
+        band, r = divmod(guess_index, tile_size)
+        start = _tile_offset(self._data_start, size, tile_size, band, 0)
+        rows = _band_rows(size, tile_size, band)
+
+        out = bytearray()
+        for column in range(self.tiles):
+            cols = min(tile_size, size - column * tile_size)
+            offset = start + column * tile_size * rows + r * cols
+            out += view[offset:offset + cols]
+        return memoryview(out)
+
+    def column(self, answer_index):
+        """Return the patterns of every guess against one answer"""
+        size = self.size
+        tile_size = self.tile_size
+        view = self._view
+        column, c = divmod(answer_index, tile_size)
+        cols = min(tile_size, size - column * tile_size)
+
+        out = bytearray()
+        for band in range(self.tiles):
+            rows = _band_rows(size, tile_size, band)
+            offset = _tile_offset(self._data_start, size, tile_size, band, column) + c
+            out += view[offset:offset + rows * cols:cols].tobytes()
+        return memoryview(out)
+
+    def release(self):
+        """Release the underlying buffer view"""
+        self._view.release()
+
+
+def _init_tile_worker(codes, bits, path, tile_size, data_start):
+    """Pool initializer: keep the encoded words and output file for tiles"""
+    from encoding import WordArray
+
+    global _tile_worker
+    _tile_worker = (WordArray(codes, bits), path, tile_size, data_start)
+
+
+def _compute_tile(tile):
+    """Compute one tile and write it into place in the output file"""
+    array, path, tile_size, data_start = _tile_worker
+    band, column = tile
+    size = len(array)
+    pattern_at = array.pattern_at
+    answers = range(column * tile_size, min(size, (column + 1) * tile_size))
+
+    out = bytearray()
+    for guess_index in range(band * tile_size, min(size, (band + 1) * tile_size)):
+        out += bytes([pattern_at(guess_index, a) for a in answers])
+
+    fd = os.open(path, os.O_WRONLY)
+    try:
+        os.pwrite(fd, out, _tile_offset(data_start, size, tile_size, band, column))
+    finally:
+        os.close(fd)
+    return tile
+
+
+def write_tiled_table_file(path, words, tile_size=DEFAULT_TILE_SIZE, processes=None,
+                           encoded=None):
+    """
+    Compute a tiled feedback table for words into path, one tile per task
+    processes=1 computes the tiles inline; encoded may supply a WordArray
+    in a language's own letter encoding
+    """
+    from encoding import WordArray
+
+    words = [word.upper() for word in words]
+    if encoded is None:
+        encoded = WordArray.from_words(words)
+    size = len(words)
+    block = "\n".join(words).encode("utf-8")
+    data_start = _HEADER.size + len(block)
+
+    tmp_path = "{}.{}.tmp".format(path, os.getpid())
+    with open(tmp_path, "wb") as f:
+        f.write(_HEADER.pack(_UNFINISHED, size, tile_size, len(block)))
+        f.write(block)
+        f.truncate(data_start + size * size)
+
+    tiles_per_side = -(-size // tile_size)
+    tiles = [(band, column) for band in range(tiles_per_side)
+             for column in range(tiles_per_side)]
+    initargs = (encoded.codes, encoded.bits, tmp_path, tile_size, data_start)
+    try:
+        if processes == 1 or len(tiles) <= 1:
+            global _tile_worker
+            _init_tile_worker(*initargs)
+            try:
+                for tile in tiles:
+                    _compute_tile(tile)
+            finally:
+                _tile_worker = None
+        else:
+            processes = processes or multiprocessing.cpu_count()
+            with multiprocessing.Pool(processes, _init_tile_worker, initargs) as pool:
+                for _ in pool.imap_unordered(_compute_tile, tiles):
+                    pass
+
+        with open(tmp_path, "r+b") as f:
+            f.write(_MAGIC)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def open_tiled_table_file(path):
+    """Memory-map a tiled table file read-only and return a TiledFeedbackTable"""
+    with open(path, "rb") as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    return TiledFeedbackTable(mapped)
+
+
+# Stores already opened in this process, keyed by word list hash
+_loaded_stores = LoadedCache()
+_load_lock = threading.Lock()
+
+
+def load_tiled_table(words, directory=None, tile_size=DEFAULT_TILE_SIZE, processes=None,
+                     encoded=None):
+    """
+    Return the tiled feedback table for words, memory-mapping the cache file
+    if one exists and computing it in parallel tiles otherwise
+    """
+    from cache import cache_path, word_list_hash
+
+    list_hash = word_list_hash(words)
+    with _load_lock:
+        table = _loaded_stores.get(list_hash)
+        if table is not None:
+            return table
+
+        path = cache_path("feedback-tiles", words, extension="bin", directory=directory)
+        try:
+            table = open_tiled_table_file(path)
+        except (OSError, ValueError):
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            write_tiled_table_file(path, words, tile_size, processes, encoded)
+            table = open_tiled_table_file(path)
+
+        _loaded_stores[list_hash] = table
+        return table
+
+
+def load_table(words, directory=None, encoded=None):
+    """
+    Return a feedback table for words: an in-memory table for lists up to
+    IN_MEMORY_WORD_LIMIT words and the tiled out-of-core store beyond that
+    """
+    if len(words) <= IN_MEMORY_WORD_LIMIT:
+        from feedback_tables import load_feedback_table
+        return load_feedback_table(words, directory, encoded)
+    return load_tiled_table(words, directory, encoded=encoded)
+
+
+def share_table(words):
+    """
+    Make the table for words available to pool workers. Lists up to
+    IN_MEMORY_WORD_LIMIT words are published in a shared memory block,
+    which is returned for the caller to close once the pool is done.
+    Larger lists are built into the tiled cache file, which each worker
+    memory-maps with load_table, and None is returned.
+    """
+    if len(words) <= IN_MEMORY_WORD_LIMIT:
+        from feedback_tables import publish_shared_table
+        return publish_shared_table(words)
+    load_tiled_table(words)
+    return None
+
+
+def attach_worker_table(name, words):
+    """
+    Pool initializer pairing share_table: attach to the published feedback
+    table, or map the tiled store when the list was too large to publish
+    (name is None). Tasks then read it with worker_table().
+    """
+    global _worker_table
+    if name is None:
+        _worker_table = load_table(words)
+        return
+    from feedback_tables import attach_shared_table
+    shared = attach_shared_table(name)
+    # Detach before interpreter teardown so no buffer views outlive the block
+    multiprocessing.util.Finalize(shared, shared.close, exitpriority=10)
+    _worker_table = shared.table
+
+
+def worker_table():
+    """Return the table attach_worker_table set up in this pool worker"""
+    return _worker_table
+
+
+def main():
+    """Build a tiled table for a word file (one word per line) and time queries"""
+    if len(sys.argv) < 2:
+        print("Usage: python feedback_store.py WORDS_FILE [tile_size] [processes]")
+        return
+    with open(sys.argv[1], encoding="utf-8") as f:
+        words = [line.strip().upper() for line in f if line.strip()]
+    tile_size = int(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_TILE_SIZE
+    processes = int(sys.argv[3]) if len(sys.argv) > 3 else None
+
+    start = time.perf_counter()
+    table = load_tiled_table(words, tile_size=tile_size, processes=processes)
+    print("{} words, {} x {} tiles of {}: ready in {:.1f}s".format(
+        table.size, table.tiles, table.tiles, table.tile_size, time.perf_counter() - start))
+
+    samples = range(0, table.size, max(1, table.size // 100))
+    start = time.perf_counter()
+    for i in samples:
+        table.row(i)
+        table.column(i)
+    print("Row + column query: {:.2f} ms".format(
+        (time.perf_counter() - start) * 1000 / len(samples)))
+
+
+if __name__ == "__main__":
+    main()
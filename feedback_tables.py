@@ -0,0 +1,315 @@
+#!/usr/bin/env python3
+"""
+Precomputed guess x answer feedback tables for QWords
+
+A feedback table stores one byte per (guess, answer) pair holding the
+feedback pattern as a base-3 number (absent=0, present=1, correct=2, with
+position i weighted by 3**i). Tables can be published once into shared
+memory or an mmapped file so that worker processes attach zero-copy
+instead of each building a private copy.
+"""
+
+import mmap
+import os
+import struct
+import sys
+import threading
+import time
+
+from cache import LoadedCache
+from scoring import (  # noqa: F401 - re-exported for table users
+    ABSENT, PRESENT, CORRECT, WORD_LENGTH, ALL_CORRECT, FEEDBACK_NAMES,
+    feedback_pattern, feedback_to_pattern, pattern_to_feedback,
+)
+
+# Header: magic, word count, size of the UTF-8 word block
+_HEADER = struct.Struct("<4sII")
+_MAGIC = b"QWF2"
+
+# Shared memory blocks created by this process
+_published_names = set()
+
+
+def build_feedback_table(words, encoded=None):
+    """
+    Build the full guess x answer pattern table as a bytearray
+    encoded may supply the words as a WordArray in a language's own letter
+    encoding; otherwise A-Z words are encoded here
+    """
+    from encoding import WordArray
+
+    if encoded is None:
+        try:
+            encoded = WordArray.from_words(words)
+        except ValueError:
+            encoded = None
+
+    if encoded is not None:
+        table = bytearray()
+        for guess_index in range(len(encoded)):
+            table += encoded.row_patterns(guess_index)
+        return table
+
+    # Words outside A-Z without an encoding fall back to string scoring
+    words = [word.upper() for word in words]
+    n = len(words)
+    table = bytearray(n * n)
+    offset = 0
+    for guess in words:
+        for target in words:
+            table[offset] = feedback_pattern(guess, target)
+            offset += 1
+    return table
+
+
+class FeedbackTable:
+    """Read-only view over a serialized feedback table buffer"""
+
+    def __init__(self, buffer):
+        view = memoryview(buffer)
+        magic, count, words_size = _HEADER.unpack_from(view, 0)
+        if magic != _MAGIC:
+            raise ValueError("Buffer does not contain a feedback table")
+
+        words_start = _HEADER.size
+        table_start = words_start + words_size
+        raw_words = bytes(view[words_start:table_start]).decode("utf-8")
+        self.words = tuple(raw_words.split("\n")) if count else ()
+        self.index = {word: i for i, word in enumerate(self.words)}
+        self.size = count
+        self._table = view[table_start:table_start + count * count]
+
+    def pattern_at(self, guess_index, answer_index):
+        """Return the pattern for a guess/answer index pair"""
+        return self._table[guess_index * self.size + answer_index]
+
+    def pattern(self, guess, answer):
+        """Return the pattern for a guess/answer word pair"""
+        return self.pattern_at(self.index[guess], self.index[answer])
+
+    def row(self, guess_index):
+        """Return the patterns of one guess against every answer"""
+        start = guess_index * self.size
+        return self._table[start:start + self.size]
+
+    def release(self):
+        """Release the underlying buffer view"""
+        self._table.release()
+
+
+def _word_block(words):
+    return "\n".join(word.upper() for word in words).encode("utf-8")
+
+
+def serialized_size(words):
+    """Return the number of bytes needed to serialize a table for words"""
+    n = len(words)
+    return _HEADER.size + len(_word_block(words)) + n * n
+
+
+def serialize_table_into(buffer, words, table=None, encoded=None):
+    """Write header, word list and pattern table into a writable buffer"""
+    words = [word.upper() for word in words]
+    if table is None:
+        table = build_feedback_table(words, encoded)
+
+    n = len(words)
+    block = _word_block(words)
+    _HEADER.pack_into(buffer, 0, _MAGIC, n, len(block))
+    words_start = _HEADER.size
+    table_start = words_start + len(block)
+    buffer[words_start:table_start] = block
+    buffer[table_start:table_start + n * n] = table
+
+
+def table_for_words(words, encoded=None):
+    """Build an in-process FeedbackTable for words"""
+    buffer = bytearray(serialized_size(words))
+    serialize_table_into(buffer, words, encoded=encoded)
+    return FeedbackTable(buffer)
+
+
+# Tables already loaded in this process, keyed by word list hash
+_loaded_tables = LoadedCache()
+_load_lock = threading.Lock()
+
+
+def load_feedback_table(words, directory=None, encoded=None):
+    """
+    Return the feedback table for words, memory-mapping a precompiled
+    cache file if one exists and building and storing it otherwise
+    """
+    from cache import cache_path, word_list_hash
+
+    list_hash = word_list_hash(words)
+    with _load_lock:
+        table = _loaded_tables.get(list_hash)
+        if table is not None:
+            return table
+
+        path = cache_path("feedback-table", words, extension="bin", directory=directory)
+        try:
+            table = open_table_file(path)
+        except (OSError, ValueError):
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            write_table_file(path, words, encoded)
+            table = open_table_file(path)
+
+        _loaded_tables[list_hash] = table
+        return table
+
+
+class SharedFeedbackTable:
+    """A feedback table living in a multiprocessing shared memory block"""
+
+    def __init__(self, shm, owner):
+        self.shm = shm
+        self.owner = owner
+        self.table = FeedbackTable(shm.buf)
+
+    @property
+    def name(self):
+        return self.shm.name
+
+    def close(self):
+        """Detach from the block, unlinking it if this process created it"""
+        self.table.release()
+        self.shm.close()
+        if self.owner:
+            _published_names.discard(self.shm.name)
+            self.shm.unlink()
+
+
+def publish_shared_table(words, name=None):
+    """Build the table once and publish it in a new shared memory block"""
+    from multiprocessing import shared_memory
+
+    shm = shared_memory.SharedMemory(name=name, create=True,
+                                     size=serialized_size(words))
+    serialize_table_into(shm.buf, words)
+    _published_names.add(shm.name)
+    return SharedFeedbackTable(shm, owner=True)
+
+
+def attach_shared_table(name):
+    """Attach zero-copy to a table published by another process"""
+    import multiprocessing
+    from multiprocessing import resource_tracker, shared_memory
+
+    shm = shared_memory.SharedMemory(name=name)
+    # Attaching registers the block with this process's resource tracker,
+    # which would unlink it on exit; only the publisher owns it. Children
+    # started by multiprocessing share the publisher's tracker already.
+    standalone = multiprocessing.parent_process() is None
+    if standalone and shm.name not in _published_names:
+        resource_tracker.unregister(shm._name, "shared_memory")
+    return SharedFeedbackTable(shm, owner=False)
+
+
+def write_table_file(path, words, encoded=None):
+    """Write a serialized feedback table to path for later mmapping"""
+    buffer = bytearray(serialized_size(words))
+    serialize_table_into(buffer, words, encoded=encoded)
+    tmp_path = "{}.{}.tmp".format(path, os.getpid())
+    with open(tmp_path, "wb") as f:
+        f.write(buffer)
+    os.replace(tmp_path, path)
+
+
+def open_table_file(path):
+    """Memory-map a table file read-only and return a FeedbackTable"""
+    with open(path, "rb") as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    return FeedbackTable(mapped)
+
+
+def _private_memory_kb():
+    """Return this process's private (unshared) memory in kB"""
+    try:
+        with open("/proc/self/smaps_rollup") as f:
+            total = 0
+            for line in f:
+                if line.startswith(("Private_Clean:", "Private_Dirty:")):
+                    total += int(line.split()[1])
+            return total
+    except OSError:
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def _worker_startup(mode, source, words, results):
+    """Worker body used by compare_worker_startup"""
+    before = _private_memory_kb()
+    start = time.perf_counter()
+    if mode == "shared":
+        shared = attach_shared_table(source)
+        table = shared.table
+    else:
+        shared = None
+        table = table_for_words(words)
+
+    # Touch every row so both modes have paged in the full table
+    checksum = 0
+    for i in range(table.size):
+        checksum += sum(table.row(i))
+    elapsed = time.perf_counter() - start
+    results.put((mode, elapsed, _private_memory_kb() - before, checksum))
+
+    if shared is not None:
+        shared.close()
+
+
+def compare_worker_startup(words, workers=4):
+    """
+    Start workers that either build a private table or attach to a shared one
+    Returns per-mode mean startup seconds and private kB added per worker
+    """
+    import multiprocessing
+
+    results = multiprocessing.Queue()
+    summary = {}
+    shared = publish_shared_table(words)
+    try:
+        for mode in ("private", "shared"):
+            processes = [
+                multiprocessing.Process(
+                    target=_worker_startup,
+                    args=(mode, shared.name, words, results),
+                )
+                for _ in range(workers)
+            ]
+            for process in processes:
+                process.start()
+            samples = [results.get() for _ in processes]
+            for process in processes:
+                process.join()
+
+            summary[mode] = {
+                "workers": workers,
+                "startup_seconds": sum(s[1] for s in samples) / workers,
+                "private_kb_per_worker": sum(s[2] for s in samples) / workers,
+            }
+    finally:
+        shared.close()
+
+    return summary
+
+
+def main():
+    """Print a startup time and memory comparison for the built-in word list"""
+    from app import WORD_LIST
+
+    workers = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    summary = compare_worker_startup(WORD_LIST, workers)
+    for mode, stats in summary.items():
+        print("{:8} startup {:.3f}s  private {:.0f} kB/worker".format(
+            mode, stats["startup_seconds"], stats["private_kb_per_worker"]))
+    saved = (summary["private"]["private_kb_per_worker"]
+             - summary["shared"]["private_kb_per_worker"])
+    print("Saving per extra worker: {:.0f} kB".format(saved))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Per-guess scoring benchmark for QWords
+
+Times the packed-int scoring path the game uses (encode_word, then
+code_pattern) against the string scorer it replaced (feedback_pattern),
+for single scores, single guesses and whole games played through
+make_guess. Run with --check to exit non-zero when the packed path is
+slower than the string path on any of them.
+"""
+
+import random
+import sys
+import time
+
+import app
+from encoding import code_pattern, encode_word
+from scoring import feedback_pattern
+
+# Guesses per game in the game workload
+GAME_GUESSES = 4
+
+
+def _string_score_guess(guess, target):
+    """Score an uppercase guess the way the game did before words were packed"""
+    return app.GuessResult(guess, list(app._FEEDBACK_LISTS[feedback_pattern(guess, target)]))
+
+
+def _best_of(function, repeats=3):
+    """Return the fastest of repeats wall-clock timings of function()"""
+    best = None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        function()
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
+
+
+def measure_scoring(count=20000, seed=0):
+    """
+    Return {workload: {"string": s, "packed": s}} for count random scores,
+    count guesses and count // GAME_GUESSES games
+    """
+    rng = random.Random(seed)
+    words = app.WORD_LIST
+    pairs = [(rng.choice(words), rng.choice(words)) for _ in range(count)]
+    coded = [(encode_word(guess), encode_word(target)) for guess, target in pairs]
+    games = [(rng.choice(words), [rng.choice(words) for _ in range(GAME_GUESSES)])
+             for _ in range(count // GAME_GUESSES)]
+
+    def string_scores():
+        for guess, target in pairs:
+            feedback_pattern(guess, target)
+
+    def packed_scores():
+        for guess_code, target_code in coded:
+            code_pattern(guess_code, target_code)
+
+    def string_guesses():
+        for guess, target in pairs:
+            _string_score_guess(guess.upper(), target)
+
+    def packed_guesses():
+        for guess, target in pairs:
+            app.score_guess(guess.upper(), encode_word(target))
+
+    def play(validate):
+        for target, guesses in games:
+            game = app.create_new_game(target, emit_events=False)
+            scorer = validate(target)
+            for guess in guesses:
+                app.make_guess(game, guess, validate=scorer)
+
+    return {
+        "score": {"string": _best_of(string_scores), "packed": _best_of(packed_scores)},
+        "guess": {"string": _best_of(string_guesses), "packed": _best_of(packed_guesses)},
+        "game": {
+            "string": _best_of(lambda: play(lambda target: (
+                lambda guess, _code: _string_score_guess(guess, target)))),
+            "packed": _best_of(lambda: play(lambda target: None)),
+        },
+    }
+
+
+def slower_workloads(results):
+    """Return the workloads where the packed path is slower than the string path"""
+    return [name for name, timing in results.items() if timing["packed"] > timing["string"]]
+
+
+def main():
+    count = 20000
+    check = "--check" in sys.argv
+    results = measure_scoring(count)
+    print("Best of 3 runs, {} scores (ms):".format(count))
+    for name, timing in results.items():
+        print("  {:8} string {:7.1f}  packed {:7.1f}  ({:.2f}x)".format(
+            name, timing["string"] * 1000.0, timing["packed"] * 1000.0,
+            timing["string"] / timing["packed"]))
+
+    if check and slower_workloads(results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Headless QWords game loop
+
+Plays complete games without any terminal I/O by letting a strategy pick
+guesses and submitting them through create_new_game/make_guess, so
+simulations exercise exactly the same rules as interactive play.
+"""
+
+import random
+
+from app import create_new_game, make_guess
+from feedback_tables import feedback_to_pattern
+from solver import filter_candidates
+
+
+class HeadlessResult:
+    """Outcome of one headless game"""
+
+    def __init__(self, target, guesses, won):
+        self.target = target
+        self.guesses = guesses  # Words guessed, in order
+        self.won = won
+
+    @property
+    def turns(self):
+        return len(self.guesses)
+
+    def to_dict(self):
+        return {"target": self.target, "guesses": self.guesses, "won": self.won}
+
+
+def play_headless(target, strategy, table, rng=None, emit_events=True):
+    """
+    Play one game against target using strategy and a FeedbackTable
+    emit_events=False keeps the game's events away from the event sink
+    """
+    if rng is None:
+        rng = random.Random()
+
+    game = create_new_game(target, emit_events=emit_events)
+    candidates = list(range(table.size))
+    history = []
+
+    while not game.game_over:
+        guess_index = strategy.choose(table, candidates, history, rng)
+        result = make_guess(game, table.words[guess_index])
+        pattern = feedback_to_pattern(result.feedback)
+        history.append((guess_index, pattern))
+        candidates = filter_candidates(table, candidates, guess_index, pattern)
+
+    return HeadlessResult(game.target_word, [g.word for g in game.guesses], game.won)
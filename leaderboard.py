@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+Incremental QWords leaderboards
+
+Each board keeps every player's best score in a dict plus an indexable
+skip list of (score key, sequence, player) entries, so a finished game
+updates a board in O(log n) expected time for n ranked players, "top N"
+walks only the first N entries and "rank of player X" sums link widths
+on the search path instead of scanning results. Boards exist for fewest
+guesses, fastest solve time and longest win streak, both all-time and per
+UTC day, and can be saved to and loaded from JSON.
+"""
+
+import itertools
+import json
+import random
+import time
+
+from cache import write_json_atomic
+
+CATEGORIES = ("fewest_guesses", "fastest_time", "longest_streak")
+ALL_TIME = "all_time"
+
+# Categories where a larger score is better
+_HIGHER_IS_BETTER = {"longest_streak"}
+
+# Skip list level coin flips; a private generator so ranking players never
+# moves the seeded global random state that picks target words
+_level_random = random.Random()
+
+
+class _Node:
+    __slots__ = ("value", "next", "width")
+
+    def __init__(self, value, levels):
+        self.value = value
+        self.next = [None] * levels
+        # Entries stepped over by each link, counting the one it lands on
+        self.width = [1] * levels
+
+
+class _RankedList:
+    """Sorted entries with O(log n) expected insert, remove and rank"""
+
+    MAX_LEVELS = 32
+
+    def __init__(self):
+        self._head = _Node(None, self.MAX_LEVELS)
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def __iter__(self):
+        node = self._head.next[0]
+        while node is not None:
+            yield node.value
+            node = node.next[0]
+
+    def _path(self, value, inclusive):
+        """Last node before value on every level, and its position"""
+        chain = [None] * self.MAX_LEVELS
+        positions = [0] * self.MAX_LEVELS
+        node = self._head
+        position = 0
+        for level in reversed(range(self.MAX_LEVELS)):
+            following = node.next[level]
+            while following is not None and (following.value <= value if inclusive
+                                             else following.value < value):
+                position += node.width[level]
+                node = following
+                following = node.next[level]
+            chain[level] = node
+            positions[level] = position
+        return chain, positions
+
+    def insert(self, value):
+        levels = 1
+        while levels < self.MAX_LEVELS and _level_random.random() < 0.5:
+            levels += 1
+        chain, positions = self._path(value, inclusive=True)
+        position = positions[0] + 1
+        node = _Node(value, levels)
+        for level in range(levels):
+            previous = chain[level]
+            node.next[level] = previous.next[level]
+            previous.next[level] = node
+            stepped = position - positions[level]
+            node.width[level] = previous.width[level] - stepped + 1
+            previous.width[level] = stepped
+        for level in range(levels, self.MAX_LEVELS):
+            chain[level].width[level] += 1
+        self._size += 1
+
+    def remove(self, value):
+        chain, _ = self._path(value, inclusive=False)
+        node = chain[0].next[0]
+        if node is None or node.value != value:
+            raise KeyError(value)
+        for level in range(len(node.next)):
+            previous = chain[level]
+            previous.width[level] += node.width[level] - 1
+            previous.next[level] = node.next[level]
+        for level in range(len(node.next), self.MAX_LEVELS):
+            chain[level].width[level] -= 1
+        self._size -= 1
+
+    def count_before(self, value):
+        """Number of entries that sort before value"""
+        return self._path(value, inclusive=False)[1][0]
+
+
+class Board:
+    """Best score per player, kept in rank order"""
+
+    def __init__(self, higher_is_better=False):
+        self.higher_is_better = higher_is_better
+        self._best = {}  # player -> (score, sequence)
+        self._ranking = _RankedList()  # sorted (key, sequence, player)
+        self._sequence = 0
+
+    def _key(self, score):
+        return -score if self.higher_is_better else score
+
+    def submit(self, player, score, sequence=None):
+        """Record a score; returns True if it improved the player's best"""
+        if sequence is None:
+            self._sequence += 1
+            sequence = self._sequence
+        else:
+            self._sequence = max(self._sequence, sequence)
+
+        previous = self._best.get(player)
+        if previous is not None:
+            if self._key(score) >= self._key(previous[0]):
+                return False
+            self._ranking.remove((self._key(previous[0]), previous[1], player))
+
+        self._best[player] = (score, sequence)
+        self._ranking.insert((self._key(score), sequence, player))
+        return True
+
+    def top(self, n=50):
+        """Return the best n entries as (player, score) pairs"""
+        return [(player, self._best[player][0])
+                for _, _, player in itertools.islice(self._ranking, n)]
+
+    def rank(self, player):
+        """Return the 1-based rank of player, or None if unranked"""
+        best = self._best.get(player)
+        if best is None:
+            return None
+        entry = (self._key(best[0]), best[1], player)
+        return self._ranking.count_before(entry) + 1
+
+    def score(self, player):
+        best = self._best.get(player)
+        return None if best is None else best[0]
+
+    def __len__(self):
+        return len(self._ranking)
+
+    def to_list(self):
+        return [[player, score, sequence] for player, (score, sequence) in self._best.items()]
+
+    @classmethod
+    def from_list(cls, entries, higher_is_better=False):
+        board = cls(higher_is_better)
+        for player, score, sequence in sorted(entries, key=lambda e: e[2]):
+            board.submit(player, score, sequence)
+        return board
+
+
+class Leaderboards:
+    """All-time and daily boards for every category"""
+
+    def __init__(self):
+        self.boards = {category: {} for category in CATEGORIES}
+        self.streaks = {}  # player -> current consecutive wins
+
+    def board(self, category, period=ALL_TIME, create=True):
+        """
+        Return the board for a category and period, creating it if needed
+        With create=False a missing board gives None instead
+        """
+        if category not in self.boards:
+            raise ValueError("Unknown category {!r}; expected one of {}".format(
+                category, ", ".join(CATEGORIES)))
+        periods = self.boards[category]
+        if period not in periods:
+            if not create:
+                return None
+            periods[period] = Board(category in _HIGHER_IS_BETTER)
+        return periods[period]
+
+    def record_game(self, player, game, end_time=None):
+        """Fold a finished GameState for player into every relevant board"""
+        if end_time is None:
+            end_time = time.time()
+        day = time.strftime("%Y-%m-%d", time.gmtime(end_time))
+
+        scores = {}
+        if game.won:
+            scores["fewest_guesses"] = len(game.guesses)
+            if game.start_time is not None:
+                scores["fastest_time"] = end_time - game.start_time
+            self.streaks[player] = self.streaks.get(player, 0) + 1
+            scores["longest_streak"] = self.streaks[player]
+        else:
+            self.streaks[player] = 0
+
+        for category, score in scores.items():
+            for period in (ALL_TIME, day):
+                self.board(category, period).submit(player, score)
+
+    def top(self, category, n=50, day=None):
+        board = self.board(category, day or ALL_TIME, create=False)
+        return board.top(n) if board is not None else []
+
+    def rank(self, category, player, day=None):
+        board = self.board(category, day or ALL_TIME, create=False)
+        return board.rank(player) if board is not None else None
+
+    def prune_days(self, keep_days):
+        """Drop daily boards older than the most recent keep_days days"""
+        for periods in self.boards.values():
+            days = sorted(p for p in periods if p != ALL_TIME)
+            for day in days[:-keep_days] if keep_days else days:
+                del periods[day]
+
+    def to_dict(self):
+        return {
+            "boards": {
+                category: {period: board.to_list() for period, board in periods.items()}
+                for category, periods in self.boards.items()
+            },
+            "streaks": self.streaks,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        leaderboards = cls()
+        for category, periods in data["boards"].items():
+            for period, entries in periods.items():
+                leaderboards.boards[category][period] = Board.from_list(
+                    entries, category in _HIGHER_IS_BETTER)
+        leaderboards.streaks = dict(data["streaks"])
+        return leaderboards
+
+    def save(self, path):
+        """Atomically write the leaderboards to a JSON file"""
+        write_json_atomic(path, self.to_dict())
+
+    @classmethod
+    def load(cls, path):
+        """Load leaderboards saved by save(), or start empty if none exist"""
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return cls.from_dict(json.load(f))
+        except FileNotFoundError:
+            return cls()
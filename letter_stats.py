@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Letter-frequency and positional statistics for QWords word lists
+
+LetterStats keeps compact count arrays over a set of A-Z words: how many
+words contain each letter, and how many have each letter at each
+position. Full-list statistics are cached on disk keyed by the list's
+content hash, so they are loaded rather than recomputed. CandidateStats
+starts from those counts and, once attached to a game with track(), is
+updated by make_guess after every guess by subtracting the words the
+feedback eliminated (or recounting the survivors when that is cheaper).
+"""
+
+from array import array
+
+import scoring
+from cache import LoadedCache, cache_path, read_json, word_list_hash, write_json_atomic
+
+STATS_VERSION = 1
+ALPHABET_SIZE = 26
+WORD_LENGTH = 5
+
+_ORD_A = ord("A")
+
+# Full-list statistics already loaded in this process, keyed by word list hash
+_loaded_stats = LoadedCache()
+
+
+class LetterStats:
+    """Letter and per-position letter counts over a set of words"""
+
+    def __init__(self, size=0, letters=None, positions=None):
+        self.size = size  # Number of words counted
+        # Words containing each letter at least once, indexed A=0
+        self.letters = array("L", letters or [0] * ALPHABET_SIZE)
+        # Words with each letter at each position, index position * 26 + letter
+        self.positions = array("L", positions or [0] * (ALPHABET_SIZE * WORD_LENGTH))
+
+    @classmethod
+    def from_words(cls, words):
+        """Count an iterable of A-Z words"""
+        stats = cls()
+        for word in words:
+            stats.add(word)
+        return stats
+
+    def _apply(self, word, delta):
+        word = word.upper()
+        if len(word) != WORD_LENGTH:
+            raise ValueError("Word must be exactly {} letters: {!r}".format(WORD_LENGTH, word))
+        values = [ord(letter) - _ORD_A for letter in word]
+        if not all(0 <= value < ALPHABET_SIZE for value in values):
+            raise ValueError("Word must contain only letters A-Z: {!r}".format(word))
+
+        self.size += delta
+        for value in set(values):
+            self.letters[value] += delta
+        for position, value in enumerate(values):
+            self.positions[position * ALPHABET_SIZE + value] += delta
+
+    def add(self, word):
+        """Count one more word"""
+        self._apply(word, 1)
+
+    def remove(self, word):
+        """Stop counting a word previously added"""
+        self._apply(word, -1)
+
+    def letter_count(self, letter):
+        """Number of words containing letter"""
+        return self.letters[ord(letter.upper()) - _ORD_A]
+
+    def position_count(self, position, letter):
+        """Number of words with letter at position (0-based)"""
+        return self.positions[position * ALPHABET_SIZE + ord(letter.upper()) - _ORD_A]
+
+    def letter_frequency(self, letter):
+        """Fraction of words containing letter"""
+        return self.letter_count(letter) / self.size if self.size else 0.0
+
+    def most_common(self, n=5):
+        """The n letters contained in the most words, as (letter, count)"""
+        ranked = sorted(range(ALPHABET_SIZE), key=lambda i: (-self.letters[i], i))
+        return [(chr(_ORD_A + i), self.letters[i]) for i in ranked[:n] if self.letters[i]]
+
+    def copy(self):
+        return LetterStats(self.size, self.letters, self.positions)
+
+    def to_dict(self):
+        return {
+            "size": self.size,
+            "letters": self.letters.tolist(),
+            "positions": self.positions.tolist(),
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data["size"], data["letters"], data["positions"])
+
+
+def get_word_list_stats(words, directory=None):
+    """
+    Return statistics for a full word list, loading them from the cache
+    (or computing and storing them on a miss) once per process
+    """
+    list_hash = word_list_hash(words)
+    stats = _loaded_stats.get(list_hash)
+    if stats is not None:
+        return stats
+
+    path = cache_path("letter-stats", words, directory=directory)
+    data = read_json(path)
+    if data and data.get("version") == STATS_VERSION and data.get("list_hash") == list_hash:
+        stats = LetterStats.from_dict(data["stats"])
+    else:
+        stats = LetterStats.from_words(words)
+        write_json_atomic(path, {
+            "version": STATS_VERSION,
+            "list_hash": list_hash,
+            "stats": stats.to_dict(),
+        })
+
+    _loaded_stats[list_hash] = stats
+    return stats
+
+
+class CandidateStats:
+    """Statistics over the words still consistent with a game's feedback"""
+
+    def __init__(self, words, directory=None):
+        self.candidates = [word.upper() for word in words]
+        self.stats = get_word_list_stats(words, directory).copy()
+
+    def update(self, result):
+        """Drop candidates inconsistent with a GuessResult"""
+        pattern = scoring.feedback_to_pattern(result.feedback)
+        score = scoring.score
+        guess = result.word
+        kept = []
+        removed = []
+        for word in self.candidates:
+            (kept if score(guess, word) == pattern else removed).append(word)
+
+        if len(removed) <= len(kept):
+            for word in removed:
+                self.stats.remove(word)
+        else:
+            self.stats = LetterStats.from_words(kept)
+        self.candidates = kept
+
+
+def track(game, directory=None):
+    """
+    Attach CandidateStats to an A-Z game so make_guess keeps them current
+    Guesses already made are applied straight away
+    """
+    if game.language is not None:
+        raise ValueError("Letter statistics cover A-Z word lists only")
+    if game.word_list is not None:
+        words = game.word_list.words
+    else:
+        # Games restored from snapshots do not carry their word list
+        from app import current_word_list
+        words = current_word_list().words
+
+    tracked = CandidateStats(words, directory)
+    for result in game.guesses:
+        tracked.update(result)
+    game.candidate_stats = tracked
+    return tracked
@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+"""
+Memory accounting for long-running QWords hosts
+
+memory_report() walks the live objects of each subsystem (word lists,
+feedback tables, derived data, guess results, games and render caches)
+and estimates their heap bytes with sys.getsizeof, counting every object
+once: subsystems are measured in order and anything already attributed
+is skipped, so shared words are charged to the first owner. Memory-mapped
+and shared-memory table buffers are reported separately as mapped bytes,
+since they live in the page cache rather than on the Python heap.
+Subsystems that were never imported are reported as empty rather than
+loaded.
+
+Deep mode adds tracemalloc's view of allocations grouped by source file.
+It only sees allocations made after tracing started, so hosts that want
+it start tracing early with start_tracing().
+"""
+
+import argparse
+import collections
+import gc
+import mmap
+import os
+import sys
+import time
+import types
+
+# Budget for one idle session (a new game with no guesses), including
+# allocator overhead as seen by tracemalloc
+IDLE_SESSION_BUDGET_BYTES = 1024
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+
+# Objects never walked into: code and module-level structure, not data
+_OPAQUE = (type, types.ModuleType, types.FunctionType, types.BuiltinFunctionType,
+           types.MethodType, types.CodeType)
+
+
+class Usage:
+    """Object count and byte estimates for one subsystem"""
+
+    def __init__(self, objects=0, heap_bytes=0, mapped_bytes=0):
+        self.objects = objects
+        self.heap_bytes = heap_bytes
+        self.mapped_bytes = mapped_bytes
+
+    def to_dict(self):
+        return {
+            "objects": self.objects,
+            "heap_bytes": self.heap_bytes,
+            "mapped_bytes": self.mapped_bytes,
+        }
+
+
+def measure(roots, seen=None):
+    """
+    Estimate the memory reachable from roots as a Usage, skipping ids in
+    seen (which is updated) so repeated calls never count an object twice
+    """
+    if seen is None:
+        seen = set()
+    usage = Usage(objects=len(roots))
+    stack = list(roots)
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen or isinstance(obj, _OPAQUE):
+            continue
+        seen.add(id(obj))
+
+        if isinstance(obj, mmap.mmap):
+            usage.mapped_bytes += len(obj)
+            continue
+        usage.heap_bytes += sys.getsizeof(obj)
+
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset, collections.deque)):
+            stack.extend(obj)
+        elif isinstance(obj, memoryview):
+            stack.append(obj.obj)
+        if hasattr(obj, "__dict__"):
+            stack.append(vars(obj))
+        for slot in getattr(type(obj), "__slots__", ()):
+            if hasattr(obj, slot):
+                stack.append(getattr(obj, slot))
+    return usage
+
+
+def _module(name):
+    """Return a module only if something already imported it"""
+    return sys.modules.get(name)
+
+
+def _instances(class_name, module_name):
+    """Live instances of a class found through the garbage collector"""
+    module = _module(module_name)
+    if module is None:
+        return []
+    cls = getattr(module, class_name)
+    return [obj for obj in gc.get_objects() if type(obj) is cls]
+
+
+def _feedback_tables():
+    roots = []
+    for name in ("feedback_tables", "feedback_store"):
+        module = _module(name)
+        if module is not None:
+            loaded = module._loaded_tables if name == "feedback_tables" else module._loaded_stores
+            roots.extend(loaded.values())
+    scoring = _module("scoring")
+    if scoring is not None:
+        roots.append(scoring.get_backend())
+    return roots
+
+
+def _word_lists():
+    roots = []
+    app = _module("app")
+    if app is not None:
+        roots.extend([app.WORD_LIST, app.WORD_LISTS])
+    alphabets = _module("alphabets")
+    if alphabets is not None:
+        roots.extend(alphabets._languages.values())
+    return roots
+
+
+def _derived_data():
+    roots = []
+    for module_name, attribute in (("opening_book", "_loaded_books"),
+                                   ("difficulty", "_loaded_buckets"),
+                                   ("letter_stats", "_loaded_stats")):
+        module = _module(module_name)
+        if module is not None:
+            roots.extend(getattr(module, attribute).values())
+    return roots
+
+
+def _guess_results():
+    return _instances("GuessResult", "app")
+
+
+def _games():
+    return _instances("GameState", "app")
+
+
+def _render_caches():
+    roots = []
+    app = _module("app")
+    if app is not None:
+        roots.append(app._FEEDBACK_LISTS)
+    roots.extend(_instances("Frame", "broadcast"))
+    return roots
+
+
+# Subsystems in attribution order; each returns its root objects
+SUBSYSTEMS = collections.OrderedDict([
+    ("feedback_tables", _feedback_tables),
+    ("word_lists", _word_lists),
+    ("derived_data", _derived_data),
+    ("guess_results", _guess_results),
+    ("games", _games),
+    ("render_caches", _render_caches),
+])
+
+
+def register_subsystem(name, roots):
+    """Add a subsystem measured after the built-in ones"""
+    SUBSYSTEMS[name] = roots
+
+
+def _resident_bytes():
+    """Resident set size of this process, or None where unavailable"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def start_tracing(frames=1):
+    """Start tracemalloc so deep reports can attribute later allocations"""
+    import tracemalloc
+
+    if not tracemalloc.is_tracing():
+        tracemalloc.start(frames)
+
+
+def traced_allocations(limit=10):
+    """
+    Current tracemalloc allocations grouped by source file, largest first,
+    as a list of dicts; None when tracing is off
+    """
+    import tracemalloc
+
+    if not tracemalloc.is_tracing():
+        return None
+    # Leave out the tracer and this report's own working sets
+    snapshot = tracemalloc.take_snapshot().filter_traces((
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, __file__),
+    ))
+    stats = snapshot.statistics("filename")
+    return [
+        {
+            "file": os.path.relpath(stat.traceback[0].filename, _HERE)
+            if stat.traceback[0].filename.startswith(_HERE) else stat.traceback[0].filename,
+            "bytes": stat.size,
+            "blocks": stat.count,
+        }
+        for stat in stats[:limit]
+    ]
+
+
+def memory_report(deep=False, limit=10):
+    """Return per-subsystem usage, totals and (in deep mode) traced allocations"""
+    seen = {id(SUBSYSTEMS)}
+    subsystems = collections.OrderedDict()
+    for name, roots in SUBSYSTEMS.items():
+        subsystems[name] = measure(roots(), seen).to_dict()
+
+    report = {
+        "subsystems": subsystems,
+        "heap_bytes": sum(u["heap_bytes"] for u in subsystems.values()),
+        "mapped_bytes": sum(u["mapped_bytes"] for u in subsystems.values()),
+        "resident_bytes": _resident_bytes(),
+    }
+    if deep:
+        report["traced"] = traced_allocations(limit)
+    return report
+
+
+def measure_idle_session_bytes(sessions=1000):
+    """
+    Average bytes allocated per idle session (create_new_game, no guesses)
+    measured with tracemalloc over a batch of sessions
+    """
+    import tracemalloc
+
+    from app import create_new_game
+
+    create_new_game()  # Warm lazily built word list state
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    try:
+        gc.collect()
+        before = tracemalloc.get_traced_memory()[0]
+        games = [create_new_game() for _ in range(sessions)]
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+    del games
+    return (after - before) / sessions
+
+
+def format_report(report):
+    """Render a report as text lines"""
+    lines = ["{:16} {:>9} {:>12} {:>12}".format("subsystem", "objects", "heap", "mapped")]
+    for name, usage in report["subsystems"].items():
+        lines.append("{:16} {:9} {:12,} {:12,}".format(
+            name, usage["objects"], usage["heap_bytes"], usage["mapped_bytes"]))
+    lines.append("{:16} {:9} {:12,} {:12,}".format(
+        "total", "", report["heap_bytes"], report["mapped_bytes"]))
+    if report["resident_bytes"] is not None:
+        lines.append("Process resident: {:,} bytes".format(report["resident_bytes"]))
+
+    traced = report.get("traced")
+    if traced is not None:
+        lines.append("")
+        lines.append("Traced allocations by file:")
+        for entry in traced:
+            lines.append("  {:40} {:12,} bytes {:8} blocks".format(
+                entry["file"], entry["bytes"], entry["blocks"]))
+    elif "traced" in report:
+        lines.append("Deep mode: tracemalloc is not tracing (call start_tracing() at startup)")
+    return lines
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Report QWords memory use by subsystem")
+    parser.add_argument("--sessions", type=int, default=1000,
+                        help="Sessions to create (and play --guesses into) before reporting")
+    parser.add_argument("--guesses", type=int, default=3, help="Guesses made in each session")
+    parser.add_argument("--table", action="store_true", help="Load the feedback table first")
+    parser.add_argument("--deep", action="store_true", help="Trace allocations with tracemalloc")
+    args = parser.parse_args(argv)
+
+    if args.deep:
+        start_tracing()
+
+    import random
+
+    from app import WORD_LIST, create_new_game, current_word_list, make_guess
+
+    if args.table:
+        current_word_list().table
+    rng = random.Random(0)
+    games = [create_new_game() for _ in range(args.sessions)]
+    for game in games:
+        for _ in range(args.guesses):
+            make_guess(game, rng.choice(WORD_LIST))
+
+    start = time.perf_counter()
+    report = memory_report(deep=args.deep)
+    elapsed = time.perf_counter() - start
+    for line in format_report(report):
+        print(line)
+    print("Report took {:.3f}s".format(elapsed))
+    print("Bytes per idle session: {:.0f} (budget {})".format(
+        measure_idle_session_bytes(), IDLE_SESSION_BUDGET_BYTES))
+
+
+if __name__ == "__main__":
+    main()
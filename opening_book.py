@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Opening book of best first and second guesses for a word list
+
+The best opening guess, and the best follow-up for each feedback pattern
+it can produce, depend only on the word list. The book is computed once,
+stored on disk under the list's content hash and loaded lazily on first
+use; a changed list hashes differently and gets a fresh book.
+"""
+
+from cache import LoadedCache, cache_path, read_json, word_list_hash, write_json_atomic
+from feedback_store import load_table
+from solver import best_guess, partition
+
+BOOK_VERSION = 1
+
+# Books already loaded in this process, keyed by word list hash
+_loaded_books = LoadedCache()
+
+
+class OpeningBook:
+    """Best first guess and per-pattern second guesses for one word list"""
+
+    def __init__(self, list_hash, first_guess, second_guesses):
+        self.list_hash = list_hash
+        self.first_guess = first_guess
+        self.second_guesses = second_guesses  # pattern -> word
+
+    def second_guess(self, pattern):
+        """Return the book move after the opening produced pattern, or None"""
+        return self.second_guesses.get(pattern)
+
+    def to_dict(self):
+        return {
+            "version": BOOK_VERSION,
+            "list_hash": self.list_hash,
+            "first_guess": self.first_guess,
+            "second_guesses": {str(p): w for p, w in self.second_guesses.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(
+            data["list_hash"],
+            data["first_guess"],
+            {int(p): w for p, w in data["second_guesses"].items()},
+        )
+
+
+def compute_opening_book(words, table=None, directory=None):
+    """Search the best opening and every second guess for a word list"""
+    words = [word.upper() for word in words]
+    if table is None:
+        table = load_table(words, directory)
+
+    candidates = list(range(table.size))
+    first = best_guess(table, candidates)
+
+    second_guesses = {}
+    for pattern, bucket in partition(table, first, candidates).items():
+        second_guesses[pattern] = table.words[best_guess(table, bucket)]
+
+    return OpeningBook(word_list_hash(words), table.words[first], second_guesses)
+
+
+def get_opening_book(words, directory=None):
+    """
+    Return the opening book for words, loading it from disk or computing
+    and storing it on first use
+    """
+    list_hash = word_list_hash(words)
+    book = _loaded_books.get(list_hash)
+    if book is not None:
+        return book
+
+    path = cache_path("opening-book", words, directory=directory)
+    data = read_json(path)
+    if data and data.get("version") == BOOK_VERSION and data.get("list_hash") == list_hash:
+        book = OpeningBook.from_dict(data)
+    else:
+        book = compute_opening_book(words, directory=directory)
+        write_json_atomic(path, book.to_dict())
+
+    _loaded_books[list_hash] = book
+    return book
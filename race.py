@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Race mode for QWords: many players against one shared target
+
+Every player in a race gets their own GameState, but all games share the
+same target, so a given guess word produces identical feedback for every
+player. The session therefore scores guesses through a bounded
+functools.lru_cache around score_guess keyed by the uppercase guess and
+the encoded target, so "world" and "WORLD" share an entry: repeated popular
+guesses cost a dict lookup, and the cache's hit rate is reported with the
+standings.
+"""
+
+import functools
+import random
+import sys
+import threading
+import time
+
+from app import create_new_game, get_random_word, make_guess, score_guess
+
+DEFAULT_CACHE_SIZE = 1024
+
+
+class RacePlayer:
+    """One player's game and finishing position in a race"""
+
+    def __init__(self, name, game):
+        self.name = name
+        self.game = game
+        self.finish_seconds = None  # Seconds from race start to game over
+        self.rank = None  # Finishing position among winners, from 1
+
+
+class RaceSession:
+    """A race of several players guessing the same target"""
+
+    def __init__(self, target=None, cache_size=DEFAULT_CACHE_SIZE):
+        self.target = target.upper() if target else get_random_word()
+        self.players = {}
+        self.finishers = []  # Names of players who solved it, in order
+        self.start_time = time.time()
+        self._cached_score = functools.lru_cache(maxsize=cache_size)(score_guess)
+        self._lock = threading.Lock()
+
+    def join(self, name):
+        """Add a player, returning their RacePlayer"""
+        with self._lock:
+            if name in self.players:
+                raise ValueError("Player {!r} has already joined".format(name))
+            player = RacePlayer(name, create_new_game(self.target, emit_events=False))
+            self.players[name] = player
+            return player
+
+    def guess(self, name, word):
+        """Submit a guess for a player; returns the GuessResult or None if invalid"""
+        with self._lock:
+            player = self.players.get(name)
+            if player is None:
+                raise ValueError("Unknown player {!r}".format(name))
+            result = make_guess(player.game, word, self._cached_score)
+            if result is not None and player.game.game_over:
+                player.finish_seconds = time.time() - self.start_time
+                if player.game.won:
+                    self.finishers.append(name)
+                    player.rank = len(self.finishers)
+            return result
+
+    @property
+    def winner(self):
+        """Name of the first player to solve the target, or None"""
+        return self.finishers[0] if self.finishers else None
+
+    @property
+    def is_over(self):
+        """True once every player's game has ended"""
+        return bool(self.players) and all(p.game.game_over for p in self.players.values())
+
+    def standings(self):
+        """Players ordered by finishing rank, then by guesses used"""
+        def key(player):
+            if player.rank is not None:
+                return (0, player.rank, 0)
+            return (1, player.game.game_over, player.game.current_guess)
+
+        return [
+            {
+                "name": player.name,
+                "rank": player.rank,
+                "won": player.game.won,
+                "guesses": player.game.current_guess,
+                "finish_seconds": player.finish_seconds,
+            }
+            for player in sorted(self.players.values(), key=key)
+        ]
+
+    def cache_stats(self):
+        """Hits, misses, size and hit rate of the shared scoring cache"""
+        info = self._cached_score.cache_info()
+        lookups = info.hits + info.misses
+        return {
+            "hits": info.hits,
+            "misses": info.misses,
+            "size": info.currsize,
+            "maxsize": info.maxsize,
+            "hit_rate": info.hits / lookups if lookups else 0.0,
+        }
+
+
+def simulate_race(players=50, popular=20, seed=0, cache_size=DEFAULT_CACHE_SIZE):
+    """
+    Race simulated players who draw most guesses from a small popular set
+    Returns the finished RaceSession
+    """
+    from app import WORD_LIST
+
+    rng = random.Random(seed)
+    session = RaceSession(rng.choice(WORD_LIST), cache_size)
+    names = ["player{}".format(i) for i in range(players)]
+    for name in names:
+        session.join(name)
+
+    favourites = rng.sample(WORD_LIST, popular)
+    while not session.is_over:
+        for name in names:
+            if not session.players[name].game.game_over:
+                pool = favourites if rng.random() < 0.8 else WORD_LIST
+                session.guess(name, rng.choice(pool))
+    return session
+
+
+def main():
+    """Simulate a race and report the winner and scoring cache hit rate"""
+    players = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    start = time.perf_counter()
+    session = simulate_race(players)
+    elapsed = time.perf_counter() - start
+
+    stats = session.cache_stats()
+    print("Target: {}  Players: {}  Winner: {}".format(
+        session.target, len(session.players), session.winner or "nobody"))
+    print("Scoring cache: {} hits, {} misses, hit rate {:.1%}".format(
+        stats["hits"], stats["misses"], stats["hit_rate"]))
+    print("Time: {:.3f}s".format(elapsed))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,315 @@
+#!/usr/bin/env python3
+"""
+Bulk replay of historical QWords games
+
+Historical games are streamed from an event log (game_created /
+guess_made / game_won / game_lost / quit lines written by event_sink) or
+from a JSON-lines file of game results ({"target", "guesses", "won"}, as written
+by headless and distributed runs). Each game is replayed either through
+create_new_game/make_guess ("game" engine) or by scoring its guesses
+directly with the active scoring backend ("fast" engine), and the
+replayed feedback and outcome are compared with what was recorded. With
+a strategy, each target is instead re-played by that strategy and the
+outcome and number of turns compared.
+
+Games are replayed in the language they were played in; games whose
+target cannot be created (say, a word outside its alphabet) are counted
+as skipped. Games are pulled in fixed-size batches, so only one batch and
+the games still in flight in the event log (at most max_in_flight) are
+held in memory; diffs are streamed to a callback and only the first few
+are kept in the report.
+"""
+
+import argparse
+import itertools
+import json
+import random
+import sys
+import time
+
+import scoring
+from alphabets import get_language
+from app import create_new_game, current_word_list, is_valid_word, make_guess
+from feedback_tables import ALL_CORRECT, feedback_to_pattern
+
+DEFAULT_BATCH_SIZE = 1000
+DEFAULT_MAX_DIFFS = 100
+DEFAULT_MAX_IN_FLIGHT = 10000
+ENGINES = ("fast", "game")
+MAX_GUESSES = 6
+
+
+class ReplayRecord:
+    """One historical game: its target, guesses and what was recorded"""
+
+    def __init__(self, target, guesses, patterns=None, won=None, game_id=None, language=None):
+        self.target = target
+        self.guesses = guesses
+        self.patterns = patterns  # Recorded base-3 patterns, or None
+        self.won = won  # Recorded outcome, or None if the game never finished
+        self.game_id = game_id
+        self.language = language  # Language code, or None for the built-in English rules
+
+    @classmethod
+    def from_dict(cls, data):
+        """Build a record from a game result dict; feedback is optional"""
+        feedback = data.get("feedback")
+        patterns = None
+        if feedback is not None:
+            patterns = [p if isinstance(p, int) else feedback_to_pattern(p) for p in feedback]
+        return cls(data["target"], list(data["guesses"]), patterns,
+                   data.get("won"), data.get("game_id"), data.get("language"))
+
+
+def read_event_log(path, max_in_flight=DEFAULT_MAX_IN_FLIGHT):
+    """
+    Stream ReplayRecords from an event log, yielding each game when it is
+    won, lost or quit; games still unfinished at the end of the log come
+    last. When more than max_in_flight games are open, the oldest is
+    yielded unfinished so abandoned games do not pile up in memory.
+    """
+    in_flight = {}
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            event = json.loads(line)
+            kind = event.get("type")
+            game_id = event.get("game_id")
+            if kind == "game_created":
+                in_flight[game_id] = ReplayRecord(event["target"], [], [], None, game_id,
+                                                  event.get("language"))
+                if len(in_flight) > max_in_flight:
+                    yield in_flight.pop(next(iter(in_flight)))
+            elif kind == "guess_made":
+                record = in_flight.get(game_id)
+                if record is not None:
+                    record.guesses.append(event["guess"])
+                    record.patterns.append(feedback_to_pattern(event["feedback"]))
+            elif kind in ("game_won", "game_lost"):
+                record = in_flight.pop(game_id, None)
+                if record is not None:
+                    record.won = kind == "game_won"
+                    yield record
+            elif kind == "quit":
+                # Replayed as it stood when the player left
+                record = in_flight.pop(game_id, None)
+                if record is not None:
+                    yield record
+    for record in in_flight.values():
+        yield record
+
+
+def read_game_results(path):
+    """Stream ReplayRecords from a JSON-lines file of game result dicts"""
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield ReplayRecord.from_dict(json.loads(line))
+
+
+def _replay_game(record):
+    """
+    Replay through create_new_game/make_guess; returns (patterns, won)
+    Raises ValueError when the target is not valid in the record's language
+    """
+    game = create_new_game(record.target, language=record.language, emit_events=False)
+    patterns = []
+    for guess in record.guesses:
+        result = make_guess(game, guess)
+        patterns.append(None if result is None else feedback_to_pattern(result.feedback))
+    return patterns, game.won
+
+
+def _replay_fast(record):
+    """
+    Score the guesses directly with the active backend (or the record's
+    language rules); returns (patterns, won)
+    Raises ValueError when the target is not valid in the record's language
+    """
+    if record.language is None:
+        score = scoring.score
+        is_valid = is_valid_word
+        spell = str.upper
+        if not is_valid_word(record.target):
+            raise ValueError("Target word must be 5 letters A-Z: {!r}".format(record.target))
+        target = record.target.upper()
+    else:
+        rules = get_language(record.language)
+        score = rules.score
+        is_valid = rules.is_valid_word
+        spell = rules.normalize
+        target = rules.normalize(record.target)
+    patterns = []
+    turns = 0
+    won = False
+    for guess in record.guesses:
+        if won or turns >= MAX_GUESSES or not is_valid(guess):
+            patterns.append(None)
+            continue
+        pattern = score(spell(guess), target)
+        patterns.append(pattern)
+        turns += 1
+        won = pattern == ALL_CORRECT
+    return patterns, won
+
+
+class ReplayReport:
+    """Totals, diffs and throughput of one replay run"""
+
+    def __init__(self, max_diffs=DEFAULT_MAX_DIFFS):
+        self.games = 0
+        self.guesses = 0
+        self.skipped = 0
+        self.feedback_diffs = 0
+        self.outcome_diffs = 0
+        self.recorded_turns = 0
+        self.replayed_turns = 0
+        self.seconds = 0.0
+        self.max_diffs = max_diffs
+        self.diffs = []  # The first max_diffs diffs
+
+    @property
+    def games_per_second(self):
+        return self.games / self.seconds if self.seconds else 0.0
+
+    def to_dict(self):
+        return {
+            "games": self.games,
+            "guesses": self.guesses,
+            "skipped": self.skipped,
+            "feedback_diffs": self.feedback_diffs,
+            "outcome_diffs": self.outcome_diffs,
+            "recorded_turns": self.recorded_turns,
+            "replayed_turns": self.replayed_turns,
+            "seconds": self.seconds,
+            "games_per_second": self.games_per_second,
+            "diffs": self.diffs,
+        }
+
+
+def replay_games(records, engine="fast", strategy=None, batch_size=DEFAULT_BATCH_SIZE,
+                 on_diff=None, on_batch=None, max_diffs=DEFAULT_MAX_DIFFS, seed=0):
+    """
+    Replay an iterable of ReplayRecords and return a ReplayReport
+    engine is 'fast' or 'game'; strategy (a registered name) re-plays each
+    target with that strategy instead of the recorded guesses. on_diff is
+    called with every diff dict and on_batch with the report after each batch.
+    Replayed games emit no events; live games keep emitting as usual.
+    """
+    if engine not in ENGINES:
+        raise ValueError("engine must be one of {}".format(", ".join(ENGINES)))
+
+    report = ReplayReport(max_diffs)
+    replay = _replay_game if engine == "game" else _replay_fast
+    if strategy is not None:
+        from headless import play_headless
+        from strategies import get_strategy
+
+        strategy = get_strategy(strategy)
+        table = current_word_list().table
+        rng = random.Random(seed)
+
+    def diff(entry):
+        if len(report.diffs) < max_diffs:
+            report.diffs.append(entry)
+        if on_diff is not None:
+            on_diff(entry)
+
+    start = time.perf_counter()
+    records = iter(records)
+    while True:
+        batch = list(itertools.islice(records, batch_size))
+        if not batch:
+            break
+
+        for record in batch:
+            if strategy is not None:
+                if record.language not in (None, "en") or record.target.upper() not in table.index:
+                    report.skipped += 1
+                    continue
+                result = play_headless(record.target.upper(), strategy, table, rng,
+                                       emit_events=False)
+                report.games += 1
+                report.guesses += result.turns
+                report.recorded_turns += len(record.guesses)
+                report.replayed_turns += result.turns
+                if record.won is not None and result.won != record.won:
+                    report.outcome_diffs += 1
+                    diff({"kind": "outcome", "game_id": record.game_id,
+                          "target": record.target, "recorded_won": record.won,
+                          "replayed_won": result.won, "replayed_guesses": result.guesses})
+                continue
+
+            try:
+                patterns, won = replay(record)
+            except ValueError:
+                report.skipped += 1
+                continue
+            report.games += 1
+            report.guesses += len(record.guesses)
+            report.recorded_turns += len(record.guesses)
+            report.replayed_turns += sum(p is not None for p in patterns)
+            if record.patterns is not None:
+                for turn, (recorded, replayed) in enumerate(zip(record.patterns, patterns), 1):
+                    if recorded != replayed:
+                        report.feedback_diffs += 1
+                        diff({"kind": "feedback", "game_id": record.game_id,
+                              "target": record.target, "turn": turn,
+                              "guess": record.guesses[turn - 1],
+                              "recorded": recorded, "replayed": replayed})
+            if record.won is not None and won != record.won:
+                report.outcome_diffs += 1
+                diff({"kind": "outcome", "game_id": record.game_id,
+                      "target": record.target, "recorded_won": record.won,
+                      "replayed_won": won})
+
+        report.seconds = time.perf_counter() - start
+        if on_batch is not None:
+            on_batch(report)
+
+    report.seconds = time.perf_counter() - start
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Replay historical QWords games and report diffs")
+    parser.add_argument("source", help="Event log or JSON-lines game results")
+    parser.add_argument("--format", choices=("events", "results"), default="events")
+    parser.add_argument("--engine", choices=ENGINES, default="fast")
+    parser.add_argument("--strategy", help="Re-play each target with this strategy instead")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument("--diffs", help="Write every diff to this JSON-lines file")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    scoring.backend_from_environment(current_word_list().words)
+    reader = read_event_log if args.format == "events" else read_game_results
+    diff_file = open(args.diffs, "w", encoding="utf-8") if args.diffs else None
+
+    def on_diff(entry):
+        diff_file.write(json.dumps(entry) + "\n")
+
+    def on_batch(report):
+        print("  {} games, {:.0f} games/s".format(report.games, report.games_per_second),
+              file=sys.stderr)
+
+    try:
+        report = replay_games(reader(args.source), args.engine, args.strategy, args.batch_size,
+                              on_diff if diff_file else None, on_batch, seed=args.seed)
+    finally:
+        if diff_file is not None:
+            diff_file.close()
+
+    print("Games: {}  Guesses: {}  Skipped: {}".format(report.games, report.guesses, report.skipped))
+    print("Feedback diffs: {}  Outcome diffs: {}".format(report.feedback_diffs, report.outcome_diffs))
+    if report.games:
+        print("Mean turns: recorded {:.3f}  replayed {:.3f}".format(
+            report.recorded_turns / report.games, report.replayed_turns / report.games))
+    print("Time: {:.2f}s ({:.0f} games/s, {:.0f} guesses/s)".format(
+        report.seconds, report.games_per_second,
+        report.guesses / report.seconds if report.seconds else 0.0))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,340 @@
+#!/usr/bin/env python3
+"""
+Pluggable feedback scoring backends for QWords
+
+The game engine delegates the feedback computation to the active backend.
+Backends share one interface: prepare(words) for any per-word-list setup,
+score_code(guess_code, target_code) for a single base-3 pattern of two
+encoded words (the game engine's path), score(guess, target) for the same
+on uppercase strs, and score_row(guess) for the patterns of one guess
+against every prepared word. Available backends:
+
+    reference - the pure-Python two-pass algorithm (always available)
+    table     - lookups in the precomputed feedback table
+    numpy     - vectorized rows over a letter matrix (requires NumPy)
+
+select_backend() benchmarks the available backends on the current word
+list and activates the fastest; check_equivalence() verifies a backend
+against the reference on every pair, including duplicate-letter cases.
+Patterns use absent=0, present=1, correct=2 with position i weighted by
+3**i. This module imports nothing heavy so the game can start quickly.
+"""
+
+import os
+import random
+import time
+
+from encoding import code_pattern, encode_word
+
+# Environment variable choosing a backend at startup ("auto" benchmarks)
+BACKEND_ENV = "QWORDS_SCORING_BACKEND"
+
+# Pattern digit values for each feedback state
+ABSENT = 0
+PRESENT = 1
+CORRECT = 2
+
+WORD_LENGTH = 5
+ALL_CORRECT = 3 ** WORD_LENGTH - 1
+
+FEEDBACK_NAMES = ('absent', 'present', 'correct')
+_FEEDBACK_DIGITS = {name: digit for digit, name in enumerate(FEEDBACK_NAMES)}
+
+# Duplicate-letter pairs every backend must agree on
+DUPLICATE_CASES = [
+    ("EEEEE", "SPEED"), ("PEPEP", "SPEED"), ("SPEED", "EEEEE"), ("ABBEY", "BABES"),
+    ("LLAMA", "ALLOW"), ("ALLOW", "LLAMA"), ("TREES", "STEER"), ("GEESE", "EERIE"),
+]
+
+
+def feedback_pattern(guess, target):
+    """
+    Compute the base-3 feedback pattern of guess against target with the
+    reference two-pass algorithm; both words must already be uppercase
+    """
+    digits = [None] * WORD_LENGTH
+
+    # Count letters in target for handling duplicates
+    target_counts = {}
+    for letter in target:
+        target_counts[letter] = target_counts.get(letter, 0) + 1
+
+    # First pass: mark correct positions
+    for i in range(WORD_LENGTH):
+        if guess[i] == target[i]:
+            digits[i] = CORRECT
+            target_counts[guess[i]] -= 1
+
+    # Second pass: mark present/absent for non-correct positions
+    pattern = 0
+    weight = 1
+    for i in range(WORD_LENGTH):
+        if digits[i] is None:
+            if target_counts.get(guess[i], 0) > 0:
+                digits[i] = PRESENT
+                target_counts[guess[i]] -= 1
+            else:
+                digits[i] = ABSENT
+        pattern += digits[i] * weight
+        weight *= 3
+
+    return pattern
+
+
+def feedback_to_pattern(feedback):
+    """Convert a GuessResult feedback list into its base-3 pattern"""
+    pattern = 0
+    weight = 1
+    for state in feedback:
+        pattern += _FEEDBACK_DIGITS[state] * weight
+        weight *= 3
+    return pattern
+
+
+def pattern_to_feedback(pattern, length=WORD_LENGTH):
+    """Convert a base-3 pattern back into a GuessResult feedback list"""
+    feedback = []
+    for _ in range(length):
+        feedback.append(FEEDBACK_NAMES[pattern % 3])
+        pattern //= 3
+    return feedback
+
+
+class ReferenceBackend:
+    """Score words directly with the two-pass algorithm"""
+
+    name = "reference"
+
+    @staticmethod
+    def available():
+        return True
+
+    def prepare(self, words):
+        self.words = [word.upper() for word in words]
+
+    def score(self, guess, target):
+        return feedback_pattern(guess, target)
+
+    # The packed scorer itself, so score_code adds no extra call
+    score_code = staticmethod(code_pattern)
+
+    def score_row(self, guess):
+        return [feedback_pattern(guess, target) for target in self.words]
+
+
+class TableBackend:
+    """Look patterns up in the precomputed (cached, mmapped) feedback table"""
+
+    name = "table"
+
+    @staticmethod
+    def available():
+        return True
+
+    def prepare(self, words):
+        from feedback_store import load_table
+
+        self.table = load_table([word.upper() for word in words])
+        self.index = self.table.index
+        self.code_index = {encode_word(word): i for word, i in self.index.items()}
+
+    def score(self, guess, target):
+        index = self.index
+        if guess in index and target in index:
+            return self.table.pattern_at(index[guess], index[target])
+        return feedback_pattern(guess, target)
+
+    def score_code(self, guess_code, target_code):
+        index = self.code_index
+        if guess_code in index and target_code in index:
+            return self.table.pattern_at(index[guess_code], index[target_code])
+        return code_pattern(guess_code, target_code)
+
+    def score_row(self, guess):
+        if guess in self.index:
+            return self.table.row(self.index[guess])
+        return [feedback_pattern(guess, target) for target in self.table.words]
+
+
+class NumpyBackend:
+    """Vectorized scoring of one guess against every word at once"""
+
+    name = "numpy"
+
+    @staticmethod
+    def available():
+        try:
+            import numpy  # noqa: F401
+        except ImportError:
+            return False
+        return True
+
+    def prepare(self, words):
+        import numpy
+
+        self.np = numpy
+        self.words = [word.upper() for word in words]
+        self.letters = numpy.array([[ord(c) for c in word] for word in self.words],
+                                   dtype=numpy.int32)
+        self.weights = 3 ** numpy.arange(WORD_LENGTH)
+
+    def score(self, guess, target):
+        return feedback_pattern(guess, target)
+
+    score_code = staticmethod(code_pattern)
+
+    def score_row(self, guess):
+        np = self.np
+        letters = self.letters
+        g = [ord(c) for c in guess]
+
+        correct = letters == np.array(g, dtype=np.int32)
+        patterns = (correct * CORRECT) @ self.weights
+        unmatched = np.where(correct, -1, letters)
+        for i in range(WORD_LENGTH):
+            # Target copies of the letter not matched in place, minus those
+            # already claimed by earlier non-correct guess positions
+            available = (unmatched == g[i]).sum(axis=1)
+            claimed = np.zeros(len(self.words), dtype=np.int64)
+            for j in range(i):
+                if g[j] == g[i]:
+                    claimed += ~correct[:, j]
+            present = ~correct[:, i] & (available > claimed)
+            patterns += present * self.weights[i]
+        return patterns.astype(np.uint8)
+
+
+# Registered backend classes by name
+BACKENDS = {}
+
+_active = ReferenceBackend()
+
+
+def register_backend(backend_class):
+    """Add a backend class to the registry"""
+    BACKENDS[backend_class.name] = backend_class
+    return backend_class
+
+
+for _backend_class in (ReferenceBackend, TableBackend, NumpyBackend):
+    register_backend(_backend_class)
+
+
+def available_backends():
+    """Return the names of backends usable in this environment"""
+    return [name for name, cls in BACKENDS.items() if cls.available()]
+
+
+def get_backend():
+    """Return the active backend"""
+    return _active
+
+
+def set_backend(name, words):
+    """Prepare the named backend for words and make it active"""
+    global _active
+    if name not in BACKENDS:
+        raise ValueError("Unknown scoring backend {!r}; expected one of {}".format(
+            name, ", ".join(BACKENDS)))
+    if not BACKENDS[name].available():
+        raise ValueError("Scoring backend {!r} is not available".format(name))
+    backend = BACKENDS[name]()
+    backend.prepare(words)
+    _active = backend
+    return backend
+
+
+def score(guess, target):
+    """Score one uppercase guess against an uppercase target"""
+    return _active.score(guess, target)
+
+
+def score_code(guess_code, target_code):
+    """Score one encoded guess against an encoded target"""
+    return _active.score_code(guess_code, target_code)
+
+
+def benchmark_backends(words, rows=20, singles=2000, seed=0):
+    """
+    Time each available backend on a sample workload for this word list:
+    prepare, rows full rows (scales with list size) plus singles single
+    scores of encoded pairs through score_code, the path games use
+    Returns {name: {"prepare": s, "rows": s, "singles": s, "total": s}},
+    where total includes prepare, since a cold backend pays it once
+    """
+    words = [word.upper() for word in words]
+    rng = random.Random(seed)
+    row_guesses = [rng.choice(words) for _ in range(rows)]
+    pairs = [(encode_word(rng.choice(words)), encode_word(rng.choice(words)))
+             for _ in range(singles)]
+
+    report = {}
+    for name in available_backends():
+        backend = BACKENDS[name]()
+        start = time.perf_counter()
+        backend.prepare(words)
+        prepared = time.perf_counter()
+        for guess in row_guesses:
+            backend.score_row(guess)
+        rowed = time.perf_counter()
+        for guess_code, target_code in pairs:
+            backend.score_code(guess_code, target_code)
+        done = time.perf_counter()
+        report[name] = {
+            "prepare": prepared - start,
+            "rows": rowed - prepared,
+            "singles": done - rowed,
+            "total": done - start,
+        }
+    return report
+
+
+def select_backend(words, **benchmark_options):
+    """
+    Benchmark available backends on words and activate the fastest,
+    counting each backend's prepare time
+    """
+    report = benchmark_backends(words, **benchmark_options)
+    fastest = min(report, key=lambda name: report[name]["total"])
+    set_backend(fastest, words)
+    return fastest, report
+
+
+def backend_from_environment(words):
+    """Activate the backend named by QWORDS_SCORING_BACKEND, if set"""
+    name = os.environ.get(BACKEND_ENV)
+    if not name:
+        return None
+    if name == "auto":
+        return select_backend(words)[0]
+    set_backend(name, words)
+    return name
+
+
+def check_equivalence(name, words):
+    """
+    Compare a backend with the reference on every word pair and on the
+    duplicate-letter cases; returns a list of mismatching (guess, target)
+    The case words are prepared with the list so that score_row (table
+    rows, vectorized rows) sees them, not just the single-score fallback
+    """
+    words = [word.upper() for word in words]
+    for pair in DUPLICATE_CASES:
+        for word in pair:
+            if word not in words:
+                words.append(word)
+    backend = BACKENDS[name]()
+    backend.prepare(words)
+
+    mismatches = []
+    for guess in words:
+        row = backend.score_row(guess)
+        for target, pattern in zip(words, row):
+            if pattern != feedback_pattern(guess, target):
+                mismatches.append((guess, target))
+    for guess, target in DUPLICATE_CASES:
+        expected = feedback_pattern(guess, target)
+        if (backend.score(guess, target) != expected
+                or backend.score_code(encode_word(guess), encode_word(target)) != expected):
+            mismatches.append((guess, target))
+    return mismatches
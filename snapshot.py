@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Compact binary snapshots of QWords sessions
+
+A GameState packs into a fixed 25-byte header (target word code, game id,
+start time, flags, max guesses, guess count, language code) plus 5 bytes
+per guess (word code and base-3 feedback pattern). English words use the
+5-bit packed encoding; language games use their alphabet's encoding and
+width, so they restore with their own rules. Encode/decode results are
+memoized so bulk snapshot and restore of large session tables stay in the
+microseconds-per-session range. Version 1 files (English only, no
+language code) can still be restored.
+"""
+
+import functools
+import gc
+import os
+import struct
+
+from app import GameState, GuessResult
+from encoding import decode_word, encode_word, letter_values
+from feedback_tables import feedback_to_pattern, pattern_to_feedback
+
+SNAPSHOT_VERSION = 2
+
+_FILE_HEADER = struct.Struct("<4sBI")
+_MAGIC = b"QWSS"
+_GAME = struct.Struct("<I8sdBBB2s")
+# Game header layouts by file version
+_GAME_FORMATS = {1: struct.Struct("<I8sdBBB"), 2: _GAME}
+_GUESS = struct.Struct("<IB")
+_ID_LENGTH = struct.Struct("<H")
+
+_FLAG_OVER = 1
+_FLAG_WON = 2
+
+
+@functools.lru_cache(maxsize=65536)
+def _encode(word, language=None):
+    """Packed code of word under the game's language (None for English)"""
+    if language is None:
+        return encode_word(word)
+    from alphabets import get_language
+    return get_language(language).encode(word)
+
+
+@functools.lru_cache(maxsize=65536)
+def _decode(code, language=None):
+    """Canonical spelling of a packed code under the game's language"""
+    if language is None:
+        return decode_word(code)
+    from alphabets import get_language
+    alphabet = get_language(language).alphabet
+    return alphabet.join(letter_values(code, alphabet.bits))
+
+
+_pattern = functools.lru_cache(maxsize=1024)(lambda feedback: feedback_to_pattern(feedback))
+_feedback = functools.lru_cache(maxsize=1024)(lambda pattern: tuple(pattern_to_feedback(pattern)))
+
+
+def _pack_game(game, parts):
+    """Append the packed form of one game to parts"""
+    game_id = bytes.fromhex(game.game_id) if game.game_id else b""
+    flags = (_FLAG_OVER if game.game_over else 0) | (_FLAG_WON if game.won else 0)
+    start_time = game.start_time if game.start_time is not None else -1.0
+    language = game.language
+    code = language.encode("ascii") if language is not None else b""
+    parts.append(_GAME.pack(_encode(game.target_word, language), game_id, start_time,
+                            flags, game.max_guesses, len(game.guesses), code))
+    for guess in game.guesses:
+        parts.append(_GUESS.pack(_encode(guess.word, language), _pattern(tuple(guess.feedback))))
+
+
+def _unpack_game(data, offset, game_format=_GAME):
+    """Rebuild one game from data at offset; returns (game, next offset)"""
+    fields = game_format.unpack_from(data, offset)
+    target, game_id, start_time, flags, max_guesses, count = fields[:6]
+    language = None
+    if len(fields) > 6:
+        language = fields[6].rstrip(b"\0").decode("ascii") or None
+    offset += game_format.size
+
+    game = GameState()
+    game.language = language
+    game.target_word = _decode(target, language)
+    game.target_code = target
+    game.game_id = game_id.hex() if game_id.strip(b"\0") else None
+    game.start_time = start_time if start_time >= 0 else None
+    game.game_over = bool(flags & _FLAG_OVER)
+    game.won = bool(flags & _FLAG_WON)
+    game.max_guesses = max_guesses
+    for word, pattern in _GUESS.iter_unpack(data[offset:offset + count * _GUESS.size]):
+        game.guesses.append(GuessResult(_decode(word, language), list(_feedback(pattern))))
+    game.current_guess = count
+    return game, offset + count * _GUESS.size
+
+
+def snapshot_game(game):
+    """Serialize a single GameState to bytes"""
+    parts = []
+    _pack_game(game, parts)
+    return b"".join(parts)
+
+
+def restore_game(data):
+    """Rebuild a GameState from snapshot_game bytes"""
+    return _unpack_game(memoryview(data), 0)[0]
+
+
+def snapshot_sessions(sessions):
+    """Serialize a mapping of session id (str) to GameState"""
+    parts = [_FILE_HEADER.pack(_MAGIC, SNAPSHOT_VERSION, len(sessions))]
+    for session_id, game in sessions.items():
+        encoded_id = session_id.encode("utf-8")
+        parts.append(_ID_LENGTH.pack(len(encoded_id)))
+        parts.append(encoded_id)
+        _pack_game(game, parts)
+    return b"".join(parts)
+
+
+def restore_sessions(data):
+    """Rebuild the session mapping written by snapshot_sessions"""
+    data = memoryview(data)
+    magic, version, count = _FILE_HEADER.unpack_from(data, 0)
+    if magic != _MAGIC or version not in _GAME_FORMATS:
+        raise ValueError("Not a version {} session snapshot".format(SNAPSHOT_VERSION))
+    game_format = _GAME_FORMATS[version]
+
+    sessions = {}
+    offset = _FILE_HEADER.size
+    # Bulk allocation of acyclic objects would otherwise trigger repeated
+    # full garbage collections that dominate restore time
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(count):
+            (length,) = _ID_LENGTH.unpack_from(data, offset)
+            offset += _ID_LENGTH.size
+            session_id = bytes(data[offset:offset + length]).decode("utf-8")
+            offset += length
+            sessions[session_id], offset = _unpack_game(data, offset, game_format)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return sessions
+
+
+def save_sessions(path, sessions):
+    """Atomically write a bulk snapshot to path"""
+    tmp_path = "{}.{}.tmp".format(path, os.getpid())
+    with open(tmp_path, "wb") as f:
+        f.write(snapshot_sessions(sessions))
+    os.replace(tmp_path, path)
+
+
+def load_sessions(path):
+    """Read a bulk snapshot written by save_sessions"""
+    with open(path, "rb") as f:
+        return restore_sessions(f.read())
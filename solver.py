@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Candidate filtering and guess selection for QWords solvers
+
+All functions work on word indexes into a FeedbackTable, so choosing a
+guess is a matter of byte lookups rather than re-scoring words.
+"""
+
+import math
+from collections import Counter
+from operator import itemgetter
+
+
+def _patterns_for(table, guess_index, candidates):
+    """Return the patterns of one guess against a list of candidate indexes"""
+    row = table.row(guess_index)
+    if len(candidates) == table.size:
+        return bytes(row)
+    if len(candidates) == 1:
+        return (row[candidates[0]],)
+    return itemgetter(*candidates)(bytes(row))
+
+
+def partition(table, guess_index, candidates):
+    """Group candidate indexes by the pattern the guess would produce"""
+    groups = {}
+    for candidate, pattern in zip(candidates, _patterns_for(table, guess_index, candidates)):
+        groups.setdefault(pattern, []).append(candidate)
+    return groups
+
+
+def filter_candidates(table, candidates, guess_index, pattern):
+    """Keep the candidates consistent with seeing pattern for a guess"""
+    row = table.row(guess_index)
+    return [c for c in candidates if row[c] == pattern]
+
+
+def expected_remaining(table, guess_index, candidates):
+    """Expected number of candidates left after playing a guess"""
+    counts = Counter(_patterns_for(table, guess_index, candidates))
+    return sum(size * size for size in counts.values()) / len(candidates)
+
+
+def entropy(table, guess_index, candidates):
+    """Information in bits gained on average by playing a guess"""
+    counts = Counter(_patterns_for(table, guess_index, candidates))
+    total = len(candidates)
+    return -sum(size / total * math.log2(size / total) for size in counts.values())
+
+
+def best_entropy_guess(table, candidates, guesses=None):
+    """
+    Pick the guess index maximizing the entropy of its feedback
+    Ties prefer guesses that could themselves be the answer
+    """
+    if len(candidates) <= 2:
+        return candidates[0]
+
+    if guesses is None:
+        guesses = range(table.size)
+    candidate_set = set(candidates)
+
+    best = None
+    best_key = None
+    for guess_index in guesses:
+        key = (-entropy(table, guess_index, candidates), guess_index not in candidate_set)
+        if best_key is None or key < best_key:
+            best = guess_index
+            best_key = key
+    return best
+
+
+def best_guess(table, candidates, guesses=None):
+    """
+    Pick the guess index minimizing the expected remaining candidates
+    Ties prefer guesses that could themselves be the answer
+    """
+    if len(candidates) <= 2:
+        return candidates[0]
+
+    if guesses is None:
+        guesses = range(table.size)
+    candidate_set = set(candidates)
+
+    best = None
+    best_key = None
+    for guess_index in guesses:
+        key = (expected_remaining(table, guess_index, candidates),
+               guess_index not in candidate_set)
+        if best_key is None or key < best_key:
+            best = guess_index
+            best_key = key
+    return best
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Startup-time benchmark for QWords
+
+Measures, in fresh interpreter processes, the time from launch to the
+first menu prompt and to the first scored guess, alongside a bare
+interpreter baseline. Results are compared against STARTUP_BUDGET_MS so
+short-lived processes (one per scripted game or worker) stay cheap to
+spawn. Run with --check to exit non-zero when a budget is exceeded.
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+# Milliseconds allowed on top of bare interpreter startup
+STARTUP_BUDGET_MS = {
+    "first_prompt": 50,
+    "first_scored_guess": 50,
+}
+
+# Modules that must not be imported just to start a game
+LAZY_MODULES = (
+    "json", "threading", "queue", "multiprocessing", "mmap",
+    "event_sink", "feedback_tables", "solver",
+    "opening_book", "difficulty", "cache", "letter_stats",
+)
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+
+_FIRST_GUESS_SCRIPT = (
+    "import app\n"
+    "game = app.create_new_game()\n"
+    "app.make_guess(game, 'ABOUT')\n"
+)
+
+
+def _time_command(args, until=None):
+    """Run a command and return wall seconds until exit or a stdout marker"""
+    start = time.perf_counter()
+    process = subprocess.Popen(args, cwd=_HERE, stdin=subprocess.PIPE,
+                               stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+    if until is None:
+        process.communicate()
+        return time.perf_counter() - start
+
+    seen = b""
+    while until not in seen:
+        chunk = process.stdout.read1(4096)
+        if not chunk:
+            raise RuntimeError("Process exited before printing {!r}".format(until))
+        seen += chunk
+    elapsed = time.perf_counter() - start
+    process.kill()
+    process.communicate()
+    return elapsed
+
+
+def measure_startup(runs=10):
+    """Return median milliseconds for the baseline and each startup path"""
+    commands = {
+        "interpreter": ([sys.executable, "-c", "pass"], None),
+        "first_prompt": ([sys.executable, "app.py"], b"Select an option"),
+        "first_scored_guess": ([sys.executable, "-c", _FIRST_GUESS_SCRIPT], None),
+    }
+    results = {}
+    for name, (args, until) in commands.items():
+        samples = [_time_command(args, until) for _ in range(runs)]
+        results[name] = statistics.median(samples) * 1000.0
+    return results
+
+
+def eagerly_imported(modules=LAZY_MODULES):
+    """Return which of modules a plain `import app` loads"""
+    script = "import sys, app; print(' '.join(sorted(sys.modules)))"
+    output = subprocess.check_output([sys.executable, "-c", script], cwd=_HERE)
+    loaded = set(output.decode().split())
+    return [name for name in modules if name in loaded]
+
+
+def over_budget(results):
+    """Return the startup paths whose overhead exceeds their budget"""
+    baseline = results["interpreter"]
+    return [name for name, budget in STARTUP_BUDGET_MS.items()
+            if results[name] - baseline > budget]
+
+
+def main():
+    runs = 10
+    check = "--check" in sys.argv
+    results = measure_startup(runs)
+    baseline = results["interpreter"]
+    print("Median of {} runs (ms):".format(runs))
+    for name, value in results.items():
+        if name == "interpreter":
+            print("  {:20} {:7.1f}".format(name, value))
+        else:
+            print("  {:20} {:7.1f}  (+{:.1f}, budget +{})".format(
+                name, value, value - baseline, STARTUP_BUDGET_MS[name]))
+
+    eager = eagerly_imported()
+    if eager:
+        print("Imported eagerly: {}".format(", ".join(eager)))
+
+    if check and (eager or over_budget(results)):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
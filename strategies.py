@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Guessing strategies for headless QWords games
+
+A strategy picks the next guess index given the feedback table, the
+sorted indexes of candidates still consistent with the feedback so far,
+the history of (guess_index, pattern) pairs and a random generator.
+Strategies with one-off precomputation expose prepare(table), which
+callers may run ahead of play so it is not counted as decision time.
+"""
+
+from collections import Counter
+
+from feedback_tables import ALL_CORRECT
+from opening_book import get_opening_book
+from solver import best_entropy_guess, best_guess, partition
+
+
+class RandomConsistentStrategy:
+    """Guess a uniformly random word still consistent with all feedback"""
+
+    name = "random-consistent"
+
+    def choose(self, table, candidates, history, rng):
+        return rng.choice(candidates)
+
+
+class BookOpeningStrategy:
+    """
+    Open with the opening book's first guess, then guess a random
+    consistent word; models a player who knows a good opener
+    """
+
+    name = "book-opening"
+
+    def choose(self, table, candidates, history, rng):
+        if not history:
+            return table.index[get_opening_book(table.words).first_guess]
+        return rng.choice(candidates)
+
+
+class ExpectedSizeStrategy:
+    """Follow the opening book, then minimize expected remaining candidates"""
+
+    name = "expected-size"
+
+    def choose(self, table, candidates, history, rng):
+        book = get_opening_book(table.words)
+        if not history:
+            return table.index[book.first_guess]
+        if len(history) == 1:
+            word = book.second_guess(history[0][1])
+            if word is not None:
+                return table.index[word]
+        return best_guess(table, candidates)
+
+
+class LetterFrequencyStrategy:
+    """
+    Guess the consistent word whose distinct letters are most common
+    among the remaining candidates; cheap, with no lookahead
+    """
+
+    name = "letter-frequency"
+
+    def __init__(self):
+        self._openers = {}  # Word list -> first guess index
+
+    def _most_frequent(self, table, candidates):
+        words = table.words
+        counts = Counter()
+        for candidate in candidates:
+            counts.update(set(words[candidate]))
+        return max(candidates, key=lambda c: sum(counts[letter] for letter in set(words[c])))
+
+    def prepare(self, table):
+        """Compute the opening guess, which scans the whole word list"""
+        if table.words not in self._openers:
+            self._openers[table.words] = self._most_frequent(table, list(range(table.size)))
+
+    def choose(self, table, candidates, history, rng):
+        if not history:
+            self.prepare(table)
+            return self._openers[table.words]
+        return self._most_frequent(table, candidates)
+
+
+class EntropyStrategy:
+    """Play the guess whose feedback carries the most information"""
+
+    name = "entropy"
+
+    def __init__(self):
+        self._openers = {}  # Word list -> first guess index
+
+    def prepare(self, table):
+        """Compute the opening guess, the most expensive decision"""
+        if table.words not in self._openers:
+            self._openers[table.words] = best_entropy_guess(table, list(range(table.size)))
+
+    def choose(self, table, candidates, history, rng):
+        if not history:
+            self.prepare(table)
+            return self._openers[table.words]
+        return best_entropy_guess(table, candidates)
+
+
+class DecisionTreeStrategy:
+    """
+    Follow a decision tree of expected-size choices keyed by the feedback
+    history, so every position is solved once and replayed as a dict lookup
+    """
+
+    name = "decision-tree"
+
+    def __init__(self):
+        self._policy = ExpectedSizeStrategy()
+        self._trees = {}  # Word list -> {history: guess index}
+
+    def _node(self, tree, table, candidates, history, rng):
+        guess = tree.get(history)
+        if guess is None:
+            guess = self._policy.choose(table, candidates, list(history), rng)
+            tree[history] = guess
+        return guess
+
+    def prepare(self, table, max_depth=6):
+        """Grow the whole tree up to max_depth guesses"""
+        tree = self._trees.setdefault(table.words, {})
+        stack = [((), list(range(table.size)))]
+        while stack:
+            history, candidates = stack.pop()
+            guess = self._node(tree, table, candidates, history, None)
+            if len(history) + 1 >= max_depth:
+                continue
+            for pattern, group in partition(table, guess, candidates).items():
+                if pattern != ALL_CORRECT:
+                    stack.append((history + ((guess, pattern),), group))
+
+    def choose(self, table, candidates, history, rng):
+        tree = self._trees.setdefault(table.words, {})
+        return self._node(tree, table, candidates, tuple(history), rng)
+
+
+# Strategies selectable by name (for workers and command-line tools)
+STRATEGIES = {
+    strategy.name: strategy
+    for strategy in (RandomConsistentStrategy, BookOpeningStrategy, ExpectedSizeStrategy,
+                     LetterFrequencyStrategy, EntropyStrategy, DecisionTreeStrategy)
+}
+
+
+def get_strategy(name):
+    """Instantiate a strategy by its registered name"""
+    try:
+        return STRATEGIES[name]()
+    except KeyError:
+        raise ValueError("Unknown strategy {!r}; expected one of {}".format(
+            name, ", ".join(sorted(STRATEGIES))))
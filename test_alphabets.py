@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Unit tests for per-language alphabets and non-English games
+"""
+
+import pytest
+import sys
+import os
+
+# Add parent directory to path to import app module
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import create_new_game, make_guess, validate_guess
+from alphabets import Alphabet, get_language
+from feedback_tables import table_for_words
+from scoring import feedback_pattern
+
+
+class TestAlphabet:
+    """Test cases for normalization and letter encoding"""
+
+    def test_decomposed_input_normalizes(self):
+        """Test that N + combining tilde is the single letter Ñ"""
+        spanish = get_language("es")
+        assert spanish.normalize("NIN\u0303OS") == "NIÑOS"
+        assert spanish.normalize("niños") == "NIÑOS"
+
+    def test_lowercase_sharp_s_keeps_length(self):
+        """Test that ß maps to ẞ instead of expanding to SS"""
+        german = get_language("de")
+        assert german.normalize("grüße") == "GRÜẞE"
+        assert german.is_valid_word("grüße")
+
+    def test_letters_outside_alphabet_rejected(self):
+        """Test that other scripts and accents are not letters here"""
+        spanish = get_language("es")
+        assert not spanish.is_valid_word("GRÜẞE")
+        assert not spanish.is_valid_word("СЛОВО")
+        assert not get_language("en").is_valid_word("ÉCOLE")
+
+    def test_wide_alphabet_uses_more_bits(self):
+        """Test that 33 Cyrillic letters need six bits per letter"""
+        assert get_language("ru").alphabet.bits == 6
+        assert get_language("es").alphabet.bits == 5
+
+    def test_multi_codepoint_letters(self):
+        """Test that alphabets may define digraph letters"""
+        alphabet = Alphabet(["A", "IJ", "S"])
+        assert alphabet.tokenize("ijsas") == (2, 3, 1, 3)
+
+    def test_unknown_language(self):
+        """Test that an unknown language raises ValueError"""
+        with pytest.raises(ValueError):
+            get_language("xx")
+
+
+class TestLanguageScoring:
+    """Test cases for scoring on language encodings"""
+
+    @pytest.mark.parametrize("code", ["es", "de", "ru"])
+    def test_matches_string_reference(self, code):
+        """Test encoded scoring against the string algorithm on canonical words"""
+        language = get_language(code)
+        for guess in language.words:
+            for target in language.words:
+                assert language.score(guess, target) == feedback_pattern(guess, target)
+
+    def test_english_matches_validate_guess(self):
+        """Test that English rules agree with validate_guess"""
+        english = get_language("en")
+        for guess, target in [("EEEEE", "SPEED"), ("PEPEP", "SPEED"), ("world", "WORLD")]:
+            assert english.validate_guess(guess, target).feedback == \
+                validate_guess(guess, target).feedback
+
+    def test_feedback_table_from_language_encoding(self, tmp_path, monkeypatch):
+        """Test building a table for non-ASCII words"""
+        monkeypatch.setenv("QWORDS_CACHE_DIR", str(tmp_path))
+        russian = get_language("ru")
+        table = russian.table()
+
+        assert table.words == russian.words
+        assert table.pattern("СЛОВО", "ПЕСНЯ") == feedback_pattern("СЛОВО", "ПЕСНЯ")
+        assert bytes(table.row(0)) == bytes(table_for_words(russian.words).row(0))
+
+
+class TestLanguageGames:
+    """Test cases for playing non-English games"""
+
+    def test_spanish_game(self):
+        """Test a Spanish game with decomposed and lowercase input"""
+        game = create_new_game("sueño", language="es")
+        assert game.target_word == "SUEÑO"
+        assert game.word_list.words == get_language("es").words
+
+        result = make_guess(game, "nin\u0303os")
+        assert result.word == "NIÑOS"
+        assert result.feedback == ["absent", "absent", "present", "present", "present"]
+
+        make_guess(game, "SUEN\u0303O")
+        assert game.won
+
+    def test_random_target_from_language_list(self):
+        """Test that random targets come from the language's list"""
+        game = create_new_game(language="ru")
+        assert game.target_word in get_language("ru").words
+
+    def test_invalid_guess_in_language(self):
+        """Test that guesses outside the alphabet are rejected"""
+        game = create_new_game("GRÜẞE", language="de")
+        assert make_guess(game, "NIÑOS") is None
+        assert game.current_guess == 0
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Unit tests for QWords streaming analytics sketches
+"""
+
+import pytest
+import json
+import random
+import sys
+import os
+
+# Add parent directory to path to import app module
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import create_new_game, make_guess
+from analytics import TDigest, SpaceSaving, GameAnalytics
+
+
+class TestTDigest:
+    """Test cases for the quantile sketch"""
+
+    def test_quantiles_close_to_exact(self):
+        """Test percentile estimates on a uniform stream"""
+        rng = random.Random(7)
+        digest = TDigest()
+        for _ in range(50000):
+            digest.add(rng.random())
+
+        assert abs(digest.quantile(0.5) - 0.5) < 0.01
+        assert abs(digest.quantile(0.9) - 0.9) < 0.01
+        assert abs(digest.quantile(0.99) - 0.99) < 0.005
+
+    def test_memory_is_bounded(self):
+        """Test that centroid count stays small for long streams"""
+        digest = TDigest(compression=50)
+        for i in range(100000):
+            digest.add(i)
+        digest.quantile(0.5)
+
+        assert len(digest.centroids) < 200
+
+    def test_merge_matches_single_stream(self):
+        """Test that merged digests estimate like one combined digest"""
+        left, right = TDigest(), TDigest()
+        for i in range(20000):
+            (left if i % 2 else right).add(i)
+        merged = TDigest.from_dict(json.loads(json.dumps(left.to_dict())))
+        merged.merge(right)
+
+        assert merged.count == 20000
+        assert abs(merged.quantile(0.5) - 10000) < 200
+
+    def test_empty_digest(self):
+        """Test that an empty digest reports no quantile"""
+        assert TDigest().quantile(0.5) is None
+
+
+class TestSpaceSaving:
+    """Test cases for the heavy hitters sketch"""
+
+    def test_finds_heavy_hitters(self):
+        """Test that frequent items survive a long tail"""
+        sketch = SpaceSaving(capacity=10)
+        rng = random.Random(3)
+        for i in range(20000):
+            if i % 3 == 0:
+                sketch.add("CRANE")
+            elif i % 5 == 0:
+                sketch.add("SLATE")
+            else:
+                sketch.add("W{}".format(rng.randrange(5000)))
+
+        assert [item for item, _ in sketch.top(2)] == ["CRANE", "SLATE"]
+        assert len(sketch.counts) == 10
+
+    def test_merge_keeps_capacity(self):
+        """Test that merging sketches stays within capacity"""
+        left, right = SpaceSaving(capacity=3), SpaceSaving(capacity=3)
+        for word in ["A", "A", "B", "C"]:
+            left.add(word)
+        for word in ["A", "D", "D", "E"]:
+            right.add(word)
+        left.merge(right)
+
+        assert len(left.counts) == 3
+        assert left.top(1) == [("A", 3)]
+
+    def test_merge_bounds_true_counts(self):
+        """Test that merged counts overestimate by at most their errors"""
+        streams = [["X"] * 10 + ["Y"], ["X"] + ["Z"] * 5 + ["W"] * 5]
+        left, right = SpaceSaving(capacity=2), SpaceSaving(capacity=2)
+        for sketch, stream in zip((left, right), streams):
+            for item in stream:
+                sketch.add(item)
+        # right evicted its one X, so X is missing from that sketch
+        assert "X" not in right.counts
+        left.merge(right)
+
+        combined = streams[0] + streams[1]
+        assert "X" in left.counts
+        for item, count in left.counts.items():
+            true_count = combined.count(item)
+            assert count - left.errors[item] <= true_count <= count
+
+
+class TestGameAnalytics:
+    """Test cases for aggregating finished games"""
+
+    def play(self, target, guesses):
+        game = create_new_game(target)
+        for word in guesses:
+            make_guess(game, word)
+        return game
+
+    def test_record_and_summarize(self):
+        """Test histogram, percentiles and openers from real games"""
+        analytics = GameAnalytics()
+        won = self.play("WORLD", ["ABOUT", "WORLD"])
+        lost = self.play("WORLD", ["ABOUT"] * 6)
+        analytics.record_game(won, end_time=won.start_time + 12.0)
+        analytics.record_game(lost)
+
+        summary = analytics.summary()
+        assert summary["games"] == 2
+        assert summary["win_rate"] == 0.5
+        assert summary["guess_distribution"]["2"] == 1
+        assert summary["guess_distribution"]["failed"] == 1
+        assert summary["solve_time_percentiles"]["p50"] == pytest.approx(12.0)
+        assert summary["top_openers"] == [("ABOUT", 2)]
+
+    def test_merge_across_processes(self):
+        """Test that serialized analytics merge into combined totals"""
+        first, second = GameAnalytics(), GameAnalytics()
+        first.record_game(self.play("WORLD", ["WORLD"]))
+        second.record_game(self.play("WORLD", ["ABOUT", "WORLD"]))
+
+        combined = GameAnalytics.from_dict(json.loads(json.dumps(first.to_dict())))
+        combined.merge(second)
+        assert combined.games == 2
+        assert combined.guess_counts[:2] == [1, 1]
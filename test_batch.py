@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the QWords JSON-lines batch driver
+"""
+
+import io
+import json
+import sys
+import os
+
+# Add parent directory to path to import app module
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from batch import run_batch, main
+
+
+def run(commands, **kwargs):
+    """Run a list of command dicts (or raw lines) and return decoded results"""
+    lines = [c if isinstance(c, str) else json.dumps(c) for c in commands]
+    output = io.StringIO()
+    run_batch(iter(lines), output, **kwargs)
+    return [json.loads(line) for line in output.getvalue().splitlines()]
+
+
+class TestBatchDriver:
+    """Test cases for streaming batch commands"""
+
+    def test_full_game(self):
+        """Test a scripted game from creation to win"""
+        results = run([
+            {"op": "new", "game": "g1", "target": "world"},
+            {"op": "guess", "game": "g1", "word": "words"},
+            {"op": "guess", "game": "g1", "word": "world"},
+            {"op": "state", "game": "g1"},
+        ])
+
+        assert all(r["ok"] for r in results)
+        assert results[1]["feedback"] == ["correct", "correct", "correct", "present", "absent"]
+        assert results[2]["won"] and results[2]["target"] == "WORLD"
+        assert results[3]["guesses"] == ["WORDS", "WORLD"]
+        assert results[3]["remaining"] == 4
+
+    def test_errors_do_not_stop_the_run(self):
+        """Test that malformed and invalid commands report errors in place"""
+        results = run([
+            "not json",
+            {"op": "fly"},
+            {"op": "guess", "game": "missing", "word": "world"},
+            {"op": "new", "game": "g", "target": "world"},
+            {"op": "guess", "game": "g", "word": "abc"},
+            {"op": "guess", "game": "g", "word": "world", "id": 7},
+        ])
+
+        assert [r["ok"] for r in results] == [False, False, False, True, False, True]
+        assert results[2]["line"] == 3
+        assert results[5]["id"] == 7
+
+    def test_invalid_targets_rejected(self):
+        """Test that bad targets fail the new command instead of later guesses"""
+        results = run([
+            {"op": "new", "game": "short", "target": "XY"},
+            {"op": "guess", "game": "short", "word": "world"},
+            {"op": "new", "game": "long", "target": "HELLOO"},
+            {"op": "new", "game": "number", "target": 12345},
+            {"op": "new", "game": "ok", "target": "hello"},
+            {"op": "guess", "game": "ok", "word": "hello"},
+        ])
+
+        assert [r["ok"] for r in results] == [False, False, False, False, True, True]
+        assert results[5]["won"]
+
+    def test_unhashable_fields_rejected(self):
+        """Test that array or object op and game values are command errors"""
+        results = run([
+            {"op": "new", "game": "g", "target": "world"},
+            {"op": ["guess"], "game": "g", "word": "world"},
+            {"op": "guess", "game": [1], "word": "world"},
+            {"op": "new", "game": {"a": 1}},
+            {"op": "new", "language": ["es"]},
+            {"op": "state", "game": "g"},
+        ])
+
+        assert [r["ok"] for r in results] == [True, False, False, False, False, True]
+
+    def test_open_games_are_bounded(self):
+        """Test that the least recently used game is dropped past max_games"""
+        results = run([
+            {"op": "new", "game": "a", "target": "world"},
+            {"op": "new", "game": "b", "target": "world"},
+            {"op": "state", "game": "a"},
+            {"op": "new", "game": "c", "target": "world"},
+            {"op": "state", "game": "b"},
+            {"op": "state", "game": "a"},
+        ], max_games=2)
+
+        assert [r["ok"] for r in results] == [True, True, True, True, False, True]
+
+    def test_language_games(self):
+        """Test that new games accept a language"""
+        results = run([
+            {"op": "new", "game": "es", "language": "es", "target": "sueño"},
+            {"op": "guess", "game": "es", "word": "SUEÑO"},
+            {"op": "new", "language": "xx"},
+        ])
+
+        assert results[1]["won"]
+        assert not results[2]["ok"]
+
+    def test_memory_command(self):
+        """Test the memory report admin command"""
+        results = run([
+            {"op": "new", "game": "g", "target": "world"},
+            {"op": "memory"},
+        ])
+
+        assert results[1]["open_games"] == 1
+        assert results[1]["memory"]["subsystems"]["games"]["objects"] >= 1
+
+    def test_file_input_and_output(self, tmp_path, capsys):
+        """Test the command line entry point with files"""
+        source = tmp_path / "commands.jsonl"
+        target = tmp_path / "results.jsonl"
+        source.write_text('{"op": "new", "game": "g", "target": "world"}\n\n'
+                          '{"op": "guess", "game": "g", "word": "world"}\n')
+
+        main([str(source), "-o", str(target)])
+
+        lines = target.read_text().splitlines()
+        assert len(lines) == 2
+        assert json.loads(lines[1])["won"]
+        assert "Processed 2 commands (0 failed)" in capsys.readouterr().err
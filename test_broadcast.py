@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Unit tests for QWords spectator broadcast
+"""
+
+import sys
+import os
+import threading
+from io import BytesIO
+from unittest.mock import patch
+
+# Add parent directory to path to import app module
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import create_new_game, make_guess, render_game_board
+from broadcast import BroadcastChannel, stream_to
+
+
+class TestBroadcastChannel:
+    """Test cases for render-once fan-out"""
+
+    def test_board_rendered_once_per_update(self):
+        """Test that all spectators share one rendered frame"""
+        channel = BroadcastChannel()
+        spectators = [channel.subscribe() for _ in range(50)]
+        game = create_new_game("WORLD")
+        make_guess(game, "ABOUT")
+
+        with patch('app.render_game_board', wraps=render_game_board) as render:
+            frame = channel.publish(game)
+
+        assert render.call_count == 1
+        assert frame.data == render_game_board(game).encode("utf-8")
+        assert all(s.get(timeout=1) is frame for s in spectators)
+
+    def test_slow_spectator_keeps_latest(self):
+        """Test that an unread spectator skips to the newest board"""
+        channel = BroadcastChannel()
+        slow = channel.subscribe()
+        game = create_new_game("WORLD")
+        for word in ["ABOUT", "SPEED", "CHAIR"]:
+            make_guess(game, word)
+            channel.publish(game)
+
+        frame = slow.get(timeout=1)
+        assert frame.sequence == 3
+        assert slow.skipped == 2
+        assert slow.get(timeout=0.01) is None
+
+    def test_late_subscriber_gets_current_board(self):
+        """Test that joining mid-game shows the latest board"""
+        channel = BroadcastChannel()
+        game = create_new_game("WORLD")
+        channel.publish(game)
+
+        late = channel.subscribe()
+        assert late.get(timeout=1).sequence == 1
+
+    def test_blocked_stream_does_not_stall_publisher(self):
+        """Test that publishing continues while one spectator is stuck"""
+        channel = BroadcastChannel()
+        gate = threading.Event()
+
+        class StuckStream(BytesIO):
+            def write(self, data):
+                gate.wait()
+                return super().write(data)
+
+        stuck = channel.subscribe()
+        stream_to(stuck, StuckStream())
+        fast = channel.subscribe()
+
+        game = create_new_game("WORLD")
+        for _ in range(100):
+            channel.publish(game)
+        assert fast.get(timeout=1).sequence == 100
+
+        gate.set()
+        channel.close()
+
+    def test_unsubscribe(self):
+        """Test that unsubscribed spectators stop receiving frames"""
+        channel = BroadcastChannel()
+        spectator = channel.subscribe()
+        channel.unsubscribe(spectator)
+        channel.publish(create_new_game("WORLD"))
+
+        assert channel.subscriber_count == 0
+        assert spectator.get(timeout=0.01) is None
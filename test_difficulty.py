@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Unit tests for headless play and per-word difficulty scoring
+"""
+
+import pytest
+import random
+import sys
+import os
+from unittest.mock import Mock
+
+# Add parent directory to path to import app module
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import difficulty
+import events
+from app import WORD_LIST, create_new_game, get_random_word
+from cache import word_list_hash
+from difficulty import (
+    analyze_word_list, get_difficulty_scores, DifficultyBuckets, WordDifficulty
+)
+from feedback_tables import table_for_words
+from headless import play_headless
+from strategies import RandomConsistentStrategy, ExpectedSizeStrategy
+
+
+SAMPLE_WORDS = WORD_LIST[:60]
+
+
+class TestHeadlessPlay:
+    """Test cases for the headless game loop"""
+
+    def test_create_new_game_with_fixed_target(self):
+        """Test that create_new_game accepts a fixed target"""
+        game = create_new_game("world")
+        assert game.target_word == "WORLD"
+
+    def test_random_consistent_game_ends(self):
+        """Test that a headless game runs to completion"""
+        table = table_for_words(SAMPLE_WORDS)
+        result = play_headless("ALARM", RandomConsistentStrategy(), table, random.Random(1))
+
+        assert 1 <= result.turns <= 6
+        assert result.won == (result.guesses[-1] == "ALARM")
+
+    def test_expected_size_strategy_wins(self):
+        """Test that the solver strategy finds a target in a small list"""
+        table = table_for_words(SAMPLE_WORDS)
+        result = play_headless("AGENT", ExpectedSizeStrategy(), table)
+
+        assert result.won
+        assert result.guesses[-1] == "AGENT"
+
+
+class TestDifficultyScores:
+    """Test cases for the batch difficulty analyzer"""
+
+    def test_scores_cover_every_word(self):
+        """Test that every word gets a plausible score"""
+        scores = analyze_word_list(SAMPLE_WORDS, samples=3, processes=1)
+
+        assert [s.word for s in scores] == SAMPLE_WORDS
+        for s in scores:
+            assert 1 <= s.expected_guesses <= 6
+            assert 0 <= s.failure_rate <= 1
+            assert s.opening_bucket >= 1
+
+    def test_scoring_does_not_emit_events(self):
+        """Test that simulated games stay out of the event log"""
+        sink = Mock()
+        events.set_event_sink(sink)
+        try:
+            difficulty.score_word(table_for_words(SAMPLE_WORDS), SAMPLE_WORDS[5], samples=3)
+        finally:
+            events.set_event_sink(None)
+        assert not sink.emit.called
+
+    def test_parallel_matches_inline(self):
+        """Test that the process pool gives the same seeded results"""
+        inline = analyze_word_list(SAMPLE_WORDS, samples=2, processes=1)
+        pooled = analyze_word_list(SAMPLE_WORDS, samples=2, processes=2)
+
+        assert [s.to_dict() for s in pooled] == [s.to_dict() for s in inline]
+
+    def test_scores_cached_per_word_list(self, monkeypatch):
+        """Test that a second request is served from disk"""
+        first = get_difficulty_scores(SAMPLE_WORDS, samples=2, processes=1)
+        monkeypatch.setattr(difficulty, "analyze_word_list", None)  # fails if called
+
+        second = get_difficulty_scores(SAMPLE_WORDS, samples=2, processes=1)
+        assert [s.to_dict() for s in second] == [s.to_dict() for s in first]
+
+
+class TestDifficultyBuckets:
+    """Test cases for difficulty bands and target selection"""
+
+    def test_bands_split_by_expected_guesses(self):
+        """Test that words are ranked into easy, medium and hard"""
+        scores = [WordDifficulty("W{:04d}".format(i), 2 + i / 10.0, 0.0, 1) for i in range(9)]
+        buckets = DifficultyBuckets(scores)
+
+        assert buckets.bands["easy"] == ["W0000", "W0001", "W0002"]
+        assert buckets.bands["hard"] == ["W0006", "W0007", "W0008"]
+        assert buckets.pick("medium") in buckets.bands["medium"]
+
+    def test_unknown_band_rejected(self):
+        """Test that an unknown difficulty raises ValueError"""
+        buckets = DifficultyBuckets([WordDifficulty("WORLD", 3.0, 0.0, 1)])
+        with pytest.raises(ValueError):
+            buckets.pick("extreme")
+
+    def test_get_random_word_with_difficulty(self, monkeypatch):
+        """Test that get_random_word draws from the requested band"""
+        scores = [WordDifficulty(word, 2 + i % 4, 0.0, 1) for i, word in enumerate(WORD_LIST)]
+        buckets = DifficultyBuckets(scores)
+        monkeypatch.setitem(difficulty._loaded_buckets, word_list_hash(WORD_LIST), buckets)
+
+        for _ in range(10):
+            assert get_random_word("hard") in buckets.bands["hard"]
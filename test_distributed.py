@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Unit tests for distributed strategy evaluation over localhost
+"""
+
+import pytest
+import json
+import socket
+import sys
+import os
+import threading
+from unittest.mock import Mock
+
+# Add parent directory to path to import app module
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import events
+from app import WORD_LIST
+from distributed import Coordinator, run_worker
+
+
+SAMPLE_WORDS = WORD_LIST[:40]
+
+
+@pytest.fixture
+def coordinator():
+    coordinator = Coordinator(SAMPLE_WORDS, strategy="random-consistent", chunk_size=7)
+    coordinator.start()
+    yield coordinator
+    coordinator.stop()
+
+
+def send(stream, message):
+    stream.write((json.dumps(message) + "\n").encode("utf-8"))
+    stream.flush()
+
+
+class TestDistributedEvaluation:
+    """Test cases for the coordinator/worker protocol"""
+
+    def test_workers_cover_every_target_once(self, coordinator):
+        """Test that several workers together play every target once"""
+        workers = [threading.Thread(target=run_worker, args=(coordinator.address,))
+                   for _ in range(3)]
+        for worker in workers:
+            worker.start()
+        results = coordinator.wait(timeout=30)
+        for worker in workers:
+            worker.join(timeout=5)
+
+        assert [r["target"] for r in results] == SAMPLE_WORDS
+        assert all(r["won"] == (r["guesses"][-1] == r["target"]) for r in results)
+
+    def test_worker_games_do_not_emit_events(self, coordinator):
+        """Test that evaluation games stay out of the worker's event log"""
+        sink = Mock()
+        events.set_event_sink(sink)
+        try:
+            run_worker(coordinator.address)
+        finally:
+            events.set_event_sink(None)
+
+        assert len(coordinator.wait(timeout=30)) == len(SAMPLE_WORDS)
+        assert not sink.emit.called
+
+    def test_dead_worker_chunk_is_retried(self, coordinator):
+        """Test that a chunk abandoned mid-way is re-run by another worker"""
+        sock = socket.create_connection(coordinator.address)
+        reader, writer = sock.makefile("rb"), sock.makefile("wb")
+        send(writer, {"op": "hello"})
+        reader.readline()
+        send(writer, {"op": "request"})
+        chunk = json.loads(reader.readline())
+        send(writer, {"op": "result", "chunk_id": chunk["chunk_id"],
+                      "result": {"target": "BOGUS", "guesses": [], "won": False}})
+        writer.close()
+        reader.close()
+        sock.close()
+
+        run_worker(coordinator.address)
+        results = coordinator.wait(timeout=30)
+
+        assert coordinator.retries == 1
+        assert [r["target"] for r in results] == SAMPLE_WORDS
+
+    def test_expired_lease_is_retried(self):
+        """Test that a stuck worker's chunk is reassigned after the lease expires"""
+        coordinator = Coordinator(SAMPLE_WORDS[:5], strategy="random-consistent",
+                                  chunk_size=5, lease_timeout=0.0).start()
+        try:
+            sock = socket.create_connection(coordinator.address)
+            reader, writer = sock.makefile("rb"), sock.makefile("wb")
+            send(writer, {"op": "hello"})
+            reader.readline()
+            send(writer, {"op": "request"})
+            reader.readline()
+
+            run_worker(coordinator.address)
+            results = coordinator.wait(timeout=30)
+            assert len(results) == 5
+            assert coordinator.retries >= 1
+            sock.close()
+        finally:
+            coordinator.stop()
+
+    def test_results_are_seeded(self, coordinator):
+        """Test that results do not depend on which worker ran a chunk"""
+        run_worker(coordinator.address)
+        first = coordinator.wait(timeout=30)
+
+        second_coordinator = Coordinator(SAMPLE_WORDS, strategy="random-consistent",
+                                         chunk_size=13).start()
+        try:
+            run_worker(second_coordinator.address)
+            assert second_coordinator.wait(timeout=30) == first
+        finally:
+            second_coordinator.stop()
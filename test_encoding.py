@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Unit tests for QWords integer word encoding
+"""
+
+import pytest
+import sys
+import os
+
+# Add parent directory to path to import app module
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import scoring
+from app import create_new_game, make_guess, WORD_LIST
+from encoding import encode_word, decode_word, code_pattern, WordArray
+from feedback_tables import feedback_pattern
+
+
+class TestWordEncoding:
+    """Test cases for packing and unpacking words"""
+
+    def test_round_trip(self):
+        """Test that every word list entry survives encode/decode"""
+        for word in WORD_LIST:
+            assert decode_word(encode_word(word)) == word
+
+    def test_encoding_is_case_insensitive(self):
+        """Test that lowercase input encodes like uppercase"""
+        assert encode_word("world") == encode_word("WORLD")
+
+    def test_distinct_words_distinct_codes(self):
+        """Test that codes are unique across the word list"""
+        codes = {encode_word(word) for word in WORD_LIST}
+        assert len(codes) == len(set(WORD_LIST))
+
+    def test_invalid_words_rejected(self):
+        """Test that non A-Z or wrong-length words raise ValueError"""
+        with pytest.raises(ValueError):
+            encode_word("HEL!O")
+        with pytest.raises(ValueError):
+            encode_word("TOOLONG")
+        with pytest.raises(ValueError):
+            encode_word("ÉCOLE")
+        with pytest.raises(ValueError):
+            encode_word("ßabcd")  # Six letters once uppercased
+
+
+class TestEncodedScoring:
+    """Test cases for feedback computed on encoded words"""
+
+    def test_code_pattern_duplicates(self):
+        """Test duplicate letter handling on encoded words"""
+        for guess, target in [("EEEEE", "SPEED"), ("PEPEP", "SPEED"), ("SPEED", "ABBEY")]:
+            expected = feedback_pattern(guess, target)
+            assert code_pattern(encode_word(guess), encode_word(target)) == expected
+
+    def test_word_array_patterns_match_reference(self):
+        """Test that WordArray fast paths agree with string scoring"""
+        words = WORD_LIST[:60] + ["EEEEE", "PEPEP", "ABBEY"]
+        encoded = WordArray.from_words(words)
+
+        for g, guess in enumerate(words):
+            row = encoded.row_patterns(g)
+            assert list(row) == [feedback_pattern(guess, target) for target in words]
+
+    def test_word_array_lookup(self):
+        """Test indexing and membership on a WordArray"""
+        encoded = WordArray.from_words(["WORLD", "ABOUT"])
+
+        assert len(encoded) == 2
+        assert encode_word("ABOUT") in encoded
+        assert encoded.index[encode_word("ABOUT")] == 1
+        assert encoded.word(0) == "WORLD"
+        assert encoded.words() == ["WORLD", "ABOUT"]
+
+
+class TestEncodedGames:
+    """Test cases for games scored on encoded words"""
+
+    def test_target_encoded_at_creation(self):
+        """Test that new games carry the packed target"""
+        game = create_new_game("world")
+        assert game.target_code == encode_word("WORLD")
+
+    def test_guesses_scored_without_strings(self, monkeypatch):
+        """Test that make_guess scores codes, never the str backend path"""
+        monkeypatch.setattr(scoring, "score", None)  # fails if called
+        game = create_new_game("SPEED")
+
+        assert make_guess(game, "eerie").feedback == ["present", "present", "absent", "absent", "absent"]
+        assert make_guess(game, "speed").word == "SPEED"
+        assert game.won
+
+    def test_changing_target_re_encodes(self):
+        """Test that assigning target_word drops the stale code"""
+        game = create_new_game("ABOUT")
+        game.target_word = "WORLD"
+
+        assert game.target_code is None
+        assert make_guess(game, "WORLD").feedback == ["correct"] * 5
+        assert game.target_code == encode_word("WORLD")
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the QWords asynchronous event sink
+"""
+
+import pytest
+import json
+import sys
+import os
+import threading
+import time
+from unittest.mock import patch
+from io import StringIO
+
+# Add parent directory to path to import app module
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import events
+from app import create_new_game, make_guess, play_game
+from event_sink import EventSink, _STOP
+from events import set_event_sink
+
+
+def read_events(path):
+    with open(path) as f:
+        return [json.loads(line) for line in f]
+
+
+@pytest.fixture
+def sink(tmp_path):
+    """Install a sink for the duration of a test"""
+    sink = EventSink(str(tmp_path / "events.jsonl"), fsync="always")
+    set_event_sink(sink)
+    yield sink
+    set_event_sink(None)
+    sink.close()
+
+
+class TestEventSink:
+    """Test cases for queuing, batching and counters"""
+
+    def test_events_written_in_order(self, tmp_path):
+        """Test that every queued event reaches the log"""
+        sink = EventSink(str(tmp_path / "log.jsonl"), batch_size=7)
+        for i in range(100):
+            sink.emit("tick", n=i)
+        sink.close()
+
+        logged = read_events(sink.path)
+        assert [e["n"] for e in logged] == list(range(100))
+        assert sink.counters()["written"] == 100
+        assert sink.counters()["dropped"] == 0
+
+    def test_full_queue_drops_events(self, tmp_path):
+        """Test that a full queue drops and counts instead of blocking"""
+        sink = EventSink(str(tmp_path / "log.jsonl"), max_queue=2, on_full="drop")
+        gate = threading.Event()
+        sink._file.write = lambda data, write=sink._file.write: (gate.wait(), write(data))[1]
+
+        for i in range(20):
+            sink.emit("tick", n=i)
+        gate.set()
+        sink.close()
+
+        counters = sink.counters()
+        assert counters["dropped"] > 0
+        assert counters["queued"] + counters["dropped"] == 20
+        assert counters["written"] == counters["queued"]
+
+    def test_full_queue_blocks_without_dropping(self, tmp_path):
+        """Test that on_full='block' makes the caller wait for space"""
+        sink = EventSink(str(tmp_path / "log.jsonl"), max_queue=2, on_full="block")
+        gate = threading.Event()
+        sink._file.write = lambda data, write=sink._file.write: (gate.wait(), write(data))[1]
+
+        producer = threading.Thread(target=lambda: [sink.emit("tick", n=i) for i in range(20)])
+        producer.start()
+        producer.join(0.2)
+        assert producer.is_alive()  # Waiting on the full queue
+        gate.set()
+        producer.join()
+        sink.close()
+
+        counters = sink.counters()
+        assert counters["dropped"] == 0
+        assert counters["written"] == 20
+        assert [e["n"] for e in read_events(sink.path)] == list(range(20))
+
+    def test_unserializable_field_written_as_text(self, tmp_path):
+        """Test that a field json cannot encode does not stop the writer"""
+        sink = EventSink(str(tmp_path / "log.jsonl"), max_queue=2, on_full="block")
+        sink.emit("odd", obj=object())
+        for i in range(5):
+            sink.emit("tick", n=i)
+        sink.close()
+
+        logged = read_events(sink.path)
+        assert logged[0]["obj"].startswith("<object object")
+        assert [e["n"] for e in logged[1:]] == list(range(5))
+
+    def test_failed_batch_counted_as_dropped(self, tmp_path):
+        """Test that a batch failing to write is dropped and later ones still land"""
+        sink = EventSink(str(tmp_path / "log.jsonl"), batch_size=1)
+        write = sink._file.write
+        failures = [OSError("disk full")]
+
+        def flaky_write(data):
+            if failures:
+                raise failures.pop()
+            return write(data)
+
+        sink._file.write = flaky_write
+
+        for i in range(3):
+            sink.emit("tick", n=i)
+        sink.close()
+
+        counters = sink.counters()
+        assert counters["dropped"] == 1
+        assert counters["written"] == 2
+        assert [e["n"] for e in read_events(sink.path)] == [1, 2]
+
+    def test_dead_writer_does_not_hang(self, tmp_path):
+        """Test that blocking emits and close return once the writer is gone"""
+        sink = EventSink(str(tmp_path / "log.jsonl"), max_queue=1, on_full="block")
+        sink._queue.put(_STOP)
+        sink._thread.join()
+
+        assert sink.emit("tick") is False
+        sink.close()
+        assert sink.counters()["dropped"] == 1
+
+    def test_idle_sink_does_not_fsync(self, tmp_path):
+        """Test that interval fsyncs only follow writes"""
+        sink = EventSink(str(tmp_path / "log.jsonl"), fsync="interval", fsync_interval=0.01)
+        time.sleep(0.1)
+        assert sink.counters()["fsyncs"] == 0
+
+        sink.emit("tick")
+        sink.close()
+        assert sink.counters()["fsyncs"] == 1
+
+    def test_invalid_policy_rejected(self, tmp_path):
+        """Test that unknown policies raise ValueError"""
+        with pytest.raises(ValueError):
+            EventSink(str(tmp_path / "log.jsonl"), on_full="spill")
+
+    def test_emit_without_sink_is_noop(self):
+        """Test that emit does nothing when no sink is installed"""
+        set_event_sink(None)
+        events.emit("tick")
+
+
+class TestGameEvents:
+    """Test cases for events emitted by the game"""
+
+    def test_game_lifecycle_events(self, sink):
+        """Test created, guess and won events for one game"""
+        game = create_new_game("WORLD")
+        make_guess(game, "ABOUT")
+        make_guess(game, "WORLD")
+        sink.close()
+
+        logged = read_events(sink.path)
+        assert [e["type"] for e in logged] == ["game_created", "guess_made", "guess_made", "game_won"]
+        assert all(e["game_id"] == game.game_id for e in logged)
+        assert logged[2]["feedback"] == ["correct"] * 5
+
+    @patch('builtins.input', side_effect=['ABOUT', 'quit'])
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_quit_event(self, mock_stdout, mock_input, sink):
+        """Test that quitting play_game emits a quit event"""
+        with patch('app.get_random_word', return_value='WORLD'):
+            play_game()
+        sink.close()
+
+        logged = read_events(sink.path)
+        assert logged[-1]["type"] == "quit"
+        assert logged[-1]["guesses"] == 1
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the tiled out-of-core feedback store
+"""
+
+import pytest
+import sys
+import os
+
+# Add parent directory to path to import app module
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import WORD_LIST
+from feedback_tables import build_feedback_table, table_for_words
+from feedback_store import (
+    write_tiled_table_file, open_tiled_table_file, load_tiled_table, load_table,
+    TiledFeedbackTable
+)
+from solver import best_guess, filter_candidates
+import feedback_store
+
+
+SAMPLE_WORDS = WORD_LIST[:45] + ["SPEED", "EEEEE", "PEPEP"]
+
+
+@pytest.fixture(autouse=True)
+def fresh_stores(monkeypatch):
+    """Open every store from this test's cache directory (see conftest)"""
+    monkeypatch.setattr(feedback_store, "_loaded_stores", {})
+
+
+@pytest.fixture
+def tiled(tmp_path):
+    # 48 words in tiles of 10 leaves a short last band and column
+    path = str(tmp_path / "tiles.bin")
+    write_tiled_table_file(path, SAMPLE_WORDS, tile_size=10, processes=1)
+    return open_tiled_table_file(path)
+
+
+class TestTiledFeedbackTable:
+    """Test cases for building and querying tiled tables"""
+
+    def test_matches_full_table(self, tiled):
+        """Test that every row, column and cell matches the in-memory table"""
+        full = build_feedback_table(SAMPLE_WORDS)
+        n = len(SAMPLE_WORDS)
+
+        for i in range(n):
+            assert bytes(tiled.row(i)) == bytes(full[i * n:(i + 1) * n])
+            assert bytes(tiled.column(i)) == bytes(full[i::n])
+        assert tiled.pattern_at(47, 13) == full[47 * n + 13]
+        assert tiled.pattern("SPEED", "PEPEP") == full[45 * n + 47]
+
+    def test_parallel_build_is_identical(self, tmp_path, tiled):
+        """Test that tiles computed by a worker pool produce the same file"""
+        path = str(tmp_path / "parallel.bin")
+        write_tiled_table_file(path, SAMPLE_WORDS, tile_size=10, processes=2)
+
+        parallel = open_tiled_table_file(path)
+        assert [bytes(parallel.row(i)) for i in range(parallel.size)] == \
+            [bytes(tiled.row(i)) for i in range(tiled.size)]
+
+    def test_unfinished_file_rejected(self, tmp_path):
+        """Test that a file without the completion magic is not used"""
+        path = tmp_path / "partial.bin"
+        path.write_bytes(bytes(64))
+        with pytest.raises(ValueError):
+            open_tiled_table_file(str(path))
+
+    def test_solver_runs_on_tiled_table(self, tiled):
+        """Test that solver functions give the same answers on both layouts"""
+        full = table_for_words(SAMPLE_WORDS)
+        candidates = list(range(full.size))
+
+        assert best_guess(tiled, candidates) == best_guess(full, candidates)
+        pattern = full.pattern_at(3, 20)
+        assert filter_candidates(tiled, candidates, 3, pattern) == \
+            filter_candidates(full, candidates, 3, pattern)
+
+    def test_load_caches_store(self, tmp_path):
+        """Test that a cached store is mapped instead of rebuilt"""
+        first = load_tiled_table(SAMPLE_WORDS, str(tmp_path), tile_size=16, processes=1)
+        assert [name for name in os.listdir(str(tmp_path)) if name.endswith(".tmp")] == []
+
+        feedback_store._loaded_stores.clear()
+        second = load_tiled_table(SAMPLE_WORDS, str(tmp_path), tile_size=16, processes=1)
+        assert second is not first
+        assert second.tile_size == 16
+        assert bytes(second.row(5)) == bytes(first.row(5))
+
+    def test_load_table_picks_layout_by_size(self, monkeypatch):
+        """Test that only lists above the limit use the tiled store"""
+        assert not isinstance(load_table(SAMPLE_WORDS), TiledFeedbackTable)
+
+        monkeypatch.setattr(feedback_store, "IN_MEMORY_WORD_LIMIT", 10)
+        assert isinstance(load_table(SAMPLE_WORDS), TiledFeedbackTable)
+
+
+class TestLargeListCallers:
+    """Test cases for subsystems running on lists above the in-memory limit"""
+
+    @pytest.fixture(autouse=True)
+    def no_dense_tables(self, monkeypatch):
+        """Fail any attempt to build a full in-memory table"""
+        import feedback_tables
+
+        def refuse(*args, **kwargs):
+            raise AssertionError("dense feedback table built for a large list")
+
+        monkeypatch.setattr(feedback_store, "IN_MEMORY_WORD_LIMIT", 10)
+        monkeypatch.setattr(feedback_tables, "write_table_file", refuse)
+        monkeypatch.setattr(feedback_tables, "publish_shared_table", refuse)
+
+    def test_opening_book_and_table_backend(self):
+        """Test the opening book and table scoring backend on the tiled store"""
+        import scoring
+        from opening_book import compute_opening_book
+
+        book = compute_opening_book(SAMPLE_WORDS)
+        assert book.first_guess in SAMPLE_WORDS
+
+        backend = scoring.TableBackend()
+        backend.prepare(SAMPLE_WORDS)
+        assert isinstance(backend.table, TiledFeedbackTable)
+        assert backend.score("SPEED", "EEEEE") == scoring.feedback_pattern("SPEED", "EEEEE")
+
+    def test_parallel_tournament_maps_the_store(self):
+        """Test that pool workers map the tiled file instead of shared memory"""
+        from tournament import run_tournament
+
+        result = run_tournament(SAMPLE_WORDS, ["entropy"], SAMPLE_WORDS[:6], processes=2)
+        assert result.results["entropy"].wins == 6
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Unit tests for QWords precomputed feedback tables
+"""
+
+import pytest
+import sys
+import os
+
+# Add parent directory to path to import app module
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import validate_guess, WORD_LIST
+from feedback_tables import (
+    feedback_pattern, build_feedback_table, serialized_size,
+    serialize_table_into, FeedbackTable, publish_shared_table,
+    attach_shared_table, write_table_file, open_table_file, load_feedback_table,
+    ALL_CORRECT
+)
+import feedback_tables
+
+
+SAMPLE_WORDS = WORD_LIST[:30] + ["SPEED", "EEEEE", "PEPEP"]
+
+DIGITS = {"absent": 0, "present": 1, "correct": 2}
+
+
+def pattern_from_feedback(feedback):
+    """Convert a list of feedback names into a base-3 pattern"""
+    return sum(DIGITS[name] * 3 ** i for i, name in enumerate(feedback))
+
+
+class TestFeedbackPattern:
+    """Test cases for the pattern scoring function"""
+
+    def test_all_correct(self):
+        """Test that identical words produce the all-correct pattern"""
+        assert feedback_pattern("WORLD", "WORLD") == ALL_CORRECT
+
+    def test_matches_validate_guess(self):
+        """Test that patterns agree with validate_guess on duplicate letters"""
+        for guess in SAMPLE_WORDS:
+            for target in SAMPLE_WORDS:
+                expected = validate_guess(guess, target).feedback
+                assert feedback_pattern(guess, target) == pattern_from_feedback(expected)
+
+
+class TestFeedbackTable:
+    """Test cases for serialized, shared and mmapped tables"""
+
+    def test_build_table_layout(self):
+        """Test that the table is laid out guess-major"""
+        table = build_feedback_table(SAMPLE_WORDS)
+
+        n = len(SAMPLE_WORDS)
+        assert len(table) == n * n
+        assert table[1] == feedback_pattern(SAMPLE_WORDS[0], SAMPLE_WORDS[1])
+
+    def test_serialized_table_lookup(self):
+        """Test word and index lookups on a serialized table"""
+        buffer = bytearray(serialized_size(SAMPLE_WORDS))
+        serialize_table_into(buffer, SAMPLE_WORDS)
+        table = FeedbackTable(buffer)
+
+        assert table.words == tuple(SAMPLE_WORDS)
+        assert table.pattern("SPEED", "PEPEP") == feedback_pattern("SPEED", "PEPEP")
+        assert len(table.row(0)) == len(SAMPLE_WORDS)
+
+    def test_invalid_buffer_rejected(self):
+        """Test that a buffer without the table header is rejected"""
+        with pytest.raises(ValueError):
+            FeedbackTable(bytearray(64))
+
+    def test_shared_memory_round_trip(self):
+        """Test that an attached table sees the published patterns"""
+        published = publish_shared_table(SAMPLE_WORDS)
+        try:
+            attached = attach_shared_table(published.name)
+            assert attached.table.words == published.table.words
+            assert bytes(attached.table.row(3)) == bytes(published.table.row(3))
+            attached.close()
+        finally:
+            published.close()
+
+    def test_mmapped_file_round_trip(self, tmp_path):
+        """Test writing a table file and mapping it back"""
+        path = str(tmp_path / "table.bin")
+        write_table_file(path, SAMPLE_WORDS)
+
+        table = open_table_file(path)
+        assert table.pattern_at(0, 0) == ALL_CORRECT
+        assert table.pattern("SPEED", "EEEEE") == feedback_pattern("SPEED", "EEEEE")
+        assert table.size == len(SAMPLE_WORDS)
+
+    def test_precompiled_table_cache(self, tmp_path, monkeypatch):
+        """Test that a cached table file is mapped instead of rebuilt"""
+        monkeypatch.setattr(feedback_tables, "_loaded_tables", {})
+        first = load_feedback_table(SAMPLE_WORDS, str(tmp_path))
+        assert len(os.listdir(str(tmp_path))) == 1
+
+        monkeypatch.setattr(feedback_tables, "_loaded_tables", {})
+        monkeypatch.setattr(feedback_tables, "build_feedback_table", None)  # fails if called
+        second = load_feedback_table(SAMPLE_WORDS, str(tmp_path))
+        assert bytes(second.row(2)) == bytes(first.row(2))
+        assert load_feedback_table(SAMPLE_WORDS, str(tmp_path)) is second
@@ -62,6 +62,8 @@ class TestWordValidation:
         assert is_valid_word("     ") == False   # Spaces only
         assert is_valid_word("HEL O") == False   # Contains space
         assert is_valid_word("HEL\nO") == False  # Contains newline
+        assert is_valid_word("ÉCOLE") == False   # Letters outside A-Z
+        assert is_valid_word("ßabcd") == False
 
 
 class TestGuessValidation:
@@ -156,6 +158,12 @@ class TestGameFlow:
         assert isinstance(game.start_time, float)
         assert game.max_guesses == 6
     
+    def test_create_new_game_rejects_invalid_target(self):
+        """Test create_new_game raises ValueError for a target that is not a word"""
+        for target in ("XY", "HELLOO", "HEL!O", "ÉCOLE"):
+            with pytest.raises(ValueError):
+                create_new_game(target)
+    
     def test_make_guess_valid_word(self):
         """Test make_guess with a valid word"""
         game = create_new_game()
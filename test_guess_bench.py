@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+Guess scoring benchmark tests for QWords
+"""
+
+import sys
+import os
+
+# Add parent directory to path to import app module
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from encoding import code_pattern, encode_word
+from guess_bench import _string_score_guess, measure_scoring, slower_workloads
+from app import WORD_LIST, score_guess
+from scoring import feedback_pattern
+
+
+class TestGuessBench:
+    """Test cases for the packed versus string scoring benchmark"""
+
+    def test_paths_agree(self):
+        """Test that both benchmarked paths score every pair the same way"""
+        for guess in WORD_LIST[:40]:
+            for target in WORD_LIST[::25]:
+                assert code_pattern(encode_word(guess), encode_word(target)) == \
+                    feedback_pattern(guess, target)
+                assert score_guess(guess, encode_word(target)).feedback == \
+                    _string_score_guess(guess, target).feedback
+
+    def test_measure_reports_every_workload(self):
+        """Test that each workload is timed on both paths"""
+        results = measure_scoring(count=40)
+        assert sorted(results) == ["game", "guess", "score"]
+        for timing in results.values():
+            assert timing["string"] > 0 and timing["packed"] > 0
+
+    def test_slower_workloads(self):
+        """Test that only workloads where the packed path lost are reported"""
+        results = {
+            "score": {"string": 2.0, "packed": 1.0},
+            "game": {"string": 1.0, "packed": 2.0},
+        }
+        assert slower_workloads(results) == ["game"]
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Unit tests for QWords leaderboards
+"""
+
+import pytest
+import sys
+import os
+import random
+
+# Add parent directory to path to import app module
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import create_new_game, make_guess
+from leaderboard import Board, Leaderboards, ALL_TIME
+
+# 2026-01-02 12:00 UTC and the following day
+DAY_ONE = 1767355200.0
+DAY_TWO = DAY_ONE + 86400
+
+
+def finished_game(guesses, won=True, seconds=30.0, end_time=DAY_ONE):
+    """Build a finished game with the given number of guesses"""
+    game = create_new_game("WORLD")
+    game.start_time = end_time - seconds
+    for _ in range(guesses - 1):
+        make_guess(game, "ABOUT")
+    make_guess(game, "WORLD" if won else "ABOUT")
+    return game
+
+
+class TestBoard:
+    """Test cases for a single ranked board"""
+
+    def test_top_and_rank(self):
+        """Test ordering, rank lookups and keeping only personal bests"""
+        board = Board()
+        board.submit("ana", 4)
+        board.submit("bo", 2)
+        board.submit("cy", 3)
+        board.submit("ana", 5)  # Worse than ana's best, ignored
+
+        assert board.top(2) == [("bo", 2), ("cy", 3)]
+        assert board.rank("ana") == 3
+        assert board.rank("nobody") is None
+
+        board.submit("ana", 1)
+        assert board.rank("ana") == 1
+        assert len(board) == 3
+
+    def test_ties_rank_earlier_first(self):
+        """Test that equal scores rank by who achieved them first"""
+        board = Board()
+        board.submit("late", 3, sequence=2)
+        board.submit("early", 3, sequence=1)
+        assert board.top() == [("early", 3), ("late", 3)]
+
+    def test_submit_leaves_global_random_alone(self):
+        """Test that ranking players does not shift the seeded word picks"""
+        random.seed(3)
+        expected = random.random()
+        random.seed(3)
+        board = Board()
+        for i in range(50):
+            board.submit("p{}".format(i), i)
+        assert random.random() == expected
+
+    def test_matches_full_sort(self):
+        """Test incremental ranking against sorting every best score"""
+        rng = random.Random(5)
+        board = Board(higher_is_better=True)
+        best = {}
+        for _ in range(2000):
+            player = "p{}".format(rng.randrange(200))
+            score = rng.randrange(50)
+            board.submit(player, score)
+            best[player] = max(best.get(player, score), score)
+
+        scores = [s for _, s in board.top(len(best))]
+        assert scores == sorted(best.values(), reverse=True)
+        for player, score in best.items():
+            assert scores[board.rank(player) - 1] == score
+
+
+    def test_large_board_ranks(self):
+        """Test ranks and top entries after many improvements on a large board"""
+        rng = random.Random(11)
+        board = Board()
+        best = {}
+        for _ in range(20000):
+            player = "p{}".format(rng.randrange(5000))
+            score = rng.random()
+            board.submit(player, score)
+            best[player] = min(best.get(player, score), score)
+
+        ordered = sorted(best, key=best.get)
+        assert len(board) == len(best)
+        assert board.top(50) == [(player, best[player]) for player in ordered[:50]]
+        for player in ordered[::97]:
+            assert board.rank(player) == ordered.index(player) + 1
+
+
+class TestLeaderboards:
+    """Test cases for category and daily boards"""
+
+    def test_record_game_updates_categories(self):
+        """Test guesses, time and streak boards from finished games"""
+        boards = Leaderboards()
+        boards.record_game("ana", finished_game(3, seconds=40), end_time=DAY_ONE)
+        boards.record_game("bo", finished_game(2, seconds=90), end_time=DAY_ONE)
+        boards.record_game("ana", finished_game(4, seconds=20, end_time=DAY_TWO), end_time=DAY_TWO)
+
+        assert boards.top("fewest_guesses") == [("bo", 2), ("ana", 3)]
+        assert boards.top("fastest_time")[0] == ("ana", 20.0)
+        assert boards.top("longest_streak")[0] == ("ana", 2)
+        assert boards.rank("fewest_guesses", "ana", day="2026-01-03") == 1
+        assert boards.top("fewest_guesses", day="2026-01-02") == [("bo", 2), ("ana", 3)]
+
+    def test_loss_resets_streak(self):
+        """Test that losing resets the current streak but keeps the best"""
+        boards = Leaderboards()
+        for won in (True, True, False, True):
+            boards.record_game("ana", finished_game(6, won=won), end_time=DAY_ONE)
+
+        assert boards.streaks["ana"] == 1
+        assert boards.top("longest_streak") == [("ana", 2)]
+
+    def test_save_and_load(self, tmp_path):
+        """Test that boards survive a restart"""
+        boards = Leaderboards()
+        boards.record_game("ana", finished_game(3), end_time=DAY_ONE)
+        boards.record_game("bo", finished_game(2), end_time=DAY_TWO)
+        path = str(tmp_path / "leaderboards.json")
+        boards.save(path)
+
+        loaded = Leaderboards.load(path)
+        assert loaded.top("fewest_guesses") == boards.top("fewest_guesses")
+        assert loaded.rank("longest_streak", "bo") == boards.rank("longest_streak", "bo")
+        assert loaded.streaks == boards.streaks
+
+    def test_prune_days(self):
+        """Test that old daily boards can be dropped"""
+        boards = Leaderboards()
+        boards.record_game("ana", finished_game(3), end_time=DAY_ONE)
+        boards.record_game("ana", finished_game(3), end_time=DAY_TWO)
+        boards.prune_days(1)
+
+        assert set(boards.boards["fewest_guesses"]) == {ALL_TIME, "2026-01-03"}
+
+    def test_queries_do_not_create_boards(self):
+        """Test that top and rank on an unknown day leave no empty board"""
+        boards = Leaderboards()
+        boards.record_game("ana", finished_game(3), end_time=DAY_ONE)
+
+        assert boards.top("fewest_guesses", day="1999-01-01") == []
+        assert boards.rank("fewest_guesses", "ana", day="1999-01-01") is None
+        assert "1999-01-01" not in boards.to_dict()["boards"]["fewest_guesses"]
+
+    def test_unknown_category(self):
+        """Test that an unknown category raises ValueError"""
+        with pytest.raises(ValueError):
+            Leaderboards().top("most_vowels")
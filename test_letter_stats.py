@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Unit tests for letter-frequency and positional statistics
+"""
+
+import pytest
+import sys
+import os
+
+# Add parent directory to path to import app module
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import create_new_game, make_guess, WORD_LIST
+from letter_stats import LetterStats, get_word_list_stats, track
+import letter_stats
+
+
+@pytest.fixture(autouse=True)
+def fresh_stats(monkeypatch):
+    """Load every statistics table from this test's cache directory (see conftest)"""
+    monkeypatch.setattr(letter_stats, "_loaded_stats", {})
+
+
+class TestLetterStats:
+    """Test cases for the count arrays"""
+
+    def test_counts(self):
+        """Test letter and positional counts, counting repeats once per word"""
+        stats = LetterStats.from_words(["SPEED", "SPOON", "ERASE"])
+
+        assert stats.size == 3
+        assert stats.letter_count("e") == 2
+        assert stats.letter_count("S") == 3
+        assert stats.position_count(0, "S") == 2
+        assert stats.position_count(2, "E") == 1
+        assert stats.most_common(2) == [("S", 3), ("E", 2)]
+
+    def test_remove_reverses_add(self):
+        """Test that removing a word restores the previous counts"""
+        stats = LetterStats.from_words(WORD_LIST[:10])
+        before = stats.to_dict()
+        stats.add("WORLD")
+        stats.remove("WORLD")
+        assert stats.to_dict() == before
+
+    def test_rejects_non_letters(self):
+        """Test that words outside A-Z are rejected"""
+        with pytest.raises(ValueError):
+            LetterStats().add("AB1DE")
+
+    def test_full_list_stats_are_cached(self, tmp_path, monkeypatch):
+        """Test that a second process loads stats instead of recounting"""
+        first = get_word_list_stats(WORD_LIST, str(tmp_path))
+        assert get_word_list_stats(WORD_LIST, str(tmp_path)) is first
+
+        monkeypatch.setattr(letter_stats, "_loaded_stats", {})
+        monkeypatch.setattr(LetterStats, "from_words", None)  # fails if called
+        second = get_word_list_stats(WORD_LIST, str(tmp_path))
+        assert second.to_dict() == first.to_dict()
+
+
+class TestCandidateStats:
+    """Test cases for stats kept current by make_guess"""
+
+    def test_make_guess_updates_tracked_stats(self):
+        """Test that each guess leaves stats equal to a fresh recount"""
+        game = create_new_game("WORLD")
+        tracked = track(game)
+        assert tracked.stats.size == len(WORD_LIST)
+
+        for guess in ("CRANE", "HOTEL"):
+            make_guess(game, guess)
+            assert "WORLD" in tracked.candidates
+            assert tracked.stats.to_dict() == LetterStats.from_words(tracked.candidates).to_dict()
+        assert tracked.stats.size < 10
+
+    def test_track_applies_earlier_guesses(self):
+        """Test that tracking a game mid-way catches up on its guesses"""
+        game = create_new_game("WORLD")
+        make_guess(game, "WORDS")
+        tracked = track(game)
+
+        assert all(word.startswith("WOR") for word in tracked.candidates)
+        assert game.candidate_stats is tracked
+
+    def test_full_list_stats_are_not_modified(self):
+        """Test that game updates work on a copy of the cached stats"""
+        game = create_new_game("WORLD")
+        track(game)
+        make_guess(game, "WORDS")
+
+        assert get_word_list_stats(WORD_LIST).size == len(WORD_LIST)
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Unit tests for per-subsystem memory accounting
+"""
+
+import pytest
+import sys
+import os
+
+# Add parent directory to path to import app module
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import create_new_game, make_guess
+from memory_report import (
+    measure, memory_report, measure_idle_session_bytes, format_report,
+    start_tracing, IDLE_SESSION_BUDGET_BYTES
+)
+import tracemalloc
+
+
+class TestMeasure:
+    """Test cases for the object graph walk"""
+
+    def test_shared_objects_counted_once(self):
+        """Test that objects reachable twice are only counted once"""
+        shared = list(range(1000))
+        seen = set()
+        first = measure([[shared]], seen)
+        second = measure([[shared]], seen)
+
+        assert first.objects == 1
+        assert first.heap_bytes > sys.getsizeof(shared)
+        assert second.heap_bytes < sys.getsizeof(shared)
+
+    def test_mapped_buffers_reported_separately(self, tmp_path):
+        """Test that mmapped table files count as mapped, not heap, bytes"""
+        from app import WORD_LIST
+        from feedback_tables import open_table_file, write_table_file
+
+        path = str(tmp_path / "table.bin")
+        write_table_file(path, WORD_LIST[:200])
+        usage = measure([open_table_file(path)])
+
+        assert usage.mapped_bytes == os.path.getsize(path)
+        assert usage.heap_bytes < usage.mapped_bytes
+
+
+class TestMemoryReport:
+    """Test cases for the on-demand report"""
+
+    def test_games_and_results_are_counted(self):
+        """Test that live games and guess results appear in their subsystems"""
+        before = memory_report()["subsystems"]
+        games = [create_new_game("WORLD") for _ in range(20)]
+        for game in games:
+            make_guess(game, "WORDS")
+        after = memory_report()["subsystems"]
+
+        assert after["games"]["objects"] - before["games"]["objects"] == 20
+        assert after["guess_results"]["objects"] - before["guess_results"]["objects"] == 20
+        assert after["games"]["heap_bytes"] > before["games"]["heap_bytes"]
+
+    def test_deep_mode(self):
+        """Test that deep mode lists traced allocations when tracing"""
+        was_tracing = tracemalloc.is_tracing()
+        start_tracing()
+        try:
+            games = [create_new_game() for _ in range(50)]
+            report = memory_report(deep=True)
+        finally:
+            if not was_tracing:
+                tracemalloc.stop()
+
+        assert report["traced"]
+        assert any(entry["file"] == "app.py" for entry in report["traced"])
+        assert "Traced allocations by file:" in format_report(report)
+        assert len(games) == 50
+
+    def test_deep_mode_without_tracing(self):
+        """Test that deep mode reports when tracemalloc is off"""
+        if tracemalloc.is_tracing():
+            pytest.skip("tracemalloc already running")
+        report = memory_report(deep=True)
+        assert report["traced"] is None
+        assert "not tracing" in format_report(report)[-1]
+
+
+class TestSessionBudget:
+    """Regression test for the memory cost of idle sessions"""
+
+    def test_idle_session_within_budget(self):
+        """Test that an idle session stays within IDLE_SESSION_BUDGET_BYTES"""
+        assert measure_idle_session_bytes(500) <= IDLE_SESSION_BUDGET_BYTES
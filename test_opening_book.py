@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Unit tests for QWords solver helpers and the opening book cache
+"""
+
+import pytest
+import sys
+import os
+
+# Add parent directory to path to import app module
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import opening_book
+from app import WORD_LIST
+from cache import word_list_hash, cache_path
+from feedback_tables import table_for_words, feedback_pattern
+from opening_book import compute_opening_book, get_opening_book
+from solver import best_guess, filter_candidates, partition
+
+
+SAMPLE_WORDS = WORD_LIST[:80]
+
+
+@pytest.fixture(autouse=True)
+def clear_loaded_books(tmp_path, monkeypatch):
+    """Drop in-process books so each test exercises the disk cache"""
+    monkeypatch.setenv("QWORDS_CACHE_DIR", str(tmp_path))
+    opening_book._loaded_books.clear()
+    yield
+    opening_book._loaded_books.clear()
+
+
+class TestSolver:
+    """Test cases for candidate filtering and guess selection"""
+
+    def test_partition_covers_all_candidates(self):
+        """Test that partition buckets hold every candidate exactly once"""
+        table = table_for_words(SAMPLE_WORDS)
+        candidates = list(range(table.size))
+
+        groups = partition(table, 0, candidates)
+        assert sorted(c for bucket in groups.values() for c in bucket) == candidates
+
+    def test_filter_candidates_keeps_target(self):
+        """Test that filtering by the observed pattern keeps the target"""
+        table = table_for_words(SAMPLE_WORDS)
+        target = SAMPLE_WORDS.index("ALARM")
+        pattern = feedback_pattern(SAMPLE_WORDS[0], "ALARM")
+
+        remaining = filter_candidates(table, list(range(table.size)), 0, pattern)
+        assert target in remaining
+        assert all(table.pattern_at(0, c) == pattern for c in remaining)
+
+    def test_best_guess_with_two_candidates(self):
+        """Test that with two candidates the solver guesses one of them"""
+        table = table_for_words(SAMPLE_WORDS)
+        assert best_guess(table, [5, 9]) == 5
+
+
+class TestOpeningBook:
+    """Test cases for computing and caching the opening book"""
+
+    def test_book_second_guesses_cover_opening_patterns(self):
+        """Test that every pattern of the first guess has a second guess"""
+        table = table_for_words(SAMPLE_WORDS)
+        book = compute_opening_book(SAMPLE_WORDS, table)
+
+        first = table.index[book.first_guess]
+        groups = partition(table, first, list(range(table.size)))
+        assert set(book.second_guesses) == set(groups)
+
+    def test_book_is_cached_on_disk(self, tmp_path, monkeypatch):
+        """Test that a stored book is reused instead of recomputed"""
+        directory = str(tmp_path)
+        book = get_opening_book(SAMPLE_WORDS, directory)
+        path = cache_path("opening-book", SAMPLE_WORDS, directory=directory)
+        assert os.path.exists(path)
+
+        opening_book._loaded_books.clear()
+        monkeypatch.setattr(opening_book, "compute_opening_book", None)  # fails if called
+        reloaded = get_opening_book(SAMPLE_WORDS, directory)
+
+        assert reloaded.first_guess == book.first_guess
+        assert reloaded.second_guesses == book.second_guesses
+
+    def test_changed_list_gets_new_book(self, tmp_path):
+        """Test that editing the list invalidates the cached book"""
+        directory = str(tmp_path)
+        get_opening_book(SAMPLE_WORDS, directory)
+        changed = SAMPLE_WORDS[:-1]
+
+        book = get_opening_book(changed, directory)
+        assert book.list_hash == word_list_hash(changed)
+        books = [name for name in os.listdir(directory) if name.startswith("opening-book")]
+        assert len(books) == 2
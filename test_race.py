@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Unit tests for QWords race mode
+"""
+
+import pytest
+import sys
+import os
+from unittest.mock import Mock
+
+# Add parent directory to path to import app module
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import events
+from app import validate_guess
+from race import RaceSession, simulate_race
+
+
+class TestRaceSession:
+    """Test cases for shared-target races"""
+
+    def test_players_share_target_and_feedback(self):
+        """Test that identical guesses reuse one cached result"""
+        race = RaceSession("WORLD")
+        race.join("ann")
+        race.join("bob")
+
+        first = race.guess("ann", "words")
+        second = race.guess("bob", "WORDS")
+
+        assert first is second
+        assert first.feedback == validate_guess("WORDS", "WORLD").feedback
+        stats = race.cache_stats()
+        assert (stats["hits"], stats["misses"]) == (1, 1)
+        assert stats["hit_rate"] == 0.5
+
+    def test_finish_order_and_standings(self):
+        """Test that winners are ranked in the order they solve the target"""
+        race = RaceSession("WORLD")
+        for name in ("ann", "bob", "cat"):
+            race.join(name)
+
+        race.guess("bob", "WORDS")
+        race.guess("bob", "WORLD")
+        race.guess("ann", "WORLD")
+        race.guess("cat", "ABOUT")
+
+        assert race.winner == "bob"
+        assert not race.is_over
+        assert [s["name"] for s in race.standings()] == ["bob", "ann", "cat"]
+        assert race.standings()[1]["rank"] == 2
+
+    def test_invalid_guess_and_players(self):
+        """Test that invalid words are rejected and players are checked"""
+        race = RaceSession("WORLD")
+        race.join("ann")
+
+        assert race.guess("ann", "abc") is None
+        assert race.players["ann"].game.current_guess == 0
+        with pytest.raises(ValueError):
+            race.join("ann")
+        with pytest.raises(ValueError):
+            race.guess("zed", "WORLD")
+
+    def test_race_games_do_not_emit_events(self):
+        """Test that race players' games stay out of the event log"""
+        sink = Mock()
+        events.set_event_sink(sink)
+        try:
+            race = RaceSession("WORLD")
+            race.join("ann")
+            race.guess("ann", "WORLD")
+        finally:
+            events.set_event_sink(None)
+        assert not sink.emit.called
+
+    def test_cache_is_bounded(self):
+        """Test that the scoring cache never exceeds its size"""
+        race = RaceSession("WORLD", cache_size=2)
+        race.join("ann")
+        for word in ("ABOUT", "ABOVE", "ABUSE", "ACTOR"):
+            race.guess("ann", word)
+
+        assert race.cache_stats()["size"] == 2
+
+    def test_simulated_race_finishes(self):
+        """Test that a simulated race ends with a high cache hit rate"""
+        race = simulate_race(players=40, seed=3)
+
+        assert race.is_over
+        assert race.cache_stats()["hit_rate"] > 0.5
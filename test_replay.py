@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Unit tests for bulk replay of historical games
+"""
+
+import pytest
+import json
+import sys
+import os
+
+# Add parent directory to path to import app module
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import events
+import scoring
+from alphabets import get_language
+from app import create_new_game, make_guess, WORD_LIST
+from replay import ReplayRecord, read_event_log, read_game_results, replay_games
+
+
+class RecordingSink:
+    """In-memory stand-in for EventSink that keeps events as JSON lines"""
+
+    def __init__(self):
+        self.lines = []
+
+    def emit(self, event_type, **fields):
+        fields["type"] = event_type
+        self.lines.append(json.dumps(fields))
+
+
+@pytest.fixture
+def event_log(tmp_path):
+    """Write an event log holding a won, a lost and an unfinished game"""
+    sink = RecordingSink()
+    events.set_event_sink(sink)
+    try:
+        won = create_new_game("WORLD")
+        unfinished = create_new_game("HOUSE")
+        make_guess(won, "WORDS")
+        make_guess(unfinished, "MOUSE")
+        make_guess(won, "WORLD")
+        lost = create_new_game("CRANE")
+        for _ in range(6):
+            make_guess(lost, "ABOUT")
+    finally:
+        events.set_event_sink(None)
+
+    path = tmp_path / "events.jsonl"
+    path.write_text("\n".join(sink.lines) + "\n")
+    return str(path)
+
+
+class TestReplaySources:
+    """Test cases for streaming historical games"""
+
+    def test_event_log_records(self, event_log):
+        """Test that finished games stream first and unfinished ones last"""
+        records = list(read_event_log(event_log))
+
+        assert [(r.target, r.won) for r in records] == [
+            ("WORLD", True), ("CRANE", False), ("HOUSE", None)]
+        assert records[0].guesses == ["WORDS", "WORLD"]
+        assert records[0].patterns[-1] == scoring.ALL_CORRECT
+
+    def test_language_recorded(self, tmp_path):
+        """Test that records carry the language their game was played in"""
+        sink = RecordingSink()
+        events.set_event_sink(sink)
+        try:
+            game = create_new_game("ÑANDU", language="es")
+            make_guess(game, "ñandu")
+        finally:
+            events.set_event_sink(None)
+        path = tmp_path / "events.jsonl"
+        path.write_text("\n".join(sink.lines) + "\n")
+
+        record, = read_event_log(str(path))
+        assert record.language == "es"
+        assert record.won
+
+    def test_quit_games_leave_flight(self, tmp_path):
+        """Test that quit and excess open games are yielded as they go"""
+        lines = [
+            {"type": "game_created", "game_id": "a", "target": "WORLD"},
+            {"type": "guess_made", "game_id": "a", "guess": "ABOUT",
+             "feedback": ["absent", "absent", "present", "absent", "absent"]},
+            {"type": "quit", "game_id": "a", "guesses": 1},
+            {"type": "game_created", "game_id": "b", "target": "HOUSE"},
+            {"type": "game_created", "game_id": "c", "target": "CRANE"},
+            {"type": "game_created", "game_id": "d", "target": "ABOUT"},
+        ]
+        path = tmp_path / "events.jsonl"
+        path.write_text("".join(json.dumps(line) + "\n" for line in lines))
+        reader = read_event_log(str(path), max_in_flight=2)
+
+        quit_game = next(reader)
+        assert (quit_game.game_id, quit_game.guesses, quit_game.won) == ("a", ["ABOUT"], None)
+        assert next(reader).game_id == "b"
+        assert [record.game_id for record in reader] == ["c", "d"]
+
+    def test_game_results_file(self, tmp_path):
+        """Test reading headless result dicts without recorded feedback"""
+        path = tmp_path / "results.jsonl"
+        path.write_text(json.dumps({"target": "WORLD", "guesses": ["WORLD"], "won": True}) + "\n")
+
+        record, = read_game_results(str(path))
+        assert record.patterns is None
+        assert record.won
+
+
+class TestReplayGames:
+    """Test cases for re-scoring and comparing games"""
+
+    @pytest.mark.parametrize("engine", ["fast", "game"])
+    def test_replay_matches_recording(self, event_log, engine):
+        """Test that replaying unchanged rules reports no diffs"""
+        report = replay_games(read_event_log(event_log), engine=engine, batch_size=2)
+
+        assert report.games == 3
+        assert report.guesses == 9
+        assert report.feedback_diffs == 0
+        assert report.outcome_diffs == 0
+
+    @pytest.mark.parametrize("engine", ["fast", "game"])
+    def test_language_games_replay(self, engine):
+        """Test that games replay in their own language and bad targets are skipped"""
+        records = [
+            ReplayRecord("ÑANDU", ["NIÑOS", "ÑANDU"],
+                         [get_language("es").score("NIÑOS", "ÑANDU"), scoring.ALL_CORRECT],
+                         won=True, language="es"),
+            ReplayRecord("ÑANDU", ["ÑANDU"], won=True),
+            ReplayRecord("WORLD", ["WORLD"], won=True, language="xx"),
+            ReplayRecord("WORLD", ["WORLD"], [scoring.ALL_CORRECT], won=True),
+        ]
+
+        report = replay_games(records, engine=engine)
+
+        assert report.games == 2
+        assert report.skipped == 2
+        assert report.feedback_diffs == 0
+        assert report.outcome_diffs == 0
+
+    def test_changed_scoring_is_reported(self, monkeypatch):
+        """Test that a scoring change shows up as feedback and outcome diffs"""
+        record = ReplayRecord("WORLD", ["WORDS", "WORLD"],
+                              [scoring.feedback_pattern("WORDS", "WORLD"), scoring.ALL_CORRECT],
+                              won=True, game_id="g1")
+        monkeypatch.setattr(scoring, "score", lambda guess, target: 0)
+        seen = []
+
+        report = replay_games([record], on_diff=seen.append, max_diffs=1)
+
+        assert report.feedback_diffs == 2
+        assert report.outcome_diffs == 1
+        assert len(report.diffs) == 1
+        assert [d["kind"] for d in seen] == ["feedback", "feedback", "outcome"]
+
+    def test_replay_does_not_emit_events(self, event_log):
+        """Test that replayed games are silent while live games keep emitting"""
+        sink = RecordingSink()
+        events.set_event_sink(sink)
+        live = create_new_game("WORLD")
+        try:
+            replay_games(read_event_log(event_log), engine="game", batch_size=1,
+                         on_batch=lambda report: make_guess(live, "ABOUT"))
+            replay_games([ReplayRecord("WORLD", ["ABOUT"])], strategy="expected-size")
+            assert events.get_event_sink() is sink
+        finally:
+            events.set_event_sink(None)
+
+        logged = [json.loads(line) for line in sink.lines]
+        assert {event["game_id"] for event in logged} == {live.game_id}
+        assert [event["type"] for event in logged][:2] == ["game_created", "guess_made"]
+
+    def test_strategy_replay(self):
+        """Test re-playing recorded targets with a strategy"""
+        records = [ReplayRecord(word, ["ABOUT"] * 6, won=False) for word in WORD_LIST[:5]]
+        records.append(ReplayRecord("ZZZZZ", ["ZZZZZ"], won=True))
+
+        report = replay_games(records, strategy="expected-size")
+
+        assert report.games == 5
+        assert report.skipped == 1
+        assert report.outcome_diffs == 5
+        assert report.replayed_turns < report.recorded_turns
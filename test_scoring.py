@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Unit tests for QWords pluggable scoring backends
+"""
+
+import pytest
+import sys
+import os
+
+# Add parent directory to path to import app module
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import scoring
+from app import create_new_game, make_guess, validate_guess, WORD_LIST
+from scoring import (
+    available_backends, benchmark_backends, check_equivalence, select_backend,
+    set_backend, get_backend, feedback_pattern, BACKENDS, DUPLICATE_CASES, ReferenceBackend
+)
+
+
+SAMPLE_WORDS = WORD_LIST[:60] + ["EEEEE", "PEPEP", "ABBEY", "LLAMA", "GEESE"]
+
+
+@pytest.fixture(autouse=True)
+def restore_backend(tmp_path, monkeypatch):
+    """Keep cached tables local and reset the active backend afterwards"""
+    monkeypatch.setenv("QWORDS_CACHE_DIR", str(tmp_path))
+    previous = get_backend()
+    yield
+    monkeypatch.setattr(scoring, "_active", previous)
+
+
+class TestBackends:
+    """Test cases for the backend registry and equivalence"""
+
+    def test_reference_and_table_always_available(self):
+        """Test that the pure-Python backends are registered"""
+        assert {"reference", "table"} <= set(available_backends())
+
+    @pytest.mark.parametrize("name", ["reference", "table", "numpy"])
+    def test_backend_matches_reference(self, name):
+        """Test every pair and duplicate-letter case against the reference"""
+        if name not in available_backends():
+            pytest.skip("{} backend not available".format(name))
+        assert check_equivalence(name, SAMPLE_WORDS) == []
+
+    def test_validate_guess_uses_active_backend(self):
+        """Test that validate_guess gives the same feedback on any backend"""
+        expected = [validate_guess(g, t).feedback for g, t in DUPLICATE_CASES]
+        set_backend("table", SAMPLE_WORDS)
+
+        assert get_backend().name == "table"
+        assert [validate_guess(g, t).feedback for g, t in DUPLICATE_CASES] == expected
+        assert validate_guess("world", "ZZZZZ").feedback == ["absent"] * 5
+
+    def test_equivalence_checks_rows_for_duplicate_cases(self, monkeypatch):
+        """Test that a backend whose rows are wrong only for case words fails"""
+        class BrokenRows(ReferenceBackend):
+            name = "broken"
+
+            def score_row(self, guess):
+                row = super().score_row(guess)
+                return [0] * len(row) if guess == "SPEED" else row
+
+        monkeypatch.setitem(scoring.BACKENDS, "broken", BrokenRows)
+        assert ("SPEED", "EEEEE") in check_equivalence("broken", WORD_LIST[:20])
+
+    def test_unknown_backend_rejected(self):
+        """Test that set_backend rejects unregistered names"""
+        with pytest.raises(ValueError):
+            set_backend("quantum", SAMPLE_WORDS)
+
+
+class TestSelection:
+    """Test cases for the startup self-benchmark"""
+
+    def test_benchmark_reports_every_backend(self):
+        """Test that each available backend is timed"""
+        report = benchmark_backends(SAMPLE_WORDS, rows=3, singles=50)
+
+        assert set(report) == set(available_backends())
+        assert all(timing["total"] >= 0 for timing in report.values())
+
+    def test_benchmark_times_game_path(self, monkeypatch):
+        """Test that singles go through score_code and total counts prepare"""
+        for backend_class in BACKENDS.values():
+            monkeypatch.setattr(backend_class, "score", None)  # fails if called
+        report = benchmark_backends(SAMPLE_WORDS, rows=3, singles=50)
+
+        for timing in report.values():
+            parts = timing["prepare"] + timing["rows"] + timing["singles"]
+            assert timing["total"] == pytest.approx(parts)
+
+    def test_select_activates_fastest(self):
+        """Test that selection activates the backend with the lowest total"""
+        fastest, report = select_backend(SAMPLE_WORDS, rows=3, singles=50)
+
+        assert get_backend().name == fastest
+        assert report[fastest]["total"] == min(t["total"] for t in report.values())
+        assert feedback_pattern("WORLD", "WORLD") == get_backend().score("WORLD", "WORLD")
+
+
+class TestFeedbackPattern:
+    """Test cases for the reference algorithm"""
+
+    def test_guess_longer_after_uppercasing(self):
+        """Test that a guess like 'ßabcd' (SSABCD) never scores a sixth position"""
+        assert feedback_pattern("SSABCD", "WORLD") == 0
+        with pytest.raises(ValueError):
+            validate_guess("ßabcd", "WORLD")
+
+    def test_make_guess_does_not_raise(self):
+        """Test that make_guess rejects letters that grow when uppercased"""
+        game = create_new_game("WORLD")
+        assert make_guess(game, "ßabcd") is None
+        assert game.current_guess == 0
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Unit tests for QWords session snapshots and resume
+"""
+
+import pytest
+import sys
+import os
+import struct
+import time
+from unittest.mock import patch
+from io import StringIO
+
+# Add parent directory to path to import app module
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import create_new_game, make_guess, main, play_game, GameState, WORD_LIST
+from snapshot import (
+    snapshot_game, restore_game, snapshot_sessions, restore_sessions,
+    save_sessions, load_sessions
+)
+
+
+def assert_same_game(restored, game):
+    assert restored.target_word == game.target_word
+    assert restored.language == game.language
+    assert restored.game_id == game.game_id
+    assert restored.start_time == game.start_time
+    assert restored.current_guess == game.current_guess
+    assert restored.game_over == game.game_over
+    assert restored.won == game.won
+    assert restored.max_guesses == game.max_guesses
+    assert [(g.word, g.feedback) for g in restored.guesses] == \
+        [(g.word, g.feedback) for g in game.guesses]
+
+
+class TestSnapshot:
+    """Test cases for single and bulk snapshots"""
+
+    def test_in_progress_game_round_trip(self):
+        """Test that an unfinished game restores exactly"""
+        game = create_new_game("SPEED")
+        make_guess(game, "EEEEE")
+        make_guess(game, "PEPEP")
+
+        data = snapshot_game(game)
+        assert len(data) == 25 + 2 * 5
+        assert_same_game(restore_game(data), game)
+
+    def test_finished_and_blank_games(self):
+        """Test won games and games without an id or start time"""
+        won = create_new_game("WORLD")
+        make_guess(won, "WORLD")
+        blank = GameState()
+        blank.target_word = "ABOUT"
+
+        assert_same_game(restore_game(snapshot_game(won)), won)
+        assert_same_game(restore_game(snapshot_game(blank)), blank)
+
+    def test_restored_game_continues(self):
+        """Test that play resumes on a restored game"""
+        game = create_new_game("WORLD")
+        make_guess(game, "ABOUT")
+
+        restored = restore_game(snapshot_game(game))
+        make_guess(restored, "WORLD")
+        assert restored.won
+        assert restored.current_guess == 2
+
+    def test_bulk_sessions_round_trip(self, tmp_path):
+        """Test saving and loading a session table"""
+        sessions = {}
+        for i, word in enumerate(WORD_LIST[:50]):
+            game = create_new_game(word)
+            make_guess(game, WORD_LIST[i + 1])
+            sessions["player-{}".format(i)] = game
+
+        path = str(tmp_path / "sessions.bin")
+        save_sessions(path, sessions)
+        restored = load_sessions(path)
+
+        assert list(restored) == list(sessions)
+        for session_id, game in sessions.items():
+            assert_same_game(restored[session_id], game)
+
+    def test_language_games_round_trip(self):
+        """Test that English and language games share one bulk snapshot"""
+        english = create_new_game("WORLD")
+        make_guess(english, "ABOUT")
+        spanish = create_new_game("SUEÑO", language="es")
+        make_guess(spanish, "NIÑOS")
+        russian = create_new_game("СЛОВО", language="ru")
+        make_guess(russian, "ПОЛЁТ")
+        sessions = {"en": english, "es": spanish, "ru": russian}
+
+        restored = restore_sessions(snapshot_sessions(sessions))
+        for session_id, game in sessions.items():
+            assert_same_game(restored[session_id], game)
+
+    def test_restored_language_game_keeps_its_rules(self):
+        """Test that a restored A-Z Spanish game still accepts Ñ guesses"""
+        game = create_new_game("PERRO", language="es")
+        restored = restore_game(snapshot_game(game))
+
+        assert restored.language == "es"
+        assert make_guess(restored, "ÑANDU").word == "ÑANDU"
+        assert make_guess(restored, "perro").feedback == ["correct"] * 5
+
+    def test_version_1_files_restore(self):
+        """Test that snapshots written before language codes still load"""
+        game = create_new_game("WORLD")
+        make_guess(game, "ABOUT")
+        data = snapshot_sessions({"s": game})
+        record = data[9:]
+        # Drop the two-byte language code from the version 2 game header
+        old = struct.pack("<4sBI", b"QWSS", 1, 1) + record[:2 + 1 + 23] + record[2 + 1 + 25:]
+
+        assert_same_game(restore_sessions(old)["s"], game)
+
+    def test_rejects_foreign_data(self):
+        """Test that non-snapshot bytes raise ValueError"""
+        with pytest.raises(ValueError):
+            restore_sessions(b"NOPE" + bytes(16))
+
+    def test_bulk_snapshot_is_fast(self):
+        """Test that bulk snapshot stays in the microseconds per session"""
+        game = create_new_game("WORLD")
+        make_guess(game, "ABOUT")
+        sessions = {"s{}".format(i): game for i in range(20000)}
+
+        start = time.perf_counter()
+        data = snapshot_sessions(sessions)
+        restore_sessions(data)
+        assert time.perf_counter() - start < 1.0
+
+
+class TestResume:
+    """Test cases for resuming a quit game"""
+
+    @patch('builtins.input', side_effect=['ABOUT', 'quit'])
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_quit_returns_unfinished_game(self, mock_stdout, mock_input):
+        """Test that quitting hands back the in-progress game"""
+        with patch('app.get_random_word', return_value='WORLD'):
+            game = play_game()
+
+        assert game.current_guess == 1
+        assert not game.game_over
+
+    @patch('builtins.input', side_effect=['1', 'ABOUT', 'quit', '5', 'WORLD', '4'])
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_menu_resumes_quit_game(self, mock_stdout, mock_input):
+        """Test that the resume option continues the quit game"""
+        with patch('app.get_random_word', return_value='WORLD'):
+            main()
+
+        output = mock_stdout.getvalue()
+        assert "5. Resume Saved Game" in output
+        assert "Resuming your saved game!" in output
+        assert "You guessed 'WORLD' in 2 tries" in output
+
+    @patch('builtins.input', side_effect=['1', 'ABOUT', 'quit', '1', 'WORLD', '4'])
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_start_new_game_after_quit(self, mock_stdout, mock_input):
+        """Test that Start New Game begins a fresh game even with one saved"""
+        with patch('app.get_random_word', return_value='WORLD'):
+            main()
+
+        output = mock_stdout.getvalue()
+        assert "Resuming your saved game!" not in output
+        assert "You guessed 'WORLD' in 1 tries" in output
+
+    @patch('builtins.input', side_effect=['5', '4'])
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_resume_without_saved_game(self, mock_stdout, mock_input):
+        """Test that option 5 is invalid until a game has been quit"""
+        main()
+
+        output = mock_stdout.getvalue()
+        assert "5. Resume Saved Game" not in output
+        assert "Invalid choice. Please select 1-4." in output
@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+"""
+Startup budget tests for QWords
+"""
+
+import sys
+import os
+
+# Add parent directory to path to import app module
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from startup_bench import STARTUP_BUDGET_MS, eagerly_imported, over_budget
+
+
+class TestStartup:
+    """Test cases guarding fast process startup"""
+
+    def test_heavy_modules_load_lazily(self):
+        """Test that importing app does not pull in tables or writer threads"""
+        assert eagerly_imported() == []
+
+    def test_over_budget_compares_overhead(self):
+        """Test that budgets apply on top of bare interpreter startup"""
+        # Wall-clock timings are reported by `startup_bench.py --check`
+        # rather than asserted here, where a loaded machine would fail them
+        results = {"interpreter": 100.0}
+        for name, budget in STARTUP_BUDGET_MS.items():
+            results[name] = 100.0 + budget
+        assert over_budget(results) == []
+
+        results["first_prompt"] += 1
+        assert over_budget(results) == ["first_prompt"]
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Unit tests for strategy tournaments and the strategies they compare
+"""
+
+import pytest
+import random
+import sys
+import os
+from unittest.mock import Mock
+
+# Add parent directory to path to import app module
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import events
+from app import WORD_LIST
+from feedback_tables import table_for_words
+from headless import play_headless
+from strategies import get_strategy
+from tournament import run_tournament, sign_test, LOSS_GUESSES
+
+
+SAMPLE_WORDS = WORD_LIST[:60]
+
+
+class TestStrategies:
+    """Test cases for the tournament strategies"""
+
+    @pytest.mark.parametrize("name", ["letter-frequency", "entropy", "decision-tree"])
+    def test_strategy_solves_every_target(self, name):
+        """Test that each strategy wins every game on a small list"""
+        table = table_for_words(SAMPLE_WORDS)
+        strategy = get_strategy(name)
+        for target in SAMPLE_WORDS:
+            result = play_headless(target, strategy, table, random.Random(0))
+            assert result.won
+
+    def test_prepared_decision_tree_needs_no_search(self, monkeypatch):
+        """Test that a prepared tree answers every move from the tree"""
+        table = table_for_words(SAMPLE_WORDS)
+        strategy = get_strategy("decision-tree")
+        strategy.prepare(table)
+        monkeypatch.setattr(strategy, "_policy", None)  # fails if consulted
+
+        for target in SAMPLE_WORDS:
+            assert play_headless(target, strategy, table, random.Random(0)).won
+
+
+class TestSignTest:
+    """Test cases for the paired sign test"""
+
+    def test_no_difference(self):
+        """Test that identical scores are all ties"""
+        assert sign_test([3, 4, 5], [3, 4, 5]) == (0, 0, 3, 1.0)
+
+    def test_exact_p_value(self):
+        """Test the exact two-sided binomial tail"""
+        first_better, second_better, ties, p_value = sign_test([3] * 10, [4] * 9 + [2])
+        assert (first_better, second_better, ties) == (9, 1, 0)
+        assert p_value == pytest.approx(2 * 11 / 1024)
+
+    def test_normal_approximation(self):
+        """Test that large samples fall back to the normal approximation"""
+        first = [3] * 1200 + [4] * 800
+        second = [4] * 1200 + [3] * 800
+        assert sign_test(first, second)[3] < 1e-10
+
+
+class TestTournament:
+    """Test cases for running tournaments"""
+
+    def test_inline_and_parallel_agree(self):
+        """Test that seeded games give the same guess counts in parallel"""
+        names = ("random-consistent", "decision-tree")
+        inline = run_tournament(SAMPLE_WORDS, names, processes=1, seed=5)
+        parallel = run_tournament(SAMPLE_WORDS, names, processes=2, seed=5, chunk_size=7)
+
+        for name in names:
+            assert parallel.results[name].turns == inline.results[name].turns
+            assert parallel.results[name].decisions == inline.results[name].decisions
+
+    def test_parallel_setup_runs_only_in_workers(self, monkeypatch):
+        """Test that pooled runs prepare in workers and report their setup time"""
+        import tournament
+
+        parent = os.getpid()
+        original = tournament._prepared_strategy
+
+        def prepared_in_worker(name, table):
+            assert os.getpid() != parent, "strategy prepared in the parent"
+            return original(name, table)
+
+        monkeypatch.setattr(tournament, "_prepared_strategy", prepared_in_worker)
+        result = run_tournament(SAMPLE_WORDS, ("decision-tree",), processes=2, chunk_size=7)
+
+        assert result.results["decision-tree"].wins == len(SAMPLE_WORDS)
+        assert result.results["decision-tree"].setup_seconds > 0
+
+    def test_games_do_not_emit_events(self):
+        """Test that tournament games stay out of the event log"""
+        sink = Mock()
+        events.set_event_sink(sink)
+        try:
+            run_tournament(SAMPLE_WORDS, ("random-consistent",), targets=SAMPLE_WORDS[:3],
+                           processes=1)
+        finally:
+            events.set_event_sink(None)
+        assert not sink.emit.called
+
+    def test_unknown_target_rejected(self):
+        """Test that a target outside the word list raises ValueError"""
+        with pytest.raises(ValueError, match="ZZZZZ"):
+            run_tournament(SAMPLE_WORDS, ("random-consistent",), targets=["zzzzz"], processes=1)
+
+    def test_report_contents(self):
+        """Test latency, ranking and comparison output"""
+        tournament = run_tournament(SAMPLE_WORDS, ("random-consistent", "entropy"),
+                                    targets=SAMPLE_WORDS[:20], processes=1)
+
+        entropy = tournament.results["entropy"]
+        assert len(entropy.turns) == 20
+        assert all(1 <= turns <= LOSS_GUESSES for turns in entropy.turns)
+        assert entropy.decisions == sum(entropy.turns)
+        assert entropy.decision_ms(0.5) > 0
+        assert entropy.to_dict()["p95_decision_ms"] >= entropy.to_dict()["p50_decision_ms"]
+
+        pair, = tournament.comparisons()
+        assert pair["first"] == tournament.ranking()[0].name
+        assert 0.0 <= pair["p_value"] <= 1.0
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Unit tests for versioned, hot-reloadable word lists
+"""
+
+import pytest
+import gc
+import sys
+import os
+import threading
+
+# Add parent directory to path to import app module
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import app
+import feedback_tables
+from app import create_new_game, make_guess, get_random_word, WORD_LIST
+from cache import LoadedCache
+from wordlists import WordListRegistry, WordListSnapshot
+
+
+NEW_WORDS = ["CRANE", "SLATE", "TRACE"]
+
+
+@pytest.fixture
+def registry(tmp_path, monkeypatch):
+    """Swap app's registry for a fresh one using a local cache directory"""
+    monkeypatch.setenv("QWORDS_CACHE_DIR", str(tmp_path))
+    registry = WordListRegistry(WORD_LIST)
+    monkeypatch.setattr(app, "WORD_LISTS", registry)
+    return registry
+
+
+class TestWordListSnapshot:
+    """Test cases for immutable snapshots"""
+
+    def test_snapshot_is_normalized_and_immutable(self):
+        """Test that words are uppercased into a tuple"""
+        snapshot = WordListSnapshot(["crane", "Slate"])
+        assert snapshot.words == ("CRANE", "SLATE")
+        assert "SLATE" in snapshot.word_set
+
+    def test_derived_tables_built_on_demand(self, tmp_path, monkeypatch):
+        """Test that derived data is built once and reused"""
+        monkeypatch.setenv("QWORDS_CACHE_DIR", str(tmp_path))
+        snapshot = WordListSnapshot(NEW_WORDS).build_derived()
+
+        assert len(snapshot.encoded) == 3
+        assert snapshot.table.words == tuple(NEW_WORDS)
+        assert snapshot.encoded is snapshot.encoded
+
+
+class TestLoadedCache:
+    """Test cases for the weakly held per-process caches"""
+
+    class Item:
+        pass
+
+    def test_unused_entries_are_freed(self):
+        """Test that entries beyond the kept few live only while in use"""
+        cache = LoadedCache(keep=1)
+        first, second = self.Item(), self.Item()
+        cache["a"] = first
+        cache["b"] = second
+        del first
+        gc.collect()
+
+        assert cache.get("a") is None
+        assert cache.get("b") is second
+        assert len(cache) == 1
+
+    def test_recent_entries_are_kept(self):
+        """Test that recently used entries survive without other references"""
+        cache = LoadedCache(keep=2)
+        cache["a"] = self.Item()
+        cache["b"] = self.Item()
+        gc.collect()
+        assert cache.get("a") is not None
+
+        cache["c"] = self.Item()  # "a" was used more recently than "b"
+        gc.collect()
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+
+
+class TestHotReload:
+    """Test cases for publishing new word lists"""
+
+    def test_new_games_use_latest_snapshot(self, registry):
+        """Test that games created after a publish draw from the new list"""
+        before = create_new_game()
+        registry.publish(NEW_WORDS, background=False)
+        after = create_new_game()
+
+        assert before.word_list.version == 1
+        assert after.word_list.version == 2
+        assert after.target_word in NEW_WORDS
+        assert get_random_word() in NEW_WORDS
+
+    def test_in_progress_game_keeps_its_snapshot(self, registry):
+        """Test that a running game is unaffected by a reload"""
+        game = create_new_game("WORLD")
+        registry.publish(NEW_WORDS, background=False)
+        make_guess(game, "WORLD")
+
+        assert game.won
+        assert game.word_list.words == tuple(WORD_LIST)
+
+    def test_swap_waits_for_background_build(self, registry, monkeypatch):
+        """Test that the old list stays current until the rebuild finishes"""
+        release = threading.Event()
+        original = WordListSnapshot.build_derived
+
+        def slow_build(snapshot, include_table=True):
+            release.wait(5)
+            return original(snapshot, include_table)
+
+        monkeypatch.setattr(WordListSnapshot, "build_derived", slow_build)
+        snapshot = registry.publish(NEW_WORDS)
+
+        assert registry.current().version == 1
+        assert not snapshot.wait(0.01)
+        release.set()
+        assert snapshot.wait(5)
+        assert registry.current().version == 2
+        assert registry.current()._table is not None
+
+    def test_replaced_versions_can_be_freed(self, registry):
+        """Test that tables of versions nothing uses any more are released"""
+        game = create_new_game()
+        lists = [WORD_LIST[i:i + 3] for i in range(0, 30, 3)]
+        for words in lists:
+            registry.publish(words, background=False)
+        gc.collect()
+
+        loaded = {table.words for table in feedback_tables._loaded_tables.values()}
+        assert tuple(lists[0]) not in loaded
+        assert registry.current().table.words in loaded
+        assert game.word_list.version == 1
+
+    def test_older_build_never_replaces_newer(self, registry, monkeypatch):
+        """Test that publishes finishing out of order keep the newest list"""
+        release_first = threading.Event()
+        original = WordListSnapshot.build_derived
+
+        def build(snapshot, include_table=True):
+            if snapshot.version == 2:
+                release_first.wait(5)
+            return original(snapshot, include_table)
+
+        monkeypatch.setattr(WordListSnapshot, "build_derived", build)
+        first = registry.publish(["SLATE"], include_table=False)
+        second = registry.publish(["TRACE"], include_table=False)
+        second.wait(5)
+        release_first.set()
+        first.wait(5)
+
+        assert registry.current().words == ("TRACE",)
+
+    def test_concurrent_publishes_get_distinct_versions(self, registry):
+        """Test that simultaneous publishes never share a version number"""
+        start = threading.Barrier(8)
+        published = []
+
+        def publish(i):
+            start.wait(5)
+            published.append(registry.publish([WORD_LIST[i]], background=False,
+                                              include_table=False))
+
+        threads = [threading.Thread(target=publish, args=(i,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+
+        versions = sorted(snapshot.version for snapshot in published)
+        assert versions == list(range(2, 10))
+        assert registry.current().version == 9
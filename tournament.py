@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""
+Head-to-head strategy tournaments for QWords
+
+Every strategy plays every target word through the headless game loop,
+with the random generator for a target seeded identically for each
+strategy so they face the same games. Targets are split into chunks and
+played in parallel pool workers attached to one shared feedback table.
+Each decision is timed, and latencies are summarized with a mergeable
+t-digest so workers send back a few centroids rather than every sample.
+
+Strategies are compared pairwise on their per-target guess counts (a
+lost game counts as max_guesses + 1) with a two-sided sign test, so the
+report says both which strategy is stronger and whether the difference
+is significant, next to the time each one needs per decision.
+"""
+
+import argparse
+import math
+import multiprocessing
+import random
+import time
+
+from analytics import TDigest
+from feedback_store import attach_worker_table, load_table, share_table, worker_table
+from headless import play_headless
+from strategies import get_strategy
+
+DEFAULT_STRATEGIES = ("random-consistent", "letter-frequency", "entropy", "decision-tree")
+MAX_GUESSES = 6
+LOSS_GUESSES = MAX_GUESSES + 1
+
+# Sign tests on more non-tied pairs than this use the normal approximation
+EXACT_SIGN_TEST_LIMIT = 1000
+
+# Prepared strategies of each pool worker
+_worker_strategies = {}
+
+
+class TimedStrategy:
+    """Wraps a strategy and times each choose() call"""
+
+    def __init__(self, strategy):
+        self.strategy = strategy
+        self.name = strategy.name
+        self.digest = TDigest()
+        self.decisions = 0
+        self.seconds = 0.0
+
+    def choose(self, table, candidates, history, rng):
+        start = time.perf_counter()
+        guess = self.strategy.choose(table, candidates, history, rng)
+        elapsed = time.perf_counter() - start
+        self.digest.add(elapsed)
+        self.decisions += 1
+        self.seconds += elapsed
+        return guess
+
+
+def _prepared_strategy(name, table):
+    """Instantiate a strategy and run its one-off precomputation"""
+    strategy = get_strategy(name)
+    start = time.perf_counter()
+    prepare = getattr(strategy, "prepare", None)
+    if prepare is not None:
+        prepare(table)
+    return strategy, time.perf_counter() - start
+
+
+def play_targets(table, strategy, targets, seed=0):
+    """
+    Play strategy against each target, returning (turns per target with
+    losses as LOSS_GUESSES, wins, TimedStrategy holding decision latencies)
+    """
+    timed = TimedStrategy(strategy)
+    turns = []
+    wins = 0
+    for target in targets:
+        rng = random.Random("{}:{}".format(seed, target))
+        result = play_headless(target, timed, table, rng, emit_events=False)
+        turns.append(result.turns if result.won else LOSS_GUESSES)
+        wins += result.won
+    return turns, wins, timed
+
+
+def _play_chunk(args):
+    """
+    Pool task: play one strategy against a chunk of targets
+    The strategy is prepared on the worker's first chunk for it, and that
+    chunk reports the setup time (later chunks report 0)
+    """
+    name, start, targets, seed = args
+    table = worker_table()
+    setup_seconds = 0.0
+    if name not in _worker_strategies:
+        _worker_strategies[name], setup_seconds = _prepared_strategy(name, table)
+    turns, wins, timed = play_targets(table, _worker_strategies[name], targets, seed)
+    return (name, start, turns, wins, timed.decisions, timed.seconds, timed.digest.to_dict(),
+            setup_seconds)
+
+
+class StrategyResult:
+    """One strategy's guess counts and decision latencies"""
+
+    def __init__(self, name, targets):
+        self.name = name
+        self.turns = [None] * targets  # Per target, losses as LOSS_GUESSES
+        self.wins = 0
+        self.decisions = 0
+        self.decision_seconds = 0.0
+        self.setup_seconds = 0.0  # Slowest prepare() of any process that ran it
+        self.digest = TDigest()
+
+    @property
+    def mean_guesses(self):
+        return sum(self.turns) / len(self.turns) if self.turns else 0.0
+
+    @property
+    def win_rate(self):
+        return self.wins / len(self.turns) if self.turns else 0.0
+
+    @property
+    def mean_decision_ms(self):
+        return self.decision_seconds * 1000 / self.decisions if self.decisions else 0.0
+
+    def decision_ms(self, q):
+        """Decision latency quantile in milliseconds"""
+        return self.digest.quantile(q) * 1000 if self.decisions else 0.0
+
+    def to_dict(self):
+        return {
+            "name": self.name,
+            "mean_guesses": self.mean_guesses,
+            "win_rate": self.win_rate,
+            "decisions": self.decisions,
+            "mean_decision_ms": self.mean_decision_ms,
+            "p50_decision_ms": self.decision_ms(0.5),
+            "p95_decision_ms": self.decision_ms(0.95),
+            "max_decision_ms": self.decision_ms(1.0),
+            "setup_seconds": self.setup_seconds,
+        }
+
+
+def sign_test(first, second):
+    """
+    Two-sided paired sign test on per-target scores (lower is better)
+    Returns (first better, second better, ties, p-value)
+    """
+    first_better = sum(a < b for a, b in zip(first, second))
+    second_better = sum(a > b for a, b in zip(first, second))
+    ties = len(first) - first_better - second_better
+    n = first_better + second_better
+    if n == 0:
+        return first_better, second_better, ties, 1.0
+
+    smaller = min(first_better, second_better)
+    if n <= EXACT_SIGN_TEST_LIMIT:
+        tail = sum(math.comb(n, k) for k in range(smaller + 1)) / 2 ** n
+        p_value = min(1.0, 2 * tail)
+    else:
+        z = (abs(first_better - second_better) - 1) / math.sqrt(n)
+        p_value = math.erfc(max(z, 0.0) / math.sqrt(2))
+    return first_better, second_better, ties, p_value
+
+
+class TournamentResult:
+    """Per-strategy results of a tournament and pairwise comparisons"""
+
+    def __init__(self, targets, results, seconds):
+        self.targets = targets
+        self.results = results  # Strategy name -> StrategyResult
+        self.seconds = seconds
+
+    def ranking(self):
+        """Strategy results, strongest (fewest mean guesses) first"""
+        return sorted(self.results.values(), key=lambda r: (r.mean_guesses, r.mean_decision_ms))
+
+    def comparisons(self):
+        """Sign test for every pair of strategies, in ranking order"""
+        ranked = self.ranking()
+        pairs = []
+        for i, first in enumerate(ranked):
+            for second in ranked[i + 1:]:
+                better, worse, ties, p_value = sign_test(first.turns, second.turns)
+                pairs.append({
+                    "first": first.name,
+                    "second": second.name,
+                    "first_better": better,
+                    "second_better": worse,
+                    "ties": ties,
+                    "p_value": p_value,
+                })
+        return pairs
+
+
+def run_tournament(words, strategies=DEFAULT_STRATEGIES, targets=None, seed=0,
+                   processes=None, chunk_size=None):
+    """
+    Play every strategy against every target (1 process = inline)
+    Raises ValueError for targets that are not in words
+    """
+    words = [word.upper() for word in words]
+    targets = words if targets is None else [target.upper() for target in targets]
+    known = set(words)
+    unknown = [target for target in targets if target not in known]
+    if unknown:
+        raise ValueError("Targets not in the word list: {}".format(", ".join(unknown)))
+    results = {name: StrategyResult(name, len(targets)) for name in strategies}
+    start = time.perf_counter()
+
+    def collect(name, offset, turns, wins, decisions, seconds, digest, setup_seconds):
+        result = results[name]
+        result.turns[offset:offset + len(turns)] = turns
+        result.wins += wins
+        result.decisions += decisions
+        result.decision_seconds += seconds
+        result.digest.merge(digest)
+        # Workers prepare in parallel, so the slowest one is the setup cost
+        result.setup_seconds = max(result.setup_seconds, setup_seconds)
+
+    if processes == 1:
+        # Setup is timed apart from decision latency
+        table = load_table(words)
+        for name in strategies:
+            strategy, setup_seconds = _prepared_strategy(name, table)
+            turns, wins, timed = play_targets(table, strategy, targets, seed)
+            collect(name, 0, turns, wins, timed.decisions, timed.seconds, timed.digest,
+                    setup_seconds)
+    else:
+        processes = processes or multiprocessing.cpu_count()
+        if chunk_size is None:
+            chunk_size = max(1, len(targets) // (processes * 4))
+        tasks = [(name, i, targets[i:i + chunk_size], seed)
+                 for name in strategies for i in range(0, len(targets), chunk_size)]
+
+        shared = share_table(words)
+        try:
+            with multiprocessing.Pool(processes, attach_worker_table,
+                                      (shared.name if shared else None, words)) as pool:
+                for name, offset, turns, wins, decisions, seconds, digest, setup_seconds in \
+                        pool.imap_unordered(_play_chunk, tasks):
+                    collect(name, offset, turns, wins, decisions, seconds,
+                            TDigest.from_dict(digest), setup_seconds)
+        finally:
+            if shared is not None:
+                shared.close()
+
+    return TournamentResult(targets, results, time.perf_counter() - start)
+
+
+def main(argv=None):
+    from app import WORD_LIST
+
+    parser = argparse.ArgumentParser(description="Compare QWords strategies head to head")
+    parser.add_argument("strategies", nargs="*", default=list(DEFAULT_STRATEGIES))
+    parser.add_argument("--processes", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--limit", type=int, help="Only play the first N target words")
+    parser.add_argument("--alpha", type=float, default=0.05, help="Significance level")
+    args = parser.parse_args(argv)
+
+    targets = WORD_LIST[:args.limit] if args.limit else WORD_LIST
+    tournament = run_tournament(WORD_LIST, args.strategies, targets, args.seed, args.processes)
+
+    print("{} targets, {:.1f}s".format(len(tournament.targets), tournament.seconds))
+    print("{:18} {:>7} {:>6} {:>9} {:>8} {:>8} {:>8}".format(
+        "strategy", "guesses", "wins", "decisions", "mean ms", "p95 ms", "setup s"))
+    for result in tournament.ranking():
+        print("{:18} {:7.3f} {:6.1%} {:9} {:8.3f} {:8.3f} {:8.2f}".format(
+            result.name, result.mean_guesses, result.win_rate, result.decisions,
+            result.mean_decision_ms, result.decision_ms(0.95), result.setup_seconds))
+
+    print()
+    for pair in tournament.comparisons():
+        verdict = "significant" if pair["p_value"] < args.alpha else "not significant"
+        print("{} vs {}: better on {}, worse on {}, tied {}; p={:.3g} ({})".format(
+            pair["first"], pair["second"], pair["first_better"], pair["second_better"],
+            pair["ties"], pair["p_value"], verdict))
+
+
+if __name__ == "__main__":
+    main()
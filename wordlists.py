@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Versioned, hot-reloadable word lists for QWords
+
+A WordListSnapshot is an immutable word list plus lazily built derived
+data (membership set, encoded words, feedback table). A WordListRegistry
+always points at the latest snapshot: new games take the current one and
+keep a reference to it for their whole lifetime, while publish() builds
+the next snapshot's derived tables on a background thread and then swaps
+the pointer in one assignment, so in-progress games are untouched and no
+request ever waits for a rebuild. A snapshot owns its feedback table;
+the per-process table caches only hold it weakly (see cache.LoadedCache),
+so once a replaced version's games have finished its table can be freed.
+"""
+
+import _thread
+import random
+
+
+class WordListSnapshot:
+    """An immutable version of a word list with lazily derived tables"""
+
+    def __init__(self, words, version=1):
+        self.words = tuple(word.upper() for word in words)
+        self.version = version
+        self._list_hash = None
+        self._word_set = None
+        self._encoded = None
+        self._table = None
+        self._builder = None  # Thread building a background publish, if any
+
+    def __len__(self):
+        return len(self.words)
+
+    @property
+    def list_hash(self):
+        """Content hash of the words (keys on-disk caches)"""
+        if self._list_hash is None:
+            from cache import word_list_hash
+            self._list_hash = word_list_hash(self.words)
+        return self._list_hash
+
+    @property
+    def word_set(self):
+        if self._word_set is None:
+            self._word_set = frozenset(self.words)
+        return self._word_set
+
+    @property
+    def encoded(self):
+        """The words as a WordArray of packed integer codes"""
+        if self._encoded is None:
+            from encoding import WordArray
+            self._encoded = WordArray.from_words(self.words)
+        return self._encoded
+
+    @property
+    def table(self):
+        """The guess x answer feedback table for these words"""
+        if self._table is None:
+            from feedback_store import load_table
+            self._table = load_table(self.words)
+        return self._table
+
+    def build_derived(self, include_table=True):
+        """Build every derived structure now rather than on first use"""
+        self.list_hash
+        self.word_set
+        self.encoded
+        if include_table:
+            self.table
+        return self
+
+    def random_word(self, rng=random):
+        return rng.choice(self.words)
+
+    def wait(self, timeout=None):
+        """
+        Wait until a background publish of this snapshot has built its
+        derived data; returns False if it is still building after timeout
+        """
+        builder = self._builder
+        if builder is None:
+            return True
+        builder.join(timeout)
+        return not builder.is_alive()
+
+
+class WordListRegistry:
+    """Holds the current word list snapshot and swaps in new versions"""
+
+    def __init__(self, words):
+        self._current = WordListSnapshot(words, version=1)
+        self._latest_version = 1
+        # Guards version numbering and the swap; _thread is built in, so
+        # this keeps the threading module out of startup
+        self._lock = _thread.allocate_lock()
+
+    def current(self):
+        """Return the latest published snapshot"""
+        return self._current
+
+    def publish(self, words, background=True, include_table=True):
+        """
+        Prepare a new snapshot for words and make it current once its
+        derived tables are built, returning the snapshot. With
+        background=True the build runs on a thread (snapshot.wait() waits
+        for it); otherwise the snapshot is built and swapped in before
+        returning.
+        """
+        with self._lock:
+            self._latest_version += 1
+            snapshot = WordListSnapshot(words, version=self._latest_version)
+
+        def build_and_swap():
+            snapshot.build_derived(include_table)
+            # Never replace a newer snapshot with an older one
+            with self._lock:
+                if snapshot.version > self._current.version:
+                    self._current = snapshot
+
+        if not background:
+            build_and_swap()
+            return snapshot
+
+        import threading
+
+        snapshot._builder = threading.Thread(target=build_and_swap, name="qwords-wordlist-build",
+                                             daemon=True)
+        snapshot._builder.start()
+        return snapshot